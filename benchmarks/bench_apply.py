@@ -0,0 +1,126 @@
+import argparse
+import cProfile
+import logging
+import os
+import pstats
+import tempfile
+import time
+from typing import Optional
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.concurrency import AdaptiveConcurrency
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.ratelimit import ApiCallPolicy
+from snowflake_declarative.testing import FakeRoot
+
+def write_config(path: str, count: int) -> None:
+    """Write ``count`` databases and ``count`` warehouses as a YAML config"""
+    with open(path, 'w') as f:
+        f.write("databases:\n")
+        for i in range(count):
+            f.write(f"  - name: DB_{i}\n    comment: Database {i}\n    data_retention_time_in_days: 1\n")
+        f.write("warehouses:\n")
+        for i in range(count):
+            f.write(f"  - name: WH_{i}\n    size: MEDIUM\n    auto_suspend: 300\n    comment: Warehouse {i}\n")
+
+def build_root(count: int, latency: float, jitter: float, error_rate: float, seed: int,
+               service_limit: Optional[int] = None, max_concurrent: Optional[int] = None,
+               capacity: Optional[int] = None) -> FakeRoot:
+    """A fake account holding 90% of the configured objects, every tenth of them drifted"""
+    root = FakeRoot(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed, rate_limit=service_limit,
+                    max_concurrent=max_concurrent, capacity=capacity)
+    for i in range(count):
+        if i % 10 == 9:
+            continue
+        drifted = i % 10 == 0
+        root.databases.add(f"DB_{i}", comment=f"Database {i}", kind='PERMANENT',
+                           data_retention_time_in_days=7 if drifted else 1)
+        root.warehouses.add(f"WH_{i}", size='Medium', auto_suspend=600 if drifted else 300,
+                            auto_resume='true', comment=f"Warehouse {i}")
+    return root
+
+def run(count: int, engine: str = 'sync', concurrency: int = 1, dry_run: bool = True,
+        latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = 0,
+        profile: bool = False, service_limit: Optional[int] = None, rate_limit: Optional[float] = None,
+        max_attempts: int = 5, max_concurrent: Optional[int] = None, capacity: Optional[int] = None,
+        adaptive: bool = False) -> dict:
+    """Plan (or apply) ``count`` objects per type against a fake root and time it"""
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, 'config.yaml')
+        write_config(config_path, count)
+        root = build_root(count, latency, jitter, error_rate, seed, service_limit, max_concurrent, capacity)
+        limiter = AdaptiveConcurrency(initial=min(4, concurrency), max_limit=concurrency) if adaptive else None
+        policy = ApiCallPolicy(rate_limit=rate_limit, max_attempts=max_attempts, seed=seed, concurrency=limiter)
+        engine_class = AsyncSnowflakeState if engine == 'async' else SnowflakeState
+        state = engine_class(root, api_policy=policy)
+
+        profiler = cProfile.Profile() if profile else None
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        report = state.apply_configuration(config_path, dry_run=dry_run, concurrency=concurrency)
+        if profiler:
+            profiler.disable()
+        elapsed = time.perf_counter() - start
+        root.close()
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+    return {
+        'objects': report.total_objects,
+        'seconds': elapsed,
+        'objects_per_second': report.total_objects / elapsed if elapsed else float('inf'),
+        'api_calls': sum(root.calls.values()),
+        'throttled': root.throttled,
+        'peak_in_flight': root.peak_in_flight,
+        'limit': report.metrics['gauges'].get('concurrency_limit'),
+        'retries': sum(stats['retries'] for operations in report.metrics['api_calls'].values()
+                       for stats in operations.values()),
+        'created': report.objects_created,
+        'updated': report.objects_updated,
+        'errors': report.objects_with_errors,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark apply_configuration against an in-memory Snowflake')
+    parser.add_argument('-n', '--objects', type=int, nargs='+', default=[10, 1000, 50000],
+                        help='Objects per type, one run each (default: 10 1000 50000)')
+    parser.add_argument('--engine', choices=['sync', 'async'], default='sync', help='Planning engine (default: sync)')
+    parser.add_argument('--concurrency', type=int, default=1, help='Engine concurrency (default: 1)')
+    parser.add_argument('--apply', action='store_true', help='Apply changes instead of a dry run')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every API call (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra uniform random latency in seconds (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of API calls that fail (default: 0)')
+    parser.add_argument('--service-limit', type=int,
+                        help='Reject API calls beyond this many per second with a 429 (default: unlimited)')
+    parser.add_argument('--rate-limit', type=float,
+                        help='Client-side API calls per second (default: unlimited)')
+    parser.add_argument('--max-attempts', type=int, default=5,
+                        help='Attempts per API call, including retries (default: 5)')
+    parser.add_argument('--max-concurrent', type=int,
+                        help='Reject API calls made while this many are in flight with a 429 (default: unlimited)')
+    parser.add_argument('--capacity', type=int,
+                        help='Concurrent API calls served without queueing; more add latency (default: unlimited)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Tune the in-flight limit with AIMD, up to --concurrency')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for jitter and errors (default: 0)')
+    parser.add_argument('--profile', action='store_true', help='Print the top cProfile entries for each run')
+    args = parser.parse_args()
+
+    # Per-object log lines would dominate the measurement
+    logging.disable(logging.WARNING)
+    for count in args.objects:
+        results = run(count, args.engine, args.concurrency, not args.apply, args.latency,
+                      args.jitter, args.error_rate, args.seed, args.profile, args.service_limit,
+                      args.rate_limit, args.max_attempts, args.max_concurrent, args.capacity, args.adaptive)
+        print(f"objects: {results['objects']:>7}  time: {results['seconds'] * 1000:9.1f} ms  "
+              f"rate: {results['objects_per_second']:9.0f}/s  api calls: {results['api_calls']}  "
+              f"throttled: {results['throttled']}  retries: {results['retries']}  "
+              f"created: {results['created']}  updated: {results['updated']}  errors: {results['errors']}  "
+              f"peak in flight: {results['peak_in_flight']}")
+        if results['limit']:
+            limit = results['limit']
+            print(f"  concurrency limit: final {limit['value']}  min {limit['min']}  max {limit['max']}  "
+                  f"changes {len(limit['samples']) - 1}")
+
+if __name__ == "__main__":
+    main()
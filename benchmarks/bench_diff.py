@@ -0,0 +1,94 @@
+import argparse
+import time
+from types import SimpleNamespace
+from snowflake_declarative.handlers.database import DatabaseHandler
+from snowflake_declarative.handlers.warehouse import WarehouseHandler
+from snowflake_declarative.models.database import SnowflakeDatabase
+from snowflake_declarative.models.differences import ObjectDifference
+from snowflake_declarative.models.warehouse import SnowflakeWarehouse
+
+def legacy_find_differences(desired, actual, handler):
+    """The generic getattr/strip/upper loop that SnowflakeState used before compiled comparators"""
+    differences = []
+    
+    for field in handler.get_comparable_fields():
+        desired_value = getattr(desired, field)
+        actual_value = getattr(actual, field, None)
+
+        if desired_value is None:
+            continue
+
+        if isinstance(desired_value, str):
+            desired_value = desired_value.strip().upper()
+        if isinstance(actual_value, str):
+            actual_value = actual_value.strip().upper()
+
+        if desired_value != actual_value:
+            differences.append(ObjectDifference(
+                field=field,
+                expected=desired_value,
+                actual=actual_value
+            ))
+
+    return differences
+
+def build_pairs(count: int):
+    """Desired models and SDK-like actual objects, with every tenth object drifted"""
+    databases, warehouses = [], []
+    for i in range(count):
+        drifted = i % 10 == 0
+        databases.append((
+            SnowflakeDatabase(name=f"DB_{i}", comment=f"Database {i}", data_retention_time_in_days=1,
+                              log_level='INFO', default_ddl_collation='UTF8'),
+            SimpleNamespace(name=f"DB_{i}", comment=f"Database {i}", kind='PERMANENT',
+                            data_retention_time_in_days=7 if drifted else 1, log_level='INFO',
+                            default_ddl_collation='UTF8')
+        ))
+        warehouses.append((
+            SnowflakeWarehouse(name=f"WH_{i}", size='MEDIUM', auto_suspend=300, comment=f"Warehouse {i}"),
+            SimpleNamespace(name=f"WH_{i}", size='Medium', auto_suspend=600 if drifted else 300,
+                            auto_resume='true', comment=f"Warehouse {i}")
+        ))
+    return databases, warehouses
+
+def run(count: int, repeat: int = 3) -> dict:
+    """Time the legacy loop against the compiled comparators and return the best runs"""
+    handlers = (DatabaseHandler(None), WarehouseHandler(None))
+    groups = build_pairs(count)
+
+    def legacy():
+        for handler, pairs in zip(handlers, groups):
+            for desired, actual in pairs:
+                legacy_find_differences(desired, actual, handler)
+
+    def compiled():
+        for handler, pairs in zip(handlers, groups):
+            diff = handler.get_comparator().diff
+            for desired, actual in pairs:
+                diff(desired, actual)
+
+    results = {}
+    for name, func in (('legacy', legacy), ('compiled', compiled)):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        results[name] = min(timings)
+    results['speedup'] = results['legacy'] / results['compiled']
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark find_differences implementations')
+    parser.add_argument('-n', '--objects', type=int, default=10000, help='Objects per type (default: 10000)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Timed repetitions (default: 3)')
+    args = parser.parse_args()
+
+    results = run(args.objects, args.repeat)
+    print(f"objects per type: {args.objects}")
+    print(f"legacy loop:      {results['legacy'] * 1000:.1f} ms")
+    print(f"compiled:         {results['compiled'] * 1000:.1f} ms")
+    print(f"speedup:          {results['speedup']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from types import SimpleNamespace
+from snowflake_declarative.handlers.warehouse import WarehouseHandler
+from snowflake_declarative.models.change_report import ChangeRecord, ChangeReport, ChangeStatus
+from snowflake_declarative.models.warehouse import SnowflakeWarehouse
+
+def build_inputs(count: int):
+    """Database names plus desired/actual warehouse pairs where every warehouse differs in auto_suspend"""
+    names = [f"DB_{i}" for i in range(count)]
+    warehouses = [
+        (SnowflakeWarehouse(name=f"WH_{i}", size='MEDIUM', auto_suspend=300, comment=f"Warehouse {i}"),
+         SimpleNamespace(name=f"WH_{i}", size='Medium', auto_suspend=600, auto_resume='true',
+                         comment=f"Warehouse {i}"))
+        for i in range(count)
+    ]
+    return names, warehouses
+
+def fill_report(names, warehouses, comparator) -> ChangeReport:
+    """Populate a report the way the engine does: create an entry, then update it after the diff"""
+    report = ChangeReport()
+    statuses = (ChangeStatus.NO_CHANGE, ChangeStatus.CREATED)
+    for i, name in enumerate(names):
+        report.add_change('database', ChangeRecord(name, 'database', statuses[i % 2]))
+    for desired, actual in warehouses:
+        entry = ChangeRecord(desired.name, 'warehouse', ChangeStatus.NO_CHANGE)
+        entry.status = ChangeStatus.UPDATED
+        entry.differences = comparator.diff(desired, actual)
+        report.add_change('warehouse', entry)
+    return report
+
+def run(count: int) -> dict:
+    """Retained memory, build time and serialization time for a report of ``2 * count`` entries"""
+    comparator = WarehouseHandler(None).get_comparator()
+    names, warehouses = build_inputs(count)
+
+    gc.collect()
+    tracemalloc.start()
+    report = fill_report(names, warehouses, comparator)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del report
+    gc.collect()
+    start = time.perf_counter()
+    report = fill_report(names, warehouses, comparator)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = report.to_dict()
+    to_dict = time.perf_counter() - start
+
+    start = time.perf_counter()
+    json.dumps(data, default=str)
+    dumps = time.perf_counter() - start
+    return {'retained_mb': retained / 1e6, 'build': build, 'to_dict': to_dict, 'json': dumps}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ChangeReport memory and serialization')
+    parser.add_argument('-n', '--objects', type=int, default=50000, help='Objects per type (default: 50000)')
+    args = parser.parse_args()
+
+    results = run(args.objects)
+    print(f"entries:       {args.objects * 2}")
+    print(f"retained:      {results['retained_mb']:.1f} MB")
+    print(f"build:         {results['build'] * 1000:.1f} ms")
+    print(f"to_dict:       {results['to_dict'] * 1000:.1f} ms")
+    print(f"json.dumps:    {results['json'] * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
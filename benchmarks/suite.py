@@ -0,0 +1,256 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+from snowflake_declarative.handlers.database import DatabaseHandler
+from snowflake_declarative.handlers.warehouse import WarehouseHandler
+from snowflake_declarative.models.change_report import ChangeRecord, ChangeReport, ChangeStatus
+from snowflake_declarative.models.differences import DifferenceRecord
+from snowflake_declarative.state.manager import SnowflakeState
+from benchmarks.bench_apply import build_root, write_config
+from benchmarks.bench_diff import build_pairs
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(REPO_ROOT, 'scripts')
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'baselines', 'default.json')
+DEFAULT_SIZES = [100, 1000, 10000]
+
+# Benchmark name -> setup(size, workdir) returning the zero-argument callable to time
+BENCHMARKS: Dict[str, Callable[[int, str], Optional[Callable[[], None]]]] = {}
+
+def benchmark(name: str):
+    """Register a benchmark setup function under ``name``"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def load_script(name: str):
+    """Import a module from ``scripts/``, which is not a package"""
+    # The scripts import their shared renderer as a top-level module
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    path = os.path.join(SCRIPTS_DIR, f"{name}.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def build_report(size: int) -> ChangeReport:
+    """A report with ``size`` databases and ``size`` warehouses, every warehouse drifted"""
+    report = ChangeReport()
+    for i in range(size):
+        status = (ChangeStatus.NO_CHANGE, ChangeStatus.CREATED, ChangeStatus.UPDATED)[i % 3]
+        report.add_change('database', ChangeRecord(f"DB_{i}", 'database', status))
+        report.add_change('warehouse', ChangeRecord(
+            f"WH_{i}", 'warehouse', ChangeStatus.UPDATED, [DifferenceRecord('auto_suspend', 300, 600)]
+        ))
+    return report
+
+@benchmark('load_yaml_config')
+def bench_load_yaml_config(size: int, workdir: str):
+    path = os.path.join(workdir, 'config.yaml')
+    write_config(path, size)
+    state = SnowflakeState(None)
+    return lambda: state.load_yaml_config(path)
+
+@benchmark('find_differences')
+def bench_find_differences(size: int, workdir: str):
+    state = SnowflakeState(None)
+    groups = list(zip((DatabaseHandler(None), WarehouseHandler(None)), build_pairs(size)))
+
+    def run():
+        for handler, pairs in groups:
+            for desired, actual in pairs:
+                state.find_differences(desired, actual, handler)
+    return run
+
+@benchmark('change_report')
+def bench_change_report(size: int, workdir: str):
+    entries = [
+        (obj_type, ChangeRecord(f"{obj_type}_{i}", obj_type, ChangeStatus.UPDATED,
+                                [DifferenceRecord('comment', 'a', 'b')]))
+        for i in range(size) for obj_type in ('database', 'warehouse')
+    ]
+
+    def run():
+        report = ChangeReport()
+        for obj_type, entry in entries:
+            report.add_change(obj_type, entry)
+        report.to_dict()
+    return run
+
+def _render_benchmark(script: str, function: str, *outputs: str, requires: Optional[str] = None):
+    def setup(size: int, workdir: str):
+        if requires and importlib.util.find_spec(requires) is None:
+            return None
+        render = getattr(load_script(script), function)
+        changes = os.path.join(workdir, 'changes.json')
+        with open(changes, 'w') as f:
+            json.dump(build_report(size).to_dict(), f)
+        args = [changes] + [os.path.join(workdir, output) for output in outputs]
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                render(*args)
+        return run
+    return setup
+
+benchmark('render_markdown')(_render_benchmark('change_report_markdown_generator', 'generate_markdown_report', 'report.md'))
+benchmark('render_html')(_render_benchmark('change_report_html_generator', 'generate_html_report', 'report.html'))
+benchmark('render_rich')(_render_benchmark('change_report_visualizer', 'visualize_changes', requires='rich'))
+
+@benchmark('render_all')
+def bench_render_all(size: int, workdir: str):
+    if importlib.util.find_spec('rich') is None:
+        return None
+    stream = load_script('change_report_stream')
+    changes = os.path.join(workdir, 'changes.json')
+    with open(changes, 'w') as f:
+        json.dump(build_report(size).to_dict(), f)
+    argv = [changes, '--markdown', os.path.join(workdir, 'report.md'),
+            '--html', os.path.join(workdir, 'report.html'), '--terminal']
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            stream.main(argv)
+    return run
+
+@benchmark('apply_dry_run')
+def bench_apply_dry_run(size: int, workdir: str):
+    path = os.path.join(workdir, 'config.yaml')
+    write_config(path, size)
+
+    def run():
+        SnowflakeState(build_root(size, 0.0, 0.0, 0.0, 0)).apply_configuration(path, dry_run=True)
+    return run
+
+def calibrate(repeat: int = 5) -> float:
+    """Time a fixed pure-Python workload so results can be compared across machines"""
+    def workload():
+        total = 0
+        for i in range(200000):
+            total += len(str(i))
+        return sorted({str(i): i for i in range(50000)})
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run_suite(sizes: List[int], names: Optional[List[str]] = None, repeat: int = 3) -> dict:
+    """Run the selected benchmarks at each size and return the best time of ``repeat`` runs"""
+    results: Dict[str, Dict[str, dict]] = {}
+    for name in names or list(BENCHMARKS):
+        setup = BENCHMARKS[name]
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as workdir:
+                func = setup(size, workdir)
+                if func is None:
+                    print(f"skipping {name}: optional dependency not installed", file=sys.stderr)
+                    break
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    func()
+                    timings.append(time.perf_counter() - start)
+            results.setdefault(name, {})[str(size)] = {'seconds': min(timings)}
+    return {
+        'version': 1,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'calibration_seconds': calibrate(),
+        'results': results,
+    }
+
+def compare_results(current: dict, baseline: dict, tolerance: float = 0.25,
+                    noise_floor: float = 0.005) -> List[dict]:
+    """Compare a run against a baseline, scaling the baseline by the machines' calibration ratio.
+
+    A case regresses when it is more than ``tolerance`` slower than expected
+    and by more than ``noise_floor`` seconds. Cases missing from either side
+    are ignored.
+    """
+    scale = current['calibration_seconds'] / baseline['calibration_seconds']
+    rows = []
+    for name, sizes in current['results'].items():
+        for size, result in sizes.items():
+            reference = baseline['results'].get(name, {}).get(size)
+            if reference is None:
+                continue
+            expected = reference['seconds'] * scale
+            ratio = result['seconds'] / expected if expected else float('inf')
+            rows.append({
+                'name': name,
+                'size': int(size),
+                'seconds': result['seconds'],
+                'expected': expected,
+                'ratio': ratio,
+                'regressed': ratio > 1 + tolerance and result['seconds'] - expected > noise_floor,
+            })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite and compare it against a baseline')
+    parser.add_argument('-n', '--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"Objects per type, one run each (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('-b', '--benchmark', action='append', choices=sorted(BENCHMARKS),
+                        help='Run only this benchmark (repeatable; default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Timed repetitions per case (default: 3)')
+    parser.add_argument('-o', '--output', help='Write results as JSON to this file')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='Baseline JSON to compare against (default: benchmarks/baselines/default.json)')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown before a case fails, as a fraction (default: 0.25)')
+    parser.add_argument('--noise-floor', type=float, default=0.005,
+                        help='Ignore slowdowns smaller than this many seconds (default: 0.005)')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results to the baseline file')
+    args = parser.parse_args()
+
+    # Per-object log lines would dominate the measurement
+    logging.disable(logging.WARNING)
+    current = run_suite(args.sizes, args.benchmark, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        for name, sizes in current['results'].items():
+            for size, result in sizes.items():
+                print(f"{name:<18} {size:>7}  {result['seconds'] * 1000:10.2f} ms")
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare_results(current, baseline, args.tolerance, args.noise_floor)
+    print(f"{'benchmark':<18} {'size':>7} {'time':>12} {'expected':>12} {'ratio':>7}")
+    for row in rows:
+        flag = '  REGRESSION' if row['regressed'] else ''
+        print(f"{row['name']:<18} {row['size']:>7} {row['seconds'] * 1000:10.2f}ms "
+              f"{row['expected'] * 1000:10.2f}ms {row['ratio']:6.2f}x{flag}")
+
+    regressions = [row for row in rows if row['regressed']]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
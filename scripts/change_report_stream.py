@@ -0,0 +1,438 @@
+import argparse
+from abc import ABC, abstractmethod
+import html
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime
+
+CHUNK_SIZE = 1 << 16
+
+# Rows are kept in memory up to this size per section, then spill to disk
+SPOOL_SIZE = 1 << 20
+
+STATUS_TOTALS = {
+    'CREATED': 'objects_created',
+    'UPDATED': 'objects_updated',
+    'NO_CHANGE': 'objects_no_change',
+    'ERROR': 'objects_with_errors',
+}
+
+SECTION_ICONS = {'database': '💾', 'warehouse': '🏭'}
+
+class _JsonScanner:
+    """Walk a JSON document from a file, decoding one value at a time from a bounded buffer"""
+
+    _WHITESPACE = re.compile(r'[ \t\r\n]*')
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or '' at the end of the file"""
+        while True:
+            self.pos = self._WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in change report, found {self.peek()!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next value, reading more of the file until it is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def members(self):
+        """Yield the keys of an object; the caller consumes each value"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect('}')
+                return
+
+    def items(self):
+        """Yield the values of an array one by one"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+def _read_document(f):
+    scanner = _JsonScanner(f)
+    summary = {}
+    for key in scanner.members():
+        if key == 'changes' and scanner.peek() == '{':
+            for obj_type in scanner.members():
+                if scanner.peek() == '[':
+                    for entry in scanner.items():
+                        yield 'change', obj_type, entry
+                else:
+                    scanner.value()  # a null or malformed section has no entries
+        else:
+            summary[key] = scanner.value()
+    yield 'summary', None, summary
+
+def _read_lines(f):
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # The writer was interrupted mid-line
+            if not line.endswith('\n'):
+                return
+            raise
+        if record.pop('record', 'change') == 'summary':
+            yield 'summary', None, record
+        else:
+            yield 'change', record.get('type'), record
+
+def read_report(changes_file):
+    """Yield ``(kind, obj_type, payload)`` events from a change report without loading it whole.
+
+    Reads both the ``--output`` JSON document and the ``--stream-output``
+    JSON Lines format. ``kind`` is ``'change'`` for each entry and
+    ``'summary'`` for the report totals, which may come last.
+    """
+    with open(changes_file, 'r') as f:
+        # Stream records always lead with their "record" key
+        head = f.read(64).lstrip()
+        f.seek(0)
+        if head.startswith('{"record"'):
+            yield from _read_lines(f)
+        elif head:
+            yield from _read_document(f)
+
+def _differences(entry):
+    differences = entry.get('differences')
+    if not differences:
+        return ()
+    return [diff for diff in differences if isinstance(diff, dict)]
+
+def _section_title(obj_type):
+    return f"{obj_type.replace('_', ' ').title()} Changes"
+
+class SpooledRenderer(ABC):
+    """Base renderer that spools each object type's rows and assembles the output at the end.
+
+    Subclasses format one entry in ``row`` and write the document, copying
+    in each section with ``copy_section``, in ``finish``. Sections keep the
+    order in which their first entry was seen.
+    """
+
+    def __init__(self):
+        self.sections = {}
+
+    def add(self, obj_type, entry):
+        spool = self.sections.get(obj_type)
+        if spool is None:
+            spool = self.sections[obj_type] = tempfile.SpooledTemporaryFile(SPOOL_SIZE, mode='w+')
+        spool.write(self.row(obj_type, entry))
+
+    @abstractmethod
+    def row(self, obj_type, entry):
+        pass
+
+    @abstractmethod
+    def finish(self, totals, summary):
+        pass
+
+    def copy_section(self, obj_type, out):
+        spool = self.sections[obj_type]
+        spool.seek(0)
+        shutil.copyfileobj(spool, out)
+        spool.close()
+
+class MarkdownRenderer(SpooledRenderer):
+    """GitHub-flavored Markdown report"""
+
+    def __init__(self, output_file='change_report.md'):
+        super().__init__()
+        self.output_file = output_file
+
+    @staticmethod
+    def cell(value):
+        return str(value).replace('|', '\\|').replace('\n', ' ')
+
+    def row(self, obj_type, entry):
+        details = [f"`{self.cell(diff.get('field'))}`: {self.cell(diff.get('actual'))} → {self.cell(diff.get('expected'))}"
+                   for diff in _differences(entry)]
+        if entry.get('error'):
+            details.append(self.cell(entry['error']))
+        return f"| {self.cell(entry.get('name'))} | {self.cell(entry.get('status'))} | {'<br>'.join(details)} |\n"
+
+    def finish(self, totals, summary):
+        with open(self.output_file, 'w') as f:
+            f.write("# 🔄 Snowflake Configuration Change Report\n\n"
+                    "## 📊 Summary Statistics\n"
+                    "| Metric | Count |\n"
+                    "|--------|-------|\n"
+                    f"| Total Objects | {totals['total_objects']} |\n"
+                    f"| Objects Created | {totals['objects_created']} |\n"
+                    f"| Objects Updated | {totals['objects_updated']} |\n"
+                    f"| Objects with No Changes | {totals['objects_no_change']} |\n"
+                    f"| Objects with Errors | {totals['objects_with_errors']} |\n\n"
+                    "## 📝 Detailed Changes\n")
+            if not self.sections:
+                f.write("\n_No objects in this report._\n")
+            for obj_type in self.sections:
+                f.write(f"\n### {SECTION_ICONS.get(obj_type, '📦')} {_section_title(obj_type)}\n"
+                        "| Name | Status | Details |\n"
+                        "|------|--------|---------|\n")
+                self.copy_section(obj_type, f)
+            f.write("\n## 🕒 Report Generated\n"
+                    f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                    "## 📋 Workflow Context\n"
+                    f"- **Workflow Run:** {os.environ.get('GITHUB_WORKFLOW', 'Unknown Workflow')}\n"
+                    f"- **Repository:** {os.environ.get('GITHUB_REPOSITORY', 'Unknown Repository')}\n"
+                    f"- **Ref:** {os.environ.get('GITHUB_REF', 'Unknown Ref')}\n"
+                    f"- **Commit SHA:** {os.environ.get('GITHUB_SHA', 'Unknown Commit')}\n")
+        print(f"Markdown report generated: {os.path.abspath(self.output_file)}")
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Snow-Maker Change Report</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>
+        body { font-family: Arial, sans-serif; max-width: 1200px; margin: 0 auto; padding: 20px; }
+        .summary { display: flex; justify-content: space-around; margin-bottom: 30px; }
+        .changes { margin-top: 20px; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <h1>Snow-Maker Change Report</h1>
+"""
+
+class HtmlRenderer(SpooledRenderer):
+    """Standalone HTML report with a status chart"""
+
+    def __init__(self, output_file='change_report.html'):
+        super().__init__()
+        self.output_file = output_file
+
+    def row(self, obj_type, entry):
+        details = [f"<code>{html.escape(str(diff.get('field')))}</code>: {html.escape(str(diff.get('actual')))} "
+                   f"&rarr; {html.escape(str(diff.get('expected')))}" for diff in _differences(entry)]
+        if entry.get('error'):
+            details.append(html.escape(str(entry['error'])))
+        return (f"<tr><td>{html.escape(str(entry.get('name')))}</td><td>{html.escape(str(entry.get('status')))}</td>"
+                f"<td>{'<br>'.join(details)}</td></tr>\n")
+
+    def finish(self, totals, summary):
+        with open(self.output_file, 'w') as f:
+            f.write(HTML_HEAD)
+            f.write(f"""
+    <div class="summary">
+        <div>
+            <h2>Object Status</h2>
+            <canvas id="statusChart"></canvas>
+        </div>
+        <div>
+            <h2>Summary Statistics</h2>
+            <ul>
+                <li>Total Objects: {totals['total_objects']}</li>
+                <li>Objects Created: {totals['objects_created']}</li>
+                <li>Objects Updated: {totals['objects_updated']}</li>
+                <li>Objects with No Changes: {totals['objects_no_change']}</li>
+                <li>Objects with Errors: {totals['objects_with_errors']}</li>
+            </ul>
+        </div>
+    </div>
+
+    <div class="changes">
+        <h2>Detailed Changes</h2>
+""")
+            for obj_type in self.sections:
+                f.write(f'        <div id="{html.escape(obj_type)}Changes">\n'
+                        f"            <h3>{html.escape(_section_title(obj_type))}</h3>\n"
+                        "            <table>\n"
+                        "                <tr><th>Name</th><th>Status</th><th>Details</th></tr>\n")
+                self.copy_section(obj_type, f)
+                f.write("            </table>\n        </div>\n")
+            f.write(f"""    </div>
+
+    <script>
+        const ctx = document.getElementById('statusChart').getContext('2d');
+        new Chart(ctx, {{
+            type: 'pie',
+            data: {{
+                labels: ['Created', 'Updated', 'No Change', 'Errors'],
+                datasets: [{{
+                    data: [{totals['objects_created']}, {totals['objects_updated']}, {totals['objects_no_change']}, {totals['objects_with_errors']}],
+                    backgroundColor: ['green', 'orange', 'gray', 'red']
+                }}]
+            }}
+        }});
+    </script>
+</body>
+</html>
+""")
+        print(f"HTML report generated: {os.path.abspath(self.output_file)}")
+
+class TerminalRenderer(SpooledRenderer):
+    """Rich terminal view printed as aligned, styled rows in chunks.
+
+    Rich tables lay out every row at once, which is slow and holds the
+    whole table in memory; column widths are instead tracked while rows
+    are spooled, so each chunk is printed with the same alignment.
+    """
+
+    STATUS_STYLES = {'CREATED': 'green', 'UPDATED': 'yellow', 'NO_CHANGE': 'dim', 'ERROR': 'bold red'}
+    CHUNK_ROWS = 1000
+
+    def __init__(self, console=None):
+        super().__init__()
+        # Imported here so the file renderers work without rich installed
+        from rich.console import Console
+        self.console = console or Console()
+        self.widths = {}
+
+    def row(self, obj_type, entry):
+        details = [f"{diff.get('field')}: {diff.get('actual')} → {diff.get('expected')}" for diff in _differences(entry)]
+        if entry.get('error'):
+            details.append(str(entry['error']))
+        cells = [str(entry.get('name')), str(entry.get('status')), details]
+        widths = self.widths.setdefault(obj_type, [len('Name'), len('Status')])
+        widths[0] = max(widths[0], len(cells[0]))
+        widths[1] = max(widths[1], len(cells[1]))
+        return json.dumps(cells) + "\n"
+
+    def _print_section(self, obj_type, spool):
+        from rich.segment import Segment, Segments
+        from rich.style import Style
+        from rich.text import Text
+        name_width, status_width = self.widths[obj_type]
+        indent = ' ' * (name_width + status_width + 6)
+        self.console.print()
+        self.console.print(Text(_section_title(obj_type), style='bold italic'))
+        header = f"  {'Name'.ljust(name_width)}  {'Status'.ljust(status_width)}  Details"
+        self.console.print(Text(header, style='bold'), no_wrap=True, overflow='ellipsis')
+        self.console.print(Text('─' * len(header)), no_wrap=True, overflow='crop')
+
+        # Pre-styled segments skip rich's layout pass, which dominates on long reports
+        name_style = Style.parse('cyan')
+        status_styles = {status: Style.parse(style) for status, style in self.STATUS_STYLES.items()}
+        default_style = Style.parse('white')
+        spool.seek(0)
+        chunk = []
+        for line in spool:
+            name, status, details = json.loads(line)
+            chunk.append(Segment(f"  {name.ljust(name_width)}  ", name_style))
+            chunk.append(Segment(status.ljust(status_width), status_styles.get(status, default_style)))
+            chunk.append(Segment(f"  {details[0] if details else ''}\n"))
+            for detail in details[1:]:
+                chunk.append(Segment(f"{indent}{detail}\n"))
+            if len(chunk) >= 3 * self.CHUNK_ROWS:
+                self.console.print(Segments(chunk), end='')
+                chunk = []
+        if chunk:
+            self.console.print(Segments(chunk), end='')
+        spool.close()
+
+    def finish(self, totals, summary):
+        from rich.panel import Panel
+        self.console.print(Panel(
+            f"Total Objects: {totals['total_objects']}\n"
+            f"Objects Created: {totals['objects_created']}\n"
+            f"Objects Updated: {totals['objects_updated']}\n"
+            f"Objects with No Changes: {totals['objects_no_change']}\n"
+            f"Objects with Errors: {totals['objects_with_errors']}",
+            title="Change Report Summary",
+            border_style="bold blue"
+        ))
+        for obj_type, spool in self.sections.items():
+            self._print_section(obj_type, spool)
+
+def render_report(changes_file, renderers):
+    """Read a change report once and feed every entry to each renderer.
+
+    Totals are counted from the entries rendered, so a report without a
+    summary (or with missing sections) still renders consistently.
+    Returns the totals.
+    """
+    totals = dict.fromkeys(['total_objects', *STATUS_TOTALS.values()], 0)
+    summary = {}
+    for kind, obj_type, payload in read_report(changes_file):
+        if kind == 'summary':
+            summary = payload
+            continue
+        obj_type = obj_type or payload.get('type') or 'object'
+        totals['total_objects'] += 1
+        key = STATUS_TOTALS.get(payload.get('status'))
+        if key:
+            totals[key] += 1
+        for renderer in renderers:
+            renderer.add(obj_type, payload)
+    for renderer in renderers:
+        renderer.finish(totals, summary)
+    return totals
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render a change report as Markdown, HTML and/or a terminal view in one pass')
+    parser.add_argument('changes_file', nargs='?', default='changes.json',
+                        help='Change report JSON or JSON Lines stream (default: changes.json)')
+    parser.add_argument('--markdown', help='Write a Markdown report to this file')
+    parser.add_argument('--html', help='Write an HTML report to this file')
+    parser.add_argument('--terminal', action='store_true', help='Print the report to the terminal')
+    args = parser.parse_args(argv)
+
+    renderers = []
+    if args.markdown:
+        renderers.append(MarkdownRenderer(args.markdown))
+    if args.html:
+        renderers.append(HtmlRenderer(args.html))
+    if args.terminal or not renderers:
+        renderers.append(TerminalRenderer())
+    render_report(args.changes_file, renderers)
+
+if __name__ == "__main__":
+    main()
@@ -15,16 +15,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Dynamically import Snowflake package
-try:
-    from snowflake.core import Root
-    from snowflake.snowpark import Session
-except ImportError:
-    logger.error("Error: Please install the Snowflake package using 'pip install snowflake'")
-    raise
+# The Snowflake SDK and the declarative engine are imported where they are
+# used, so --help and offline validation start without loading them
 
-# Import Snowflake Declarative components
-from snowflake_declarative import SnowflakeState
+def import_snowflake_sdk():
+    """Import the Snowflake SDK classes, explaining how to install them if missing"""
+    try:
+        from snowflake.core import Root
+        from snowflake.snowpark import Session
+    except ImportError:
+        logger.error("Error: Please install the Snowflake package using 'pip install snowflake'")
+        raise
+    return Root, Session
 
 def load_env_config(env='dev'):
     """Load environment-specific configuration"""
@@ -61,8 +63,14 @@ def get_connection_parameters(env='dev'):
     return connection_parameters
 
 def create_snowflake_session(env='dev'):
-    """Create a Snowflake session using connection parameters"""
+    """Create a Snowflake session using connection parameters
+
+    One session is enough for a run: every worker of the apply engine
+    shares its Root and connection, so a session pool would never lend out
+    a second one.
+    """
     try:
+        _, Session = import_snowflake_sdk()
         connection_parameters = get_connection_parameters(env)
         session = Session.builder.configs(connection_parameters).create()
         
@@ -76,6 +84,7 @@ def create_snowflake_session(env='dev'):
 def get_snowflake_root(session):
     """Create the root resource for Snowflake API interactions"""
     try:
+        Root, _ = import_snowflake_sdk()
         root = Root(session)
         logger.info("Successfully created Snowflake Root resource")
         return root
@@ -84,44 +93,204 @@ def get_snowflake_root(session):
         logger.error(f"Error creating Snowflake Root resource: {e}")
         raise
 
-def parse_arguments():
+def create_state_cache(env='dev', path='.snow-maker/remote_state.db', ttl=300, refresh=False):
+    """Open the remote-state cache for the environment's account and role"""
+    if ttl <= 0:
+        return None
+    from snowflake_declarative.state.cache import RemoteStateCache
+    connection_parameters = get_connection_parameters(env)
+    return RemoteStateCache(
+        path,
+        account=connection_parameters['account'],
+        role=connection_parameters.get('role'),
+        ttl=ttl,
+        refresh=refresh
+    )
+
+def parse_arguments(argv=None):
     """Parse command-line arguments"""
     parser = argparse.ArgumentParser(description='Snowflake Connection Script')
+    subparsers = parser.add_subparsers(dest='command', metavar='{validate}')
+    
+    # Config options may also follow the subcommand; SUPPRESS keeps the
+    # top-level values unless they are given again
+    validate_parser = subparsers.add_parser(
+        'validate',
+        help='Check configuration files offline, without connecting to Snowflake'
+    )
+    validate_parser.add_argument('-c', '--config', 
+                                 default=argparse.SUPPRESS, 
+                                 help='Path to a configuration file, a directory of YAML files or a glob')
+    validate_parser.add_argument('--parse-workers', 
+                                 type=int, 
+                                 default=argparse.SUPPRESS, 
+                                 help='Processes used to parse a config directory (default: CPU count)')
+    
     parser.add_argument('-e', '--env', 
                         choices=['dev', 'tst', 'prd'], 
                         default='dev', 
                         help='Environment to connect to (default: dev)')
     parser.add_argument('-c', '--config', 
                         default='config/base_config.yaml', 
-                        help='Path to configuration file')
+                        help='Path to a configuration file, a directory of YAML files or a glob')
+    parser.add_argument('--parse-workers', 
+                        type=int, 
+                        help='Processes used to parse a config directory (default: CPU count)')
+    parser.add_argument('--parsed-cache-dir', 
+                        default='.snow-maker/parsed', 
+                        help='Cache of validated config files keyed by content hash (default: .snow-maker/parsed)')
     parser.add_argument('--dry-run', 
                         action='store_true', 
                         help='Perform a dry run without making changes')
     parser.add_argument('--output', 
                         help='Export change report to a JSON file')
+    parser.add_argument('--stream-output', 
+                        help='Append each change entry to a JSON Lines file as soon as it is decided (can be tailed)')
+    parser.add_argument('--metrics-output', 
+                        help='Write phase timings and API latencies as an OpenMetrics text file '
+                             '(e.g. for a node exporter textfile collector)')
+    parser.add_argument('--trace-output', 
+                        help='Write a span for every load, fetch, diff and create to this file')
+    parser.add_argument('--trace-format', 
+                        choices=['jsonl', 'chrome'], 
+                        help='Trace file format (default: chrome for .json files, jsonl otherwise)')
+    parser.add_argument('--concurrency', 
+                        type=int, 
+                        default=1, 
+                        help='Number of objects to plan/apply in parallel (default: 1)')
+    parser.add_argument('--adaptive-concurrency', 
+                        action='store_true', 
+                        help='Tune the number of in-flight API calls from observed latency and throttling, '
+                             'up to --concurrency')
+    parser.add_argument('--async', 
+                        dest='use_async', 
+                        action='store_true', 
+                        help='Use the asyncio engine; --concurrency then bounds in-flight API calls')
+    parser.add_argument('--cache-path', 
+                        default='.snow-maker/remote_state.db', 
+                        help='Path of the local remote-state cache (default: .snow-maker/remote_state.db)')
+    parser.add_argument('--cache-ttl', 
+                        type=float, 
+                        default=300, 
+                        help='Seconds a cached remote inventory stays valid; 0 disables the cache (default: 300)')
+    parser.add_argument('--refresh', 
+                        action='store_true', 
+                        help='Ignore the remote-state cache and re-read Snowflake')
+    parser.add_argument('--ddl-batch-size', 
+                        type=int, 
+                        default=0, 
+                        help='Submit creates and alters as multi-statement SQL batches of this size; '
+                             'not supported with --async (default: 0, one API call per object)')
+    parser.add_argument('--rate-limit', 
+                        type=float, 
+                        help='Maximum Snowflake API calls per second across all workers (default: unlimited)')
+    parser.add_argument('--burst', 
+                        type=float, 
+                        default=1, 
+                        help='API calls allowed back-to-back before --rate-limit applies (default: 1)')
+    parser.add_argument('--max-attempts', 
+                        type=int, 
+                        default=5, 
+                        help='Attempts per API call when it is throttled or Snowflake is briefly unavailable '
+                             '(default: 5)')
+    parser.add_argument('--retry-budget', 
+                        type=float, 
+                        default=0.1, 
+                        help='Retries allowed per run as a fraction of API calls, on top of 10 (default: 0.1)')
+    parser.add_argument('--changed-only', 
+                        action='store_true', 
+                        help='Only plan objects whose config changed or whose remote state drifted')
+    
+    args = parser.parse_args(argv)
+    # The asyncio engine issues one API call per object and has no DDL batching
+    if args.use_async and args.ddl_batch_size:
+        parser.error('--ddl-batch-size cannot be combined with --async')
+    return args
+
+def validate_configuration(config_path, parse_workers=None):
+    """Validate a configuration offline and log the objects it declares"""
+    from snowflake_declarative.state.manager import SnowflakeState
+    
+    # No root is needed: validation only parses and checks the config
+    state_manager = SnowflakeState(None, parse_workers=parse_workers)
+    try:
+        counts = state_manager.validate_configuration(config_path)
+    except Exception as e:
+        logger.error(f"Configuration {config_path} is invalid: {e}")
+        return False
     
-    return parser.parse_args()
+    summary = ', '.join(f"{count} {obj_type}(s)" for obj_type, count in counts.items()) or 'no objects'
+    logger.info(f"Configuration {config_path} is valid: {summary}")
+    return True
 
 def main():
+    # Opened below; closed in the finally block even if the run fails part-way
+    report_sink = tracer = cache = session = None
     try:
         # Parse command-line arguments
         args = parse_arguments()
         
+        # Offline validation never touches Snowflake
+        if args.command == 'validate':
+            if not validate_configuration(args.config, args.parse_workers):
+                sys.exit(1)
+            return
+        
+        from snowflake_declarative import SnowflakeState, AsyncSnowflakeState
+        
         # Create Snowflake session
         session = create_snowflake_session(args.env)
         
         # Create root resource
         root = get_snowflake_root(session)
         
+        # Open the remote-state cache; real applies always re-read Snowflake
+        cache = create_state_cache(args.env, args.cache_path, args.cache_ttl,
+                                   refresh=args.refresh or not args.dry_run)
+        
+        # Trace the run to a local file if requested
+        if args.trace_output:
+            from snowflake_declarative.state.tracing import Tracer, open_exporter
+            tracer = Tracer([open_exporter(args.trace_output, args.trace_format)])
+        
+        # Stream change entries to disk as they are decided if requested
+        if args.stream_output:
+            from snowflake_declarative.state.report_stream import ChangeReportWriter
+            report_sink = ChangeReportWriter(args.stream_output)
+        
+        # Rate limit and retry every API call of the run
+        from snowflake_declarative.state.ratelimit import ApiCallPolicy, RetryBudget
+        limiter = None
+        if args.adaptive_concurrency:
+            from snowflake_declarative.state.concurrency import AdaptiveConcurrency
+            limiter = AdaptiveConcurrency(initial=min(4, args.concurrency), max_limit=args.concurrency)
+        api_policy = ApiCallPolicy(rate_limit=args.rate_limit, burst=args.burst, max_attempts=args.max_attempts,
+                                   budget=RetryBudget(ratio=args.retry_budget), concurrency=limiter)
+        
         # Manage Snowflake objects and generate change report
-        def manage_snowflake_objects(root, config_path: str, dry_run: bool = True):
-            state_manager = SnowflakeState(root)
+        def manage_snowflake_objects(root, config_path: str, dry_run: bool = True, concurrency: int = 1,
+                                     use_async: bool = False, cache=None, changed_only: bool = False):
+            if use_async:
+                state_manager = AsyncSnowflakeState(
+                    root, cache=cache, parsed_cache_dir=args.parsed_cache_dir, parse_workers=args.parse_workers,
+                    tracer=tracer, report_sink=report_sink, api_policy=api_policy
+                )
+            else:
+                state_manager = SnowflakeState(
+                    root, cache=cache, parsed_cache_dir=args.parsed_cache_dir, parse_workers=args.parse_workers,
+                    ddl_batch_size=args.ddl_batch_size, tracer=tracer, report_sink=report_sink,
+                    api_policy=api_policy
+                )
             logger.info(f"{'Dry run: ' if dry_run else ''}Applying Snowflake configurations...")
-            change_report = state_manager.apply_configuration(config_path, dry_run=dry_run)
+            change_report = state_manager.apply_configuration(
+                config_path, dry_run=dry_run, concurrency=concurrency, changed_only=changed_only
+            )
             return change_report
 
         # Generate change report
-        change_report = manage_snowflake_objects(root, args.config, args.dry_run)
+        change_report = manage_snowflake_objects(
+            root, args.config, args.dry_run, args.concurrency, args.use_async, cache, args.changed_only
+        )
         
         # Export change report if requested
         if args.output:
@@ -129,12 +298,29 @@ def main():
                 json.dump(change_report.to_dict(), f, indent=2)
             logger.info(f"Change report exported to {args.output}")
         
+        # Export run metrics for scraping if requested
+        if args.metrics_output and change_report.metrics is not None:
+            from snowflake_declarative.state.metrics import write_openmetrics
+            write_openmetrics(change_report.metrics, args.metrics_output)
+            logger.info(f"Run metrics exported to {args.metrics_output}")
+        
     except Exception as e:
         logger.error(f"An error occurred: {e}")
         sys.exit(1)
     finally:
+        # Keep every entry decided before a failure
+        if report_sink is not None:
+            report_sink.close()
+            logger.info(f"Change entries streamed to {args.stream_output}")
+        # Flush the trace even if the run failed part-way
+        if tracer is not None:
+            tracer.close()
+            logger.info(f"Trace exported to {args.trace_output}")
+        # Release the cache database before the session
+        if cache is not None:
+            cache.close()
         # Close the session if it exists
-        if 'session' in locals():
+        if session is not None:
             session.close()
 
 if __name__ == "__main__":
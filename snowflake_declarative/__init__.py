@@ -1,5 +1,24 @@
-from .state.manager import SnowflakeState
-from .models.database import SnowflakeDatabase
-from .models.warehouse import SnowflakeWarehouse
+import importlib
 
 __version__ = "0.1.0"
+
+# Public names resolve on first access so that importing the package (for
+# example to validate configs offline) does not pay for the whole engine
+_EXPORTS = {
+    'SnowflakeState': '.state.manager',
+    'AsyncSnowflakeState': '.state.async_manager',
+    'SnowflakeDatabase': '.models.database',
+    'SnowflakeWarehouse': '.models.warehouse',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
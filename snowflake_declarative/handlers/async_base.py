@@ -0,0 +1,134 @@
+# snowflake_declarative/handlers/async_base.py
+from abc import ABC, abstractmethod
+from typing import Optional, Any, List, Dict, Iterable, Tuple
+import asyncio
+import contextvars
+import functools
+import logging
+from .base import SnowflakeObjectHandler
+from .comparators import CompiledComparator
+from .sql import execute_statement
+from ..state.tracing import trace_methods, traced
+
+class AsyncSnowflakeObjectHandler(ABC):
+    """Abstract base class for asyncio-native object handlers"""
+    
+    def __init__(self, root):
+        self.root = root
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    depends_on: List[str] = []
+    alterable_fields: Dict[str, str] = {}
+
+    traced_methods = SnowflakeObjectHandler.traced_methods
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls)
+
+    normalize_name = staticmethod(SnowflakeObjectHandler.normalize_name)
+    _find_exact = SnowflakeObjectHandler._find_exact
+    get_dependencies = SnowflakeObjectHandler.get_dependencies
+    get_field_normalizers = SnowflakeObjectHandler.get_field_normalizers
+    get_comparator = SnowflakeObjectHandler.get_comparator
+    alterable_differences = SnowflakeObjectHandler.alterable_differences
+    get_alter_sql = SnowflakeObjectHandler.get_alter_sql
+
+    @abstractmethod
+    async def get_existing(self, name: str) -> Optional[Any]:
+        """Get existing object by name"""
+        pass
+
+    async def list_all(self) -> Optional[Iterable[Any]]:
+        """List every existing object of this type in a single call, or return ``None`` if unsupported"""
+        return None
+
+    @traced('build_index')
+    async def build_index(self) -> Optional[Dict[str, Any]]:
+        """Index all existing objects by normalized name, or ``None`` if they cannot be listed"""
+        objects = await self.list_all()
+        if objects is None:
+            return None
+        return {self.normalize_name(obj.name): obj for obj in objects}
+
+    @abstractmethod
+    async def create(self, obj: Any, dry_run: bool = True) -> None:
+        """Create new object"""
+        pass
+
+    async def alter(self, obj: Any, differences: List[Any], dry_run: bool = True) -> None:
+        """Apply the alterable differences in place with a single statement"""
+        statement = self.get_alter_sql(obj, differences)
+        if statement is None:
+            return
+        if not dry_run:
+            # The connector is blocking, so run the statement off the event loop
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            await loop.run_in_executor(
+                None, functools.partial(context.run, execute_statement, self.root.connection, statement)
+            )
+            self.logger.info(f"Altered '{obj.name}': {statement}")
+        else:
+            self.logger.info(f"Would alter '{obj.name}': {statement}")
+
+    @abstractmethod
+    def get_comparable_fields(self) -> List[str]:
+        """Get list of fields that should be compared"""
+        pass
+
+async def await_operation(operation) -> Any:
+    """Await an SDK ``PollingOperation`` (a ``concurrent.futures.Future``)"""
+    return await asyncio.wrap_future(operation)
+
+class SyncHandlerAdapter(AsyncSnowflakeObjectHandler):
+    """Expose a blocking ``SnowflakeObjectHandler`` through the async interface.
+
+    Each call runs on the event loop's default executor, so existing and
+    third-party handlers work with the async driver unchanged.
+    """
+
+    # The wrapped handler's own methods open the spans
+    traced_methods = ()
+
+    def __init__(self, handler: SnowflakeObjectHandler):
+        super().__init__(handler.root)
+        self.handler = handler
+        self.logger = handler.logger
+        self.depends_on = handler.depends_on
+        self.alterable_fields = handler.alterable_fields
+
+    def get_dependencies(self, obj: Any) -> List[Tuple[str, str]]:
+        return self.handler.get_dependencies(obj)
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        # Executor threads don't inherit context, so carry the current span over
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, functools.partial(context.run, func, *args, **kwargs))
+
+    async def get_existing(self, name: str) -> Optional[Any]:
+        return await self._run(self.handler.get_existing, name)
+
+    async def list_all(self) -> Optional[Iterable[Any]]:
+        # Materialize inside the worker so lazy SDK iterators don't block the loop
+        return await self._run(self._list_all)
+
+    def _list_all(self) -> Optional[List[Any]]:
+        objects = self.handler.list_all()
+        return None if objects is None else list(objects)
+
+    async def create(self, obj: Any, dry_run: bool = True) -> None:
+        await self._run(self.handler.create, obj, dry_run)
+
+    async def alter(self, obj: Any, differences: List[Any], dry_run: bool = True) -> None:
+        await self._run(self.handler.alter, obj, differences, dry_run)
+
+    def get_comparable_fields(self) -> List[str]:
+        return self.handler.get_comparable_fields()
+
+    def get_alter_sql(self, obj: Any, differences: List[Any]) -> Optional[str]:
+        return self.handler.get_alter_sql(obj, differences)
+
+    def get_comparator(self) -> CompiledComparator:
+        return self.handler.get_comparator()
@@ -1,26 +1,125 @@
 # snowflake_declarative/handlers/base.py
 from abc import ABC, abstractmethod
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Dict, Iterable, Tuple
 import logging
+from .comparators import CompiledComparator, Normalizer, normalize_default
+from .sql import execute_statement
+from ..state.tracing import trace_methods, traced
 
 class SnowflakeObjectHandler(ABC):
     """Abstract base class for object handlers"""
     
+    # Object types whose configured objects must all be applied before any
+    # object of this type (e.g. a schema handler would declare ['database'])
+    depends_on: List[str] = []
+
+    # Each field ``ALTER ... SET`` can change, mapped to its SQL parameter
+    # name. Differences in any other compared field (e.g. a database's
+    # ``kind``) can only be applied by recreating the object, and handlers
+    # that leave this empty are never altered in place.
+    alterable_fields: Dict[str, str] = {}
+
+    # Methods that open a tracing span whenever a subclass defines them
+    traced_methods: Tuple[str, ...] = ('get_existing', 'list_all', 'build_index', 'create', 'alter')
+
     def __init__(self, root):
         self.root = root
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._comparator: Optional[CompiledComparator] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls)
 
     @abstractmethod
     def get_existing(self, name: str) -> Optional[Any]:
-        """Get existing object by name"""
+        """Get existing object by name, or ``None`` if there is none.
+
+        Failed lookups must raise rather than return ``None``, so the engine
+        can retry transient errors instead of planning a create.
+        """
         pass
 
+    def list_all(self) -> Optional[Iterable[Any]]:
+        """List every existing object of this type in a single call.
+
+        Handlers that cannot enumerate their objects keep this default and
+        return ``None``; callers then fall back to ``get_existing``.
+        """
+        return None
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Normalize an identifier for case-insensitive, exact matching"""
+        return name.strip().upper()
+
+    @traced('build_index')
+    def build_index(self) -> Optional[Dict[str, Any]]:
+        """Index all existing objects by normalized name, or ``None`` if they cannot be listed"""
+        objects = self.list_all()
+        if objects is None:
+            return None
+        return {self.normalize_name(obj.name): obj for obj in objects}
+
+    def _find_exact(self, name: str, candidates: Iterable[Any]) -> Optional[Any]:
+        """Pick the candidate whose name matches exactly (LIKE treats `_` as a wildcard)"""
+        key = self.normalize_name(name)
+        for candidate in candidates:
+            if self.normalize_name(candidate.name) == key:
+                return candidate
+        return None
+
+    def get_dependencies(self, obj: Any) -> List[Tuple[str, str]]:
+        """Return the ``(object_type, name)`` pairs a single object depends on"""
+        return []
+
     @abstractmethod
     def create(self, obj: Any, dry_run: bool = True) -> None:
-        """Create new object"""
+        """Create new object; must be idempotent, as transient failures are retried"""
         pass
 
+    def get_create_sql(self, obj: Any) -> Optional[str]:
+        """Idempotent ``CREATE ... IF NOT EXISTS`` statement for batched submission.
+
+        Objects for which this returns ``None``, always when a handler keeps
+        this default, are created through ``create``.
+        """
+        return None
+
+    def alterable_differences(self, differences: Iterable[Any]) -> List[Any]:
+        """The differences ``alter`` can apply in place"""
+        fields = self.alterable_fields
+        return [diff for diff in differences if diff.field in fields]
+
+    def get_alter_sql(self, obj: Any, differences: List[Any]) -> Optional[str]:
+        """One coalesced ``ALTER ... SET`` statement for the alterable differences, or ``None``.
+
+        Handlers that declare ``alterable_fields`` override this.
+        """
+        return None
+
+    def alter(self, obj: Any, differences: List[Any], dry_run: bool = True) -> None:
+        """Apply the alterable differences in place with a single statement"""
+        statement = self.get_alter_sql(obj, differences)
+        if statement is None:
+            return
+        if not dry_run:
+            execute_statement(self.root.connection, statement)
+            self.logger.info(f"Altered '{obj.name}': {statement}")
+        else:
+            self.logger.info(f"Would alter '{obj.name}': {statement}")
+
     @abstractmethod
     def get_comparable_fields(self) -> List[str]:
         """Get list of fields that should be compared"""
         pass
+
+    def get_field_normalizers(self) -> Dict[str, Normalizer]:
+        """Map each comparable field to the normalizer used when diffing it"""
+        return {field: normalize_default for field in self.get_comparable_fields()}
+
+    def get_comparator(self) -> CompiledComparator:
+        """Comparator built once from ``get_field_normalizers``"""
+        if getattr(self, '_comparator', None) is None:
+            self._comparator = CompiledComparator(self.get_field_normalizers())
+        return self._comparator
@@ -0,0 +1,104 @@
+# snowflake_declarative/handlers/comparators.py
+import functools
+import operator
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple
+from ..models.differences import DifferenceRecord
+
+Normalizer = Callable[[Any], Any]
+
+_TRUE = {'TRUE', 'T', 'YES', 'Y', 'ON', '1'}
+_FALSE = {'FALSE', 'F', 'NO', 'N', 'OFF', '0'}
+
+_SIZES = {
+    'XSMALL': 'X-SMALL', 'SMALL': 'SMALL', 'MEDIUM': 'MEDIUM', 'LARGE': 'LARGE',
+    'XLARGE': 'X-LARGE', 'XXLARGE': '2X-LARGE', '2XLARGE': '2X-LARGE',
+    'XXXLARGE': '3X-LARGE', '3XLARGE': '3X-LARGE', '4XLARGE': '4X-LARGE',
+    '5XLARGE': '5X-LARGE', '6XLARGE': '6X-LARGE'
+}
+
+def normalize_default(value: Any) -> Any:
+    """Legacy normalization: strip and upper-case strings, leave everything else"""
+    if isinstance(value, str):
+        return value.strip().upper()
+    return value
+
+def normalize_text(value: Any) -> Any:
+    """Case-insensitive string"""
+    if type(value) is str:
+        return value.strip().upper()
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, str):
+        return value.strip().upper()
+    return value
+
+normalize_enum = normalize_text
+
+def normalize_bool(value: Any) -> Any:
+    """Booleans reported as 'true'/'FALSE'/1 by Snowflake"""
+    if value is None or type(value) is bool:
+        return value
+    if isinstance(value, int):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().upper()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+    return value
+
+def normalize_int(value: Any) -> Any:
+    """Integers that may come back as strings"""
+    if isinstance(value, str) and value.strip().lstrip('-').isdigit():
+        return int(value)
+    return value
+
+@functools.lru_cache(maxsize=256)
+def _canonical_size(value: str) -> str:
+    key = value.strip().upper().replace('-', '').replace('_', '')
+    return _SIZES.get(key, value.strip().upper())
+
+def normalize_size(value: Any) -> Any:
+    """Warehouse sizes, e.g. 'X-Small', 'XSMALL' and 'x_small' are all X-SMALL"""
+    if type(value) is not str:
+        if isinstance(value, Enum):
+            value = value.value
+        if not isinstance(value, str):
+            return value
+    return _canonical_size(value)
+
+class CompiledComparator:
+    """Field-by-field comparator built once per handler.
+
+    Each compared field is prepared once as a ``(field, getter, normalizer)``
+    triple, so comparing an object is a single loop without generic
+    normalization. Raw values that are already identical skip normalization
+    entirely.
+    """
+
+    def __init__(self, normalizers: Dict[str, Normalizer]):
+        for field in normalizers:
+            if not field.isidentifier():
+                raise ValueError(f"Invalid comparable field name: {field!r}")
+        self.fields: Tuple[str, ...] = tuple(normalizers)
+        self._fields: Tuple[Tuple[str, Callable[[Any], Any], Normalizer], ...] = tuple(
+            (field, operator.attrgetter(field), normalize) for field, normalize in normalizers.items()
+        )
+
+    def diff(self, desired: Any, actual: Any) -> List[DifferenceRecord]:
+        """Differences between a desired object and the existing one, in field order"""
+        differences = []
+        for field, get, normalize in self._fields:
+            d = get(desired)
+            # Fields not specified in the config are not managed
+            if d is None:
+                continue
+            a = getattr(actual, field, None)
+            if d != a or type(d) is not type(a):
+                d = normalize(d)
+                a = normalize(a)
+                if d != a:
+                    differences.append(DifferenceRecord(field, d, a))
+        return differences
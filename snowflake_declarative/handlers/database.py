@@ -1,32 +1,129 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, List, Iterable, Tuple
 from .base import SnowflakeObjectHandler
-from ..models.database import SnowflakeDatabase
+from .async_base import AsyncSnowflakeObjectHandler, await_operation
+from .sql import format_alter, format_properties, quote_literal
+from .comparators import (
+    Normalizer, normalize_enum, normalize_int, normalize_size, normalize_text
+)
+from ..models.database import DatabaseClone, SnowflakeDatabase
+
+def format_clone(clone: DatabaseClone) -> str:
+    """``CLONE <source> [AT | BEFORE (...)]`` clause of a CREATE DATABASE statement"""
+    reference, point = ('AT', clone.at) if clone.at is not None else ('BEFORE', clone.before)
+    if point is None:
+        return f"CLONE {clone.name}"
+    if point.timestamp is not None:
+        cast = 'TIMESTAMP_TZ' if point.timestamp.tzinfo is not None else 'TIMESTAMP_LTZ'
+        when = f"TIMESTAMP => {quote_literal(point.timestamp.isoformat())}::{cast}"
+    elif point.offset is not None:
+        when = f"OFFSET => {point.offset}"
+    else:
+        when = f"STATEMENT => {quote_literal(point.statement)}"
+    return f"CLONE {clone.name} {reference} ({when})"
+
+def describe_create(obj: SnowflakeDatabase) -> str:
+    """How a database will be created, for log messages"""
+    if obj.clone_from is None:
+        return f"database '{obj.name}'"
+    return f"database '{obj.name}' as a zero-copy clone of '{obj.clone_from.name}'"
 
 class DatabaseHandler(SnowflakeObjectHandler):
     def get_existing(self, name: str) -> Optional[Any]:
-        try:
-            dbs = list(self.root.databases.iter(like=name))
-            return dbs[0] if dbs else None
-        except Exception as e:
-            self.logger.error(f"Error getting database {name}: {e}")
-            return None
+        return self._find_exact(name, self.root.databases.iter(like=name))
+
+    def list_all(self) -> Iterable[Any]:
+        return self.root.databases.iter()
 
     def create(self, obj: SnowflakeDatabase, dry_run: bool = True) -> None:
         if not dry_run:
-            from snowflake.core.database import Database
             from snowflake.core import CreateMode
-            db = Database(**obj.model_dump(exclude_none=True))
-            self.root.databases.create(db, mode=CreateMode.if_not_exists)
-            self.logger.info(f"Created database '{obj.name}'")
+            clone = obj.clone_from.to_snowflake_clone() if obj.clone_from is not None else None
+            self.root.databases.create(obj.to_snowflake_database(), clone=clone, mode=CreateMode.if_not_exists)
+            self.logger.info(f"Created {describe_create(obj)}")
         else:
-            self.logger.info(f"Would create database '{obj.name}'")
+            self.logger.info(f"Would create {describe_create(obj)}")
+
+    # Fields that map one-to-one onto CREATE/ALTER DATABASE parameters
+    SQL_PROPERTIES = [
+        'data_retention_time_in_days', 'max_data_extension_time_in_days',
+        'default_ddl_collation', 'log_level', 'trace_level',
+        'suspend_task_after_num_failures',
+        'user_task_managed_initial_warehouse_size', 'user_task_timeout_ms',
+        'comment'
+    ]
+
+    # The subset CREATE DATABASE ... CLONE accepts; the rest must be set after cloning
+    CLONE_PROPERTIES = [
+        'data_retention_time_in_days', 'max_data_extension_time_in_days', 'default_ddl_collation', 'comment'
+    ]
+
+    def get_create_sql(self, obj: SnowflakeDatabase) -> Optional[str]:
+        kind = getattr(obj.kind, 'value', obj.kind)
+        prefix = f"{kind} " if kind and kind != 'PERMANENT' else ''
+        clone = ''
+        fields = self.SQL_PROPERTIES
+        if obj.clone_from is not None:
+            # Clones that set other parameters go through ``create`` instead of a lossy statement
+            if any(getattr(obj, field) is not None for field in fields if field not in self.CLONE_PROPERTIES):
+                return None
+            clone = f" {format_clone(obj.clone_from)}"
+            fields = self.CLONE_PROPERTIES
+        properties = format_properties({field: getattr(obj, field) for field in fields})
+        return f"CREATE {prefix}DATABASE IF NOT EXISTS {obj.name}{clone} {properties}".rstrip()
+
+    def get_dependencies(self, obj: SnowflakeDatabase) -> List[Tuple[str, str]]:
+        # A configured clone source must exist before its clones are created
+        return [('database', obj.clone_from.name)] if obj.clone_from is not None else []
+
+    # kind, retention_time (reported by SHOW) and budget are not database parameters
+    alterable_fields = {field: field for field in SQL_PROPERTIES}
+
+    def get_alter_sql(self, obj: SnowflakeDatabase, differences: List[Any]) -> Optional[str]:
+        fields = self.alterable_fields
+        return format_alter('DATABASE', obj.name, {
+            fields[diff.field]: getattr(obj, diff.field) for diff in self.alterable_differences(differences)
+        })
 
     def get_comparable_fields(self) -> List[str]:
-        return [
-            'comment', 'kind', 'retention_time', 'budget',
-            'data_retention_time_in_days', 'default_ddl_collation',
-            'log_level', 'max_data_extension_time_in_days',
-            'suspend_task_after_num_failures', 'trace_level',
-            'user_task_managed_initial_warehouse_size',
-            'user_task_timeout_ms'
-        ]
+        return list(self.get_field_normalizers())
+
+    def get_field_normalizers(self) -> Dict[str, Normalizer]:
+        return {
+            'comment': normalize_text,
+            'kind': normalize_enum,
+            'retention_time': normalize_int,
+            'budget': normalize_text,
+            'data_retention_time_in_days': normalize_int,
+            'default_ddl_collation': normalize_enum,
+            'log_level': normalize_enum,
+            'max_data_extension_time_in_days': normalize_int,
+            'suspend_task_after_num_failures': normalize_int,
+            'trace_level': normalize_enum,
+            'user_task_managed_initial_warehouse_size': normalize_size,
+            'user_task_timeout_ms': normalize_int
+        }
+
+class AsyncDatabaseHandler(AsyncSnowflakeObjectHandler):
+    async def get_existing(self, name: str) -> Optional[Any]:
+        dbs = await await_operation(self.root.databases.iter_async(like=name))
+        return self._find_exact(name, dbs)
+
+    async def list_all(self) -> Iterable[Any]:
+        return list(await await_operation(self.root.databases.iter_async()))
+
+    async def create(self, obj: SnowflakeDatabase, dry_run: bool = True) -> None:
+        if not dry_run:
+            from snowflake.core import CreateMode
+            clone = obj.clone_from.to_snowflake_clone() if obj.clone_from is not None else None
+            await await_operation(self.root.databases.create_async(
+                obj.to_snowflake_database(), clone=clone, mode=CreateMode.if_not_exists
+            ))
+            self.logger.info(f"Created {describe_create(obj)}")
+        else:
+            self.logger.info(f"Would create {describe_create(obj)}")
+
+    get_comparable_fields = DatabaseHandler.get_comparable_fields
+    get_field_normalizers = DatabaseHandler.get_field_normalizers
+    alterable_fields = DatabaseHandler.alterable_fields
+    get_alter_sql = DatabaseHandler.get_alter_sql
+    get_dependencies = DatabaseHandler.get_dependencies
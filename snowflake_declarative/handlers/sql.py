@@ -0,0 +1,37 @@
+# snowflake_declarative/handlers/sql.py
+from enum import Enum
+from typing import Any, Dict, Optional
+
+def quote_literal(value: str) -> str:
+    """Quote a string literal; backslashes are escape characters in Snowflake strings"""
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+def format_value(value: Any) -> str:
+    """Render a Python value as a Snowflake property value"""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return str(value)
+    return quote_literal(str(value))
+
+def format_properties(properties: Dict[str, Any]) -> str:
+    """Render ``NAME = value`` pairs, skipping unset properties"""
+    return ' '.join(
+        f"{name.upper()} = {format_value(value)}"
+        for name, value in properties.items() if value is not None
+    )
+
+def format_alter(object_type: str, name: str, properties: Dict[str, Any]) -> Optional[str]:
+    """One ``ALTER <type> <name> SET ...`` statement, or ``None`` if no property is set"""
+    rendered = format_properties(properties)
+    return f"ALTER {object_type} {name} SET {rendered}" if rendered else None
+
+def execute_statement(connection, statement: str) -> None:
+    """Run a single statement on a DB-API connection"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(statement)
+    finally:
+        cursor.close()
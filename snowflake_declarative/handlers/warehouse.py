@@ -1,24 +1,79 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, List, Iterable
 from .base import SnowflakeObjectHandler
+from .async_base import AsyncSnowflakeObjectHandler, await_operation
+from .sql import format_alter, format_properties
+from .comparators import Normalizer, normalize_bool, normalize_int, normalize_size, normalize_text
 from ..models.warehouse import SnowflakeWarehouse
 
 class WarehouseHandler(SnowflakeObjectHandler):
     def get_existing(self, name: str) -> Optional[Any]:
-        try:
-            warehouses = list(self.root.warehouses.iter(like=name))
-            return warehouses[0] if warehouses else None
-        except Exception as e:
-            self.logger.error(f"Error getting warehouse {name}: {e}")
-            return None
+        return self._find_exact(name, self.root.warehouses.iter(like=name))
+
+    def list_all(self) -> Iterable[Any]:
+        return self.root.warehouses.iter()
 
     def create(self, obj: SnowflakeWarehouse, dry_run: bool = True) -> None:
         if not dry_run:
             from snowflake.core.warehouse import Warehouse
+            from snowflake.core import CreateMode
             wh = Warehouse(**obj.model_dump(exclude_none=True))
-            self.root.warehouses.create(wh)
+            self.root.warehouses.create(wh, mode=CreateMode.if_not_exists)
             self.logger.info(f"Created warehouse '{obj.name}'")
         else:
             self.logger.info(f"Would create warehouse '{obj.name}'")
 
+    def get_create_sql(self, obj: SnowflakeWarehouse) -> str:
+        properties = format_properties({
+            'warehouse_size': obj.size,
+            'auto_suspend': obj.auto_suspend,
+            'auto_resume': obj.auto_resume,
+            'comment': obj.comment
+        })
+        return f"CREATE WAREHOUSE IF NOT EXISTS {obj.name} {properties}".rstrip()
+
+    alterable_fields = {
+        'size': 'warehouse_size',
+        'auto_suspend': 'auto_suspend',
+        'auto_resume': 'auto_resume',
+        'comment': 'comment'
+    }
+
+    def get_alter_sql(self, obj: SnowflakeWarehouse, differences: List[Any]) -> Optional[str]:
+        fields = self.alterable_fields
+        return format_alter('WAREHOUSE', obj.name, {
+            fields[diff.field]: getattr(obj, diff.field) for diff in self.alterable_differences(differences)
+        })
+
     def get_comparable_fields(self) -> List[str]:
-        return ['size', 'auto_suspend', 'auto_resume', 'comment']
+        return list(self.get_field_normalizers())
+
+    def get_field_normalizers(self) -> Dict[str, Normalizer]:
+        return {
+            'size': normalize_size,
+            'auto_suspend': normalize_int,
+            'auto_resume': normalize_bool,
+            'comment': normalize_text
+        }
+
+class AsyncWarehouseHandler(AsyncSnowflakeObjectHandler):
+    async def get_existing(self, name: str) -> Optional[Any]:
+        warehouses = await await_operation(self.root.warehouses.iter_async(like=name))
+        return self._find_exact(name, warehouses)
+
+    async def list_all(self) -> Iterable[Any]:
+        return list(await await_operation(self.root.warehouses.iter_async()))
+
+    async def create(self, obj: SnowflakeWarehouse, dry_run: bool = True) -> None:
+        if not dry_run:
+            from snowflake.core.warehouse import Warehouse
+            from snowflake.core import CreateMode
+            wh = Warehouse(**obj.model_dump(exclude_none=True))
+            await await_operation(self.root.warehouses.create_async(wh, mode=CreateMode.if_not_exists))
+            self.logger.info(f"Created warehouse '{obj.name}'")
+        else:
+            self.logger.info(f"Would create warehouse '{obj.name}'")
+
+    get_comparable_fields = WarehouseHandler.get_comparable_fields
+    get_field_normalizers = WarehouseHandler.get_field_normalizers
+    alterable_fields = WarehouseHandler.alterable_fields
+    get_alter_sql = WarehouseHandler.get_alter_sql
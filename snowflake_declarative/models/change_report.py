@@ -1,7 +1,11 @@
-from typing import Dict, List, Optional, Any
+import copy
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Any, Union
 from enum import Enum, auto
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
-from .differences import ObjectDifference
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, computed_field, field_serializer, model_validator
+from .differences import DifferenceRecord, ObjectDifference
 
 class ChangeStatus(str, Enum):
     """Enum representing the status of a change"""
@@ -25,37 +29,161 @@ class ObjectChangeEntry(BaseModel):
         }
     )
 
+class ChangeRecord:
+    """Compact in-memory form of ``ObjectChangeEntry``.
+
+    The engine builds and updates these while planning; ``ChangeReport``
+    stores them and only creates pydantic entries when ``changes`` is read.
+    Object types are interned and statuses are the shared enum members.
+    """
+
+    __slots__ = ('name', 'type', 'status', 'differences', 'error')
+
+    def __init__(self, name: str, type: str, status: Union[ChangeStatus, str],
+                 differences: Optional[List[DifferenceRecord]] = None, error: Optional[str] = None):
+        self.name = name
+        self.type = sys.intern(type)
+        self.status = ChangeStatus(status)
+        self.differences = differences
+        self.error = error
+
+    @classmethod
+    def from_model(cls, entry: Union['ChangeRecord', ObjectChangeEntry]) -> 'ChangeRecord':
+        if isinstance(entry, cls):
+            return entry
+        differences = None
+        if entry.differences is not None:
+            differences = [DifferenceRecord.from_model(difference) for difference in entry.differences]
+        return cls(entry.name, entry.type, entry.status, differences, entry.error)
+
+    def to_model(self) -> ObjectChangeEntry:
+        differences = None
+        if self.differences is not None:
+            differences = [DifferenceRecord.from_model(difference).to_model() for difference in self.differences]
+        return ObjectChangeEntry.model_construct(
+            name=self.name, type=self.type, status=self.status, differences=differences, error=self.error
+        )
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Same shape as ``ObjectChangeEntry.model_dump()``"""
+        differences = self.differences
+        return {
+            'name': self.name,
+            'type': self.type,
+            'status': self.status,
+            'differences': None if differences is None else [difference.model_dump() for difference in differences],
+            'error': self.error,
+        }
+
+    def __repr__(self) -> str:
+        return (f"ChangeRecord(name={self.name!r}, type={self.type!r}, status={self.status.value!r}, "
+                f"differences={self.differences!r}, error={self.error!r})")
+
 class ChangeReport(BaseModel):
-    """Comprehensive report of changes across Snowflake objects"""
-    total_objects: int = 0
-    objects_processed: int = 0
-    objects_created: int = 0
-    objects_updated: int = 0
-    objects_no_change: int = 0
-    objects_with_errors: int = 0
-    
-    changes: Dict[str, List[ObjectChangeEntry]] = Field(default_factory=dict)
-    
-    def add_change(self, object_type: str, change_entry: ObjectChangeEntry):
+    """Comprehensive report of changes across Snowflake objects.
+
+    Entries are held as ``ChangeRecord`` objects and the summary counts are
+    derived from a per-status tally; ``changes`` builds pydantic entries on
+    each access, so use ``records`` when reading a large report in code.
+    Validating the output of ``to_dict`` or ``model_dump_json`` rebuilds the
+    entries from ``changes``; the stored counters are recomputed from them.
+    """
+
+    # Phase timings and API latencies recorded by the engine (see state.metrics)
+    metrics: Optional[Dict[str, Any]] = None
+
+    _records: Dict[str, List[ChangeRecord]] = PrivateAttr(default_factory=dict)
+    _status_counts: Counter = PrivateAttr(default_factory=Counter)
+
+    # Guards entries and counters so workers may report concurrently
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @model_validator(mode='wrap')
+    @classmethod
+    def _restore_changes(cls, data: Any, handler: Any) -> 'ChangeReport':
+        # Entries and counters are computed fields, so they are not validated as fields
+        changes = None
+        if isinstance(data, dict) and 'changes' in data:
+            data = dict(data)
+            changes = data.pop('changes')
+        report = handler(data)
+        for obj_type, entries in (changes or {}).items():
+            for entry in entries:
+                report.add_change(obj_type, ObjectChangeEntry.model_validate(entry))
+        return report
+
+    def add_change(self, object_type: str, change_entry: Union[ChangeRecord, ObjectChangeEntry]):
         """Add a change entry to the report"""
-        if object_type not in self.changes:
-            self.changes[object_type] = []
-        
-        self.changes[object_type].append(change_entry)
-        
-        # Update summary statistics
-        self.total_objects += 1
-        self.objects_processed += 1
-        
-        if change_entry.status == ChangeStatus.CREATED:
-            self.objects_created += 1
-        elif change_entry.status == ChangeStatus.UPDATED:
-            self.objects_updated += 1
-        elif change_entry.status == ChangeStatus.NO_CHANGE:
-            self.objects_no_change += 1
-        elif change_entry.status == ChangeStatus.ERROR:
-            self.objects_with_errors += 1
-    
+        record = ChangeRecord.from_model(change_entry)
+        # Private attributes resolve through BaseModel.__getattr__; read the slot once on this hot path
+        private = self.__pydantic_private__
+        with private['_lock']:
+            by_type = private['_records']
+            records = by_type.get(object_type)
+            if records is None:
+                records = by_type[sys.intern(object_type)] = []
+            records.append(record)
+            private['_status_counts'][record.status] += 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled or copied; the restored report gets its own
+        state = super().__getstate__()
+        state['__pydantic_private__'] = {
+            name: value for name, value in state['__pydantic_private__'].items() if name != '_lock'
+        }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self.__pydantic_private__['_lock'] = threading.Lock()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'ChangeReport':
+        with self.__pydantic_private__['_lock']:
+            state = copy.deepcopy(self.__getstate__(), memo)
+        copied = self.__class__.__new__(self.__class__)
+        copied.__setstate__(state)
+        return copied
+
+    @property
+    def records(self) -> Dict[str, List[ChangeRecord]]:
+        """Entries by object type, in the order they were added (do not modify)"""
+        return self._records
+
+    @computed_field
+    @property
+    def changes(self) -> Dict[str, List[ObjectChangeEntry]]:
+        return {obj_type: [record.to_model() for record in records] for obj_type, records in self._records.items()}
+
+    @computed_field
+    @property
+    def total_objects(self) -> int:
+        return sum(self._status_counts.values())
+
+    @computed_field
+    @property
+    def objects_processed(self) -> int:
+        return self.total_objects
+
+    @computed_field
+    @property
+    def objects_created(self) -> int:
+        return self._status_counts[ChangeStatus.CREATED]
+
+    @computed_field
+    @property
+    def objects_updated(self) -> int:
+        return self._status_counts[ChangeStatus.UPDATED]
+
+    @computed_field
+    @property
+    def objects_no_change(self) -> int:
+        return self._status_counts[ChangeStatus.NO_CHANGE]
+
+    @computed_field
+    @property
+    def objects_with_errors(self) -> int:
+        return self._status_counts[ChangeStatus.ERROR]
+
     def summary(self) -> str:
         """Generate a human-readable summary of changes"""
         summary_lines = [
@@ -67,10 +195,10 @@ class ChangeReport(BaseModel):
             f"Objects with Errors: {self.objects_with_errors}"
         ]
         return "\n".join(summary_lines)
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the change report to a dictionary for serialization"""
-        return {
+        report = {
             "total_objects": self.total_objects,
             "objects_processed": self.objects_processed,
             "objects_created": self.objects_created,
@@ -78,7 +206,10 @@ class ChangeReport(BaseModel):
             "objects_no_change": self.objects_no_change,
             "objects_with_errors": self.objects_with_errors,
             "changes": {
-                obj_type: [entry.model_dump() for entry in entries]
-                for obj_type, entries in self.changes.items()
+                obj_type: [record.model_dump() for record in records]
+                for obj_type, records in self._records.items()
             }
         }
+        if self.metrics is not None:
+            report["metrics"] = self.metrics
+        return report
@@ -2,8 +2,7 @@ from datetime import datetime
 from enum import Enum
 import logging
 from typing import Optional, List, Any
-from pydantic import BaseModel, Field, validator, field_validator
-from snowflake.core import CreateMode
+from pydantic import BaseModel, Field, validator, field_validator, model_validator
 import yaml
 
 class DatabaseKind(str, Enum):
@@ -40,6 +39,48 @@ class CollationType(str, Enum):
     UTF8_CS = "UTF8_CS"
     UTF8_BIN = "UTF8_BIN"
 
+class TimeTravel(BaseModel):
+    """A point in a database's Time Travel history; set exactly one field"""
+    timestamp: Optional[datetime] = None
+    offset: Optional[int] = Field(default=None, le=0, description="Seconds relative to now, e.g. -3600")
+    statement: Optional[str] = Field(default=None, min_length=1, description="ID of a query")
+
+    @model_validator(mode='after')
+    def validate_single_point(self) -> 'TimeTravel':
+        if sum(value is not None for value in (self.timestamp, self.offset, self.statement)) != 1:
+            raise ValueError('Set exactly one of timestamp, offset or statement')
+        return self
+
+class DatabaseClone(BaseModel):
+    """Source of a zero-copy clone, optionally as of a point in its Time Travel history"""
+    name: str = Field(..., pattern="^[A-Za-z][A-Za-z0-9_]*$")
+    at: Optional[TimeTravel] = None
+    before: Optional[TimeTravel] = None
+
+    @field_validator('name')
+    def validate_name(cls, v: str) -> str:
+        return v.upper()
+
+    @model_validator(mode='after')
+    def validate_point_of_time(self) -> 'DatabaseClone':
+        if self.at is not None and self.before is not None:
+            raise ValueError('Set at most one of at or before')
+        return self
+
+    def to_snowflake_clone(self) -> 'Clone':
+        """Convert to the Snowflake ``Clone`` accepted by ``databases.create``"""
+        from snowflake.core import Clone, PointOfTimeOffset, PointOfTimeStatement, PointOfTimeTimestamp
+        reference, point = ('at', self.at) if self.at is not None else ('before', self.before)
+        if point is None:
+            return Clone(source=self.name)
+        if point.timestamp is not None:
+            point_of_time = PointOfTimeTimestamp(reference=reference, when=point.timestamp.isoformat())
+        elif point.offset is not None:
+            point_of_time = PointOfTimeOffset(reference=reference, when=str(point.offset))
+        else:
+            point_of_time = PointOfTimeStatement(reference=reference, when=point.statement)
+        return Clone(source=self.name, point_of_time=point_of_time)
+
 class SnowflakeDatabase(BaseModel):
     name: str = Field(
         ..., 
@@ -72,6 +113,8 @@ class SnowflakeDatabase(BaseModel):
         ge=0,
         le=86400000  # 24 hours in milliseconds
     )
+    # Created as a zero-copy clone of this database; ignored once the database exists
+    clone_from: Optional[DatabaseClone] = None
 
     @validator('name')
     def validate_name(cls, v):
@@ -90,6 +133,17 @@ class SnowflakeDatabase(BaseModel):
             raise ValueError('Temporary databases cannot have retention time')
         return v
 
+    @field_validator('clone_from', mode='before')
+    def validate_clone_from(cls, v: Any) -> Any:
+        # A bare name clones the source's current state
+        return {'name': v} if isinstance(v, str) else v
+
+    @model_validator(mode='after')
+    def validate_clone_source(self) -> 'SnowflakeDatabase':
+        if self.clone_from is not None and self.clone_from.name == self.name:
+            raise ValueError(f'Database {self.name} cannot be cloned from itself')
+        return self
+
     @field_validator('default_ddl_collation', mode='before')
     def validate_collation(cls, v: Any) -> Optional[str]:
         if v is None or v == '' or v == 'None' or v == 'NONE':
@@ -120,7 +174,7 @@ class SnowflakeDatabase(BaseModel):
     def to_snowflake_database(self) -> 'Database':
         """Convert Pydantic model to Snowflake Database object"""
         from snowflake.core.database import Database
-        return Database(**self.model_dump(exclude_none=True))
+        return Database(**self.model_dump(exclude_none=True, exclude={'clone_from'}))
 
     @classmethod
     def from_snowflake_database(cls, db: 'Database') -> 'SnowflakeDatabase':
@@ -213,6 +267,7 @@ class SnowflakeState:
                 if len(existing_dbs) == 0:
                     self.logger.info(f"Database '{desired_db.name}' does not exist. Will create.")
                     if not dry_run:
+                        from snowflake.core import CreateMode
                         from snowflake.core.database import Database
                         db = Database(**desired_db.model_dump(exclude_none=True))
                         self.root.databases.create(
@@ -1,5 +1,6 @@
+import sys
 from pydantic import BaseModel
-from typing import Any
+from typing import Any, Dict
 
 class ObjectDifference(BaseModel):
     field: str
@@ -8,3 +9,45 @@ class ObjectDifference(BaseModel):
 
     def __str__(self):
         return f"{self.field}: expected '{self.expected}', got '{self.actual}'"
+
+class DifferenceRecord:
+    """Compact in-memory form of ``ObjectDifference`` used by the engine and reports.
+
+    Field names are interned, so a report holding many differences on
+    the same field stores the name once.
+    """
+
+    __slots__ = ('field', 'expected', 'actual')
+
+    def __init__(self, field: str, expected: Any, actual: Any):
+        self.field = sys.intern(field)
+        self.expected = expected
+        self.actual = actual
+
+    @classmethod
+    def from_model(cls, difference: Any) -> 'DifferenceRecord':
+        if isinstance(difference, cls):
+            return difference
+        if isinstance(difference, dict):
+            return cls(difference['field'], difference.get('expected'), difference.get('actual'))
+        return cls(difference.field, difference.expected, difference.actual)
+
+    def to_model(self) -> ObjectDifference:
+        return ObjectDifference.model_construct(field=self.field, expected=self.expected, actual=self.actual)
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Same shape as ``ObjectDifference.model_dump()``"""
+        return {'field': self.field, 'expected': self.expected, 'actual': self.actual}
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (DifferenceRecord, ObjectDifference)):
+            return NotImplemented
+        return (self.field, self.expected, self.actual) == (other.field, other.expected, other.actual)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"DifferenceRecord(field={self.field!r}, expected={self.expected!r}, actual={self.actual!r})"
+
+    def __str__(self) -> str:
+        return f"{self.field}: expected '{self.expected}', got '{self.actual}'"
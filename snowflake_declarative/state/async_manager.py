@@ -0,0 +1,196 @@
+import asyncio
+from typing import Dict, List, Any, Optional
+from .manager import SnowflakeState, trace_outcome, trace_summary
+from ..models.base import SnowflakeObject
+from ..handlers.async_base import AsyncSnowflakeObjectHandler, SyncHandlerAdapter
+from ..handlers.database import AsyncDatabaseHandler
+from ..handlers.warehouse import AsyncWarehouseHandler
+from ..models.change_report import ChangeReport, ChangeRecord, ChangeStatus
+from .cache import RemoteStateCache
+from .metrics import RunMetrics
+from .ratelimit import ApiCallPolicy
+from .report_stream import ChangeReportWriter
+from . import tracing
+
+class AsyncSnowflakeState(SnowflakeState):
+    """Drives planning and apply on a single asyncio event loop.
+
+    Object types without a native async handler fall back to their sync
+    handler in ``self.handlers`` through ``SyncHandlerAdapter``.
+    """
+
+    def __init__(self, root, cache: Optional[RemoteStateCache] = None,
+                 parsed_cache_dir: Optional[str] = None, parse_workers: Optional[int] = None,
+                 tracer: Optional[tracing.Tracer] = None, report_sink: Optional[ChangeReportWriter] = None,
+                 api_policy: Optional[ApiCallPolicy] = None):
+        # Creates are issued through the async handlers, never as batched DDL
+        super().__init__(root, cache, parsed_cache_dir, parse_workers, tracer=tracer, report_sink=report_sink,
+                         api_policy=api_policy)
+        self.async_handlers: Dict[str, AsyncSnowflakeObjectHandler] = {
+            'database': AsyncDatabaseHandler(root),
+            'warehouse': AsyncWarehouseHandler(root)
+        }
+
+    def get_async_handler(self, obj_type: str) -> Optional[AsyncSnowflakeObjectHandler]:
+        """Return the async handler for a type, adapting a sync one if needed"""
+        if obj_type not in self.async_handlers and obj_type in self.handlers:
+            self.async_handlers[obj_type] = SyncHandlerAdapter(self.handlers[obj_type])
+        return self.async_handlers.get(obj_type)
+
+    async def api_call_async(self, obj_type: str, operation: str, fn, *args: Any) -> Any:
+        """Async counterpart of ``api_call``"""
+        return await self.api.call_async(self.metrics, obj_type, operation, fn, *args)
+
+    async def fetch_inventory_async(self, configs: Dict[str, List[SnowflakeObject]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Async counterpart of ``fetch_index`` for every configured type; all types are listed concurrently"""
+        inventory = {}
+        obj_types = []
+        for obj_type in configs:
+            if not self.get_async_handler(obj_type):
+                continue
+            cached = self.cache.get_index(obj_type) if self.cache else None
+            if cached is not None:
+                inventory[obj_type] = cached
+            else:
+                obj_types.append(obj_type)
+
+        async def timed_build(obj_type):
+            with tracing.span('fetch', object_type=obj_type) as span:
+                index = await self.api_call_async(obj_type, 'list', self.get_async_handler(obj_type).build_index)
+                span.set_attribute('objects', None if index is None else len(index))
+                return index
+
+        with self.metrics.phase('fetch'):
+            results = await asyncio.gather(*(timed_build(obj_type) for obj_type in obj_types), return_exceptions=True)
+        for obj_type, result in zip(obj_types, results):
+            if result is None:
+                inventory[obj_type] = None
+            elif isinstance(result, Exception):
+                self.logger.error(f"Error listing {obj_type} objects, falling back to per-object lookups: {result}")
+                inventory[obj_type] = None
+            else:
+                inventory[obj_type] = result
+                self.logger.info(f"Fetched {len(result)} existing {obj_type} object(s)")
+                if self.cache:
+                    self.cache.put_index(obj_type, result)
+        return inventory
+
+    async def process_object_async(self, obj_type: str, handler: AsyncSnowflakeObjectHandler,
+                                   obj: SnowflakeObject, index: Optional[Dict[str, Any]],
+                                   dry_run: bool = True) -> ChangeRecord:
+        """Async counterpart of ``process_object``"""
+        with tracing.span('process', object_type=obj_type, object_name=obj.name) as span:
+            return trace_outcome(span, await self._process_object_async(obj_type, handler, obj, index, dry_run))
+
+    async def _process_object_async(self, obj_type: str, handler: AsyncSnowflakeObjectHandler,
+                                    obj: SnowflakeObject, index: Optional[Dict[str, Any]],
+                                    dry_run: bool) -> ChangeRecord:
+        try:
+            if index is None:
+                with self.metrics.phase('fetch'), tracing.span('fetch', object_type=obj_type, object_name=obj.name):
+                    existing = await self.api_call_async(obj_type, 'get', handler.get_existing, obj.name)
+            else:
+                existing = index.get(handler.normalize_name(obj.name))
+            
+            change_entry = ChangeRecord(
+                name=obj.name,
+                type=obj_type,
+                status=ChangeStatus.NO_CHANGE
+            )
+            
+            if not existing:
+                change_entry.status = ChangeStatus.CREATED
+                if not dry_run:
+                    with self.metrics.phase('create'), tracing.span('create', object_type=obj_type, object_name=obj.name):
+                        await self.api_call_async(obj_type, 'create', handler.create, obj, dry_run)
+            else:
+                self.compare_existing(obj_type, obj, existing, handler, change_entry)
+                alterable = handler.alterable_differences(change_entry.differences or ())
+                if alterable and not dry_run:
+                    with self.metrics.phase('alter'), tracing.span('alter', object_type=obj_type, object_name=obj.name):
+                        await self.api_call_async(obj_type, 'alter', handler.alter, obj, alterable, dry_run)
+            
+            return change_entry
+
+        except Exception as e:
+            self.logger.error(f"Error processing {obj_type} '{obj.name}': {e}")
+            return ChangeRecord(
+                name=obj.name,
+                type=obj_type,
+                status=ChangeStatus.ERROR,
+                error=str(e)
+            )
+
+    async def apply_configuration_async(self, config_path: str, dry_run: bool = True,
+                                        max_in_flight: int = 100, changed_only: bool = False) -> ChangeReport:
+        """Apply configurations with at most ``max_in_flight`` concurrent calls
+
+        Objects are processed in the same dependency waves as the sync engine.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        with tracing.start_trace(self.tracer, 'apply', config_path=config_path, dry_run=dry_run,
+                                 max_in_flight=max_in_flight) as span:
+            return trace_summary(span, await self._apply_configuration_async(
+                config_path, dry_run, max_in_flight, changed_only
+            ))
+
+    async def _apply_configuration_async(self, config_path: str, dry_run: bool, max_in_flight: int,
+                                         changed_only: bool) -> ChangeReport:
+        change_report = ChangeReport()
+        self.metrics = RunMetrics()
+        self.api.start_run(self.metrics)
+        configs = self.load_yaml_config(config_path)
+        inventory = await self.fetch_inventory_async(configs)
+        work = self.build_work(configs, {t: self.get_async_handler(t) for t in configs}, inventory)
+        graph = self.build_dependency_graph(work)
+        self.check_dependencies(work, graph)
+        unchanged = self.find_unchanged(work) if changed_only else set()
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def bounded(i):
+            if i in unchanged:
+                return self.report_decided(i, self.unchanged_entry(work[i]))
+            async with semaphore:
+                return self.report_decided(i, await self.process_object_async(*work[i], dry_run=dry_run))
+
+        # Run each dependency wave concurrently; gather preserves order
+        results: Dict[int, ChangeRecord] = {}
+        failures = set()
+        for wave in graph.levels():
+            runnable = []
+            for i in wave:
+                blocked_by = graph.failed_parent(i, failures)
+                if blocked_by is not None:
+                    results[i] = self.report_decided(i, self.dependency_failed_entry(work[i], work[blocked_by]))
+                    failures.add(i)
+                else:
+                    runnable.append(i)
+            entries = await asyncio.gather(*(bounded(i) for i in runnable))
+            for i, entry in zip(runnable, entries):
+                results[i] = entry
+                if entry.status == ChangeStatus.ERROR:
+                    failures.add(i)
+
+        with self.metrics.phase('report'), tracing.span('report'):
+            for i, (obj_type, _, _, _) in enumerate(work):
+                change_report.add_change(obj_type, results[i])
+
+            self.record_in_sync(work, results, dry_run)
+            if not dry_run:
+                self.invalidate_cache(change_report)
+        change_report.metrics = self.metrics.to_dict()
+        self.report_finished(change_report)
+
+        self.logger.info("Change Report Summary:")
+        self.logger.info(change_report.summary())
+        
+        return change_report
+
+    def apply_configuration(self, config_path: str, dry_run: bool = True,
+                            concurrency: int = 100, changed_only: bool = False) -> ChangeReport:
+        """Blocking entry point that runs ``apply_configuration_async`` on a new event loop"""
+        return asyncio.run(self.apply_configuration_async(
+            config_path, dry_run, max_in_flight=concurrency, changed_only=changed_only
+        ))
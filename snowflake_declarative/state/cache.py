@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+def object_properties(obj: Any) -> Dict[str, Any]:
+    """Extract a plain property dict from an SDK model or simple object"""
+    if hasattr(obj, 'to_dict'):
+        properties = obj.to_dict()
+    elif hasattr(obj, 'model_dump'):
+        properties = obj.model_dump()
+    else:
+        properties = {k: v for k, v in vars(obj).items() if not k.startswith('_')}
+    # Drop unset values so live and cached objects fingerprint identically
+    return {k: v for k, v in properties.items() if v is not None}
+
+def fingerprint(properties: Dict[str, Any]) -> str:
+    """Stable content hash of an object's properties"""
+    payload = json.dumps(properties, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def config_hash(obj_type: str, obj: Any) -> str:
+    """Content hash of a desired object's normalized configuration"""
+    return fingerprint({'type': obj_type, **obj.model_dump(mode='json', exclude_none=True)})
+
+class RemoteStateCache:
+    """On-disk SQLite cache of the last observed remote objects.
+
+    Entries are keyed by account, role, object type and name. An object
+    type's inventory is served from the cache while it is younger than
+    ``ttl`` seconds; ``refresh=True`` bypasses reads but still records what
+    was fetched.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS inventories (
+            account TEXT NOT NULL,
+            role TEXT NOT NULL,
+            object_type TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (account, role, object_type)
+        );
+        CREATE TABLE IF NOT EXISTS objects (
+            account TEXT NOT NULL,
+            role TEXT NOT NULL,
+            object_type TEXT NOT NULL,
+            name TEXT NOT NULL,
+            properties TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            observed_at REAL NOT NULL,
+            PRIMARY KEY (account, role, object_type, name)
+        );
+        CREATE TABLE IF NOT EXISTS applied_objects (
+            account TEXT NOT NULL,
+            role TEXT NOT NULL,
+            object_type TEXT NOT NULL,
+            name TEXT NOT NULL,
+            config_hash TEXT NOT NULL,
+            fingerprint TEXT,
+            applied_at REAL NOT NULL,
+            PRIMARY KEY (account, role, object_type, name)
+        );
+    """
+
+    def __init__(self, path: str, account: str, role: Optional[str] = None,
+                 ttl: float = 300, refresh: bool = False):
+        self.path = path
+        self.account = account.upper()
+        self.role = (role or '').upper()
+        self.ttl = ttl
+        self.refresh = refresh
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+
+    def get_index(self, object_type: str) -> Optional[Dict[str, Any]]:
+        """Return the cached inventory for a type, or ``None`` if stale or missing"""
+        if self.refresh or self.ttl <= 0:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM inventories WHERE account = ? AND role = ? AND object_type = ?",
+                (self.account, self.role, object_type)
+            ).fetchone()
+            if row is None or time.time() - row[0] > self.ttl:
+                return None
+            rows = self._conn.execute(
+                "SELECT name, properties FROM objects WHERE account = ? AND role = ? AND object_type = ?",
+                (self.account, self.role, object_type)
+            ).fetchall()
+        self.logger.info(f"Using cached {object_type} inventory ({len(rows)} object(s), "
+                         f"{time.time() - row[0]:.0f}s old)")
+        return {name: SimpleNamespace(**json.loads(properties)) for name, properties in rows}
+
+    def put_index(self, object_type: str, index: Dict[str, Any]) -> None:
+        """Replace the cached inventory for a type"""
+        now = time.time()
+        rows = []
+        for name, obj in index.items():
+            properties = object_properties(obj)
+            rows.append((self.account, self.role, object_type, name,
+                         json.dumps(properties, default=str), fingerprint(properties), now))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM objects WHERE account = ? AND role = ? AND object_type = ?",
+                (self.account, self.role, object_type)
+            )
+            self._conn.executemany("INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO inventories VALUES (?, ?, ?, ?)",
+                (self.account, self.role, object_type, now)
+            )
+
+    def get_applied(self, object_type: str) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Return ``name -> (config_hash, fingerprint)`` recorded by the last in-sync run"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, config_hash, fingerprint FROM applied_objects "
+                "WHERE account = ? AND role = ? AND object_type = ?",
+                (self.account, self.role, object_type)
+            ).fetchall()
+        return {name: (config_hash, fp) for name, config_hash, fp in rows}
+
+    def record_applied(self, object_type: str, in_sync: Dict[str, Tuple[str, Optional[str]]],
+                       configured: Iterable[str]) -> None:
+        """Record objects known to match their config, forgetting everything else.
+
+        ``in_sync`` maps names to ``(config_hash, fingerprint)``; records for
+        names that are no longer configured (removed or renamed) or that are
+        configured but not in sync are dropped.
+        """
+        now = time.time()
+        stale = set(configured) - set(in_sync)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM applied_objects WHERE account = ? AND role = ? AND object_type = ? "
+                "AND name NOT IN (SELECT value FROM json_each(?))",
+                (self.account, self.role, object_type, json.dumps(list(configured)))
+            )
+            self._conn.executemany(
+                "DELETE FROM applied_objects WHERE account = ? AND role = ? AND object_type = ? AND name = ?",
+                [(self.account, self.role, object_type, name) for name in stale]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO applied_objects VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(self.account, self.role, object_type, name, config_hash, fp, now)
+                 for name, (config_hash, fp) in in_sync.items()]
+            )
+
+    def invalidate(self, object_type: str) -> None:
+        """Force the next lookup of a type to go to Snowflake"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM inventories WHERE account = ? AND role = ? AND object_type = ?",
+                (self.account, self.role, object_type)
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,126 @@
+import asyncio
+import collections
+import threading
+from typing import Deque, Dict, Hashable, Optional, Tuple
+
+class AdaptiveConcurrency:
+    """In-flight API call limit tuned by AIMD from observed latency and errors.
+
+    Every call holds a slot between ``acquire`` and ``release``. While the
+    limit is in use and latency stays within ``tolerance`` times its
+    baseline, each completed call adds ``1 / limit``, so the limit grows by
+    about one per round-trip. A throttled call or a smoothed latency above
+    the tolerance multiplies the limit by ``backoff``, at most once per
+    ``limit`` completions so one congested moment is not counted once per
+    call in flight.
+
+    Baselines are kept per ``key`` (e.g. ``(handler, operation)``), because
+    a listing and a lookup have very different normal latencies. A baseline
+    follows the fastest recent call and drifts slowly upwards, so a lasting
+    change in network latency is not mistaken for load.
+
+    Threads and asyncio tasks may share one instance.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 64,
+                 backoff: float = 0.75, tolerance: float = 2.0, smoothing: float = 0.2, drift: float = 0.001):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError(f"need 1 <= min_limit <= initial <= max_limit, got {min_limit}, {initial}, {max_limit}")
+        if not 0 < backoff < 1:
+            raise ValueError(f"backoff must be between 0 and 1, got {backoff}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.drift = drift
+        self.limit = float(initial)
+        self.in_flight = 0
+        self._baselines: Dict[Hashable, float] = {}
+        self._ratio = 1.0
+        # The first congestion signal always counts
+        self._since_decrease = initial
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = collections.deque()
+
+    @property
+    def current(self) -> int:
+        """The limit in whole calls"""
+        return int(self.limit)
+
+    def acquire(self) -> None:
+        """Block until a slot is free and take it"""
+        with self._available:
+            while self.in_flight >= int(self.limit):
+                self._available.wait()
+            self.in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a slot is free and take it"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # Already woken: pass the wake-up on
+                        self._wake(int(self.limit) - self.in_flight)
+                raise
+
+    def release(self, key: Hashable, latency: Optional[float], throttled: bool = False) -> Optional[int]:
+        """Free a slot and learn from the call; returns the new whole limit if it changed.
+
+        ``latency`` is ``None`` for calls that failed without a usable
+        timing; ``throttled`` marks rejections caused by load.
+        """
+        with self._lock:
+            utilized = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            before = int(self.limit)
+            self._since_decrease += 1
+            congested = throttled or (latency is not None and self._observe(key, latency) > self.tolerance)
+            if congested:
+                if self._since_decrease >= before:
+                    self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                    self._since_decrease = 0
+            elif utilized:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._wake(int(self.limit) - self.in_flight)
+            after = int(self.limit)
+        return after if after != before else None
+
+    def _observe(self, key: Hashable, latency: float) -> float:
+        """Update the key's baseline and return the smoothed latency-to-baseline ratio"""
+        baseline = self._baselines.get(key)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * self.drift
+        self._baselines[key] = baseline
+        sample = latency / baseline if baseline > 0 else 1.0
+        self._ratio += (sample - self._ratio) * self.smoothing
+        return self._ratio
+
+    def _wake(self, slots: int) -> None:
+        """Wake up to ``slots`` waiters; each re-checks the limit before taking a slot"""
+        woken = 0
+        while woken < slots and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_resolve, waiter)
+            woken += 1
+        if woken < slots:
+            self._available.notify(slots - woken)
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,64 @@
+import logging
+from typing import List, Optional
+from . import tracing
+from .ratelimit import ApiCallPolicy
+
+class DDLBatchExecutor:
+    """Submit DDL statements in multi-statement batches over one connection.
+
+    Returns one error message per statement (``None`` on success). When a
+    batch fails, Snowflake does not say which statement broke it, so the
+    batch is replayed one statement at a time to attribute the error. Only
+    idempotent statements (``CREATE ... IF NOT EXISTS``, ``ALTER ... SET``)
+    should be submitted. With ``metrics``, each round-trip is timed as a
+    ``ddl``/``execute_batch`` API call. With ``api``, round-trips are rate
+    limited and transient failures retried before a batch is replayed.
+    """
+
+    def __init__(self, connection, batch_size: int = 100, metrics=None, api: Optional[ApiCallPolicy] = None):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.connection = connection
+        self.batch_size = batch_size
+        self.metrics = metrics
+        self.api = api if api is not None else ApiCallPolicy(max_attempts=1)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def execute(self, statements: List[str]) -> List[Optional[str]]:
+        """Run all statements and return their per-statement errors in order"""
+        errors: List[Optional[str]] = []
+        for start in range(0, len(statements), self.batch_size):
+            errors.extend(self._execute_batch(statements[start:start + self.batch_size]))
+        return errors
+
+    def _execute_batch(self, batch: List[str]) -> List[Optional[str]]:
+        try:
+            self._run(batch)
+            self.logger.info(f"Executed batch of {len(batch)} DDL statement(s)")
+            return [None] * len(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                return [str(e)]
+            self.logger.warning(f"Batch of {len(batch)} DDL statement(s) failed ({e}); retrying individually")
+        errors = []
+        for statement in batch:
+            try:
+                self._run([statement])
+                errors.append(None)
+            except Exception as e:
+                errors.append(str(e))
+        return errors
+
+    def _run(self, batch: List[str]) -> None:
+        with tracing.span('ddl.execute_batch', statements=len(batch)):
+            self.api.call(self.metrics, 'ddl', 'execute_batch', self._execute, batch)
+
+    def _execute(self, batch: List[str]) -> None:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(';\n'.join(batch), num_statements=len(batch))
+            # Drain every statement's result so failures surface here
+            while cursor.nextset():
+                pass
+        finally:
+            cursor.close()
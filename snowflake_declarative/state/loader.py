@@ -0,0 +1,217 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Type
+import glob
+import hashlib
+import json
+import logging
+import os
+import pickle
+import yaml
+from yaml.events import (
+    AliasEvent, ScalarEvent, SequenceStartEvent, SequenceEndEvent,
+    MappingStartEvent, MappingEndEvent, StreamEndEvent
+)
+from yaml.nodes import Node, ScalarNode, SequenceNode, MappingNode
+from ..models.base import SnowflakeObject
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+logger = logging.getLogger(__name__)
+
+def _compose(loader, anchors: Dict[str, Node]) -> Node:
+    """Compose the next node from the event stream (the subset of yaml.Composer we need)"""
+    event = loader.get_event()
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.composer.ComposerError(
+                None, None, f"found undefined alias {event.anchor!r}", event.start_mark
+            )
+        return anchors[event.anchor]
+
+    if isinstance(event, ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(ScalarNode, event.value, event.implicit)
+        node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(SequenceNode, None, event.implicit)
+        node = SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(SequenceEndEvent):
+            node.value.append(_compose(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    elif isinstance(event, MappingStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(MappingNode, None, event.implicit)
+        node = MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(MappingEndEvent):
+            key = _compose(loader, anchors)
+            node.value.append((key, _compose(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+    else:
+        raise yaml.composer.ComposerError(None, None, f"unexpected event {event}", event.start_mark)
+
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+def iter_yaml_sections(stream: IO, sections) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(section, item)`` for each item of the given top-level lists, one at a time.
+
+    Only the item currently being yielded is held in memory; top-level keys
+    that are not in ``sections`` are composed, so anchors defined there can
+    be used by later items, but never constructed.
+    """
+    loader = SafeLoader(stream)
+    anchors: Dict[str, Node] = {}
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStart
+        if not loader.check_event(MappingStartEvent):
+            if loader.construct_document(_compose(loader, anchors)) is None:
+                return
+            raise ValueError("Configuration must be a mapping of object lists")
+        loader.get_event()  # MappingStart
+
+        while not loader.check_event(MappingEndEvent):
+            section = loader.construct_document(_compose(loader, anchors))
+            if section not in sections:
+                _compose(loader, anchors)
+            elif loader.check_event(SequenceStartEvent):
+                loader.get_event()
+                while not loader.check_event(SequenceEndEvent):
+                    yield section, loader.construct_document(_compose(loader, anchors))
+                loader.get_event()
+            elif loader.construct_document(_compose(loader, anchors)) is not None:
+                raise ValueError(f"Configuration section '{section}' must be a list")
+    finally:
+        loader.dispose()
+
+def iter_config_items(path: str, object_types: Dict[str, Type[SnowflakeObject]]
+                      ) -> Iterator[Tuple[str, Type[SnowflakeObject], Dict[str, Any]]]:
+    """Stream raw ``(obj_type, model class, item)`` triples from a YAML config file, before validation"""
+    plural_types = {f"{obj_type}s": (obj_type, obj_class) for obj_type, obj_class in object_types.items()}
+    with open(path, 'r') as f:
+        for section, item in iter_yaml_sections(f, plural_types):
+            obj_type, obj_class = plural_types[section]
+            yield obj_type, obj_class, item
+
+def iter_config_objects(path: str, object_types: Dict[str, Type[SnowflakeObject]]) -> Iterator[Tuple[str, SnowflakeObject]]:
+    """Stream validated ``(obj_type, object)`` pairs from a YAML config file in file order"""
+    for obj_type, obj_class, item in iter_config_items(path, object_types):
+        yield obj_type, obj_class(**item)
+
+class DuplicateObjectError(ValueError):
+    """Raised when the same object is declared more than once across config files"""
+    pass
+
+def is_config_pattern(path: str) -> bool:
+    """Whether a config path names a directory or glob rather than a single file"""
+    return os.path.isdir(path) or glob.has_magic(path)
+
+def resolve_config_paths(path: str) -> List[str]:
+    """Expand a config directory or glob into a sorted list of YAML files"""
+    if os.path.isdir(path):
+        paths = [p for ext in ('yaml', 'yml') for p in glob.glob(os.path.join(path, '**', f'*.{ext}'), recursive=True)]
+    else:
+        paths = glob.glob(path, recursive=True)
+    paths = sorted(p for p in paths if os.path.isfile(p))
+    if not paths:
+        raise FileNotFoundError(f"No YAML config files found for: {path}")
+    return paths
+
+def parse_config_file(path: str, object_types: Dict[str, Type[SnowflakeObject]]) -> List[Tuple[str, SnowflakeObject]]:
+    """Parse and validate a whole config file (runs in worker processes)"""
+    return list(iter_config_objects(path, object_types))
+
+class ParsedConfigCache:
+    """On-disk cache of validated models keyed by config file content hash.
+
+    Keys also cover the model schemas, so editing a model invalidates every
+    entry. Entries are pickles written by this tool; do not point the cache
+    at a directory other users can write to.
+    """
+
+    def __init__(self, directory: str, object_types: Dict[str, Type[SnowflakeObject]]):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        schemas = {
+            obj_type: [f"{cls.__module__}.{cls.__qualname__}", cls.model_json_schema()]
+            for obj_type, cls in object_types.items()
+        }
+        self._schema_key = hashlib.sha256(json.dumps(schemas, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def key(self, content: bytes) -> str:
+        return hashlib.sha256(self._schema_key.encode('ascii') + content).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Tuple[str, SnowflakeObject]]]:
+        try:
+            with open(os.path.join(self.directory, f"{key}.pickle"), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return None
+
+    def put(self, key: str, objects: List[Tuple[str, SnowflakeObject]]) -> None:
+        path = os.path.join(self.directory, f"{key}.pickle")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(objects, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+def iter_config_tree(path: str, object_types: Dict[str, Type[SnowflakeObject]],
+                     workers: Optional[int] = None,
+                     cache: Optional[ParsedConfigCache] = None) -> Iterator[Tuple[str, SnowflakeObject]]:
+    """Stream validated objects from every YAML file under a directory or glob.
+
+    Files missing from ``cache`` are parsed in parallel on a process pool;
+    objects are yielded file by file in sorted path order. The same
+    ``(obj_type, name)`` in two places raises ``DuplicateObjectError``.
+    """
+    paths = resolve_config_paths(path)
+    keys: Dict[str, Optional[str]] = {}
+    cached: Dict[str, List[Tuple[str, SnowflakeObject]]] = {}
+    for config_path in paths:
+        keys[config_path] = None
+        if cache is not None:
+            with open(config_path, 'rb') as f:
+                keys[config_path] = cache.key(f.read())
+            hit = cache.get(keys[config_path])
+            if hit is not None:
+                cached[config_path] = hit
+    misses = [p for p in paths if p not in cached]
+    logger.info(f"Loading {len(paths)} config file(s), {len(cached)} from the parsed-model cache")
+
+    pool = ProcessPoolExecutor(max_workers=workers) if len(misses) > 1 and workers != 1 else None
+    futures = {}
+    try:
+        if pool is not None:
+            futures = {p: pool.submit(parse_config_file, p, object_types) for p in misses}
+        seen: Dict[Tuple[str, str], str] = {}
+        for config_path in paths:
+            if config_path in cached:
+                objects = cached[config_path]
+            else:
+                objects = futures[config_path].result() if pool else parse_config_file(config_path, object_types)
+                if cache is not None:
+                    cache.put(keys[config_path], objects)
+            for obj_type, obj in objects:
+                key = (obj_type, obj.name.strip().upper())
+                if key in seen:
+                    raise DuplicateObjectError(
+                        f"{obj_type.capitalize()} '{obj.name}' is declared in both {seen[key]} and {config_path}"
+                    )
+                seen[key] = config_path
+                yield obj_type, obj
+    finally:
+        if pool is not None:
+            for future in futures.values():
+                future.cancel()
+            pool.shutdown()
@@ -1,18 +1,44 @@
-from typing import Dict, List, Any
-import yaml
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 import logging
 import sys
+import time
 from ..models.base import SnowflakeObject
 from ..handlers.base import SnowflakeObjectHandler
-from ..models.differences import ObjectDifference
-from ..models.change_report import ChangeReport, ObjectChangeEntry, ChangeStatus
+from ..models.differences import DifferenceRecord
+from ..models.change_report import ChangeReport, ChangeRecord, ChangeStatus
+from .scheduler import DependencyCycleError, DependencyGraph, WaveScheduler
+from .cache import RemoteStateCache, config_hash, fingerprint
+from .ddl import DDLBatchExecutor
+from .loader import DuplicateObjectError, ParsedConfigCache, is_config_pattern, iter_config_items, iter_config_tree
+from .metrics import RunMetrics
+from .ratelimit import ApiCallPolicy
+from .report_stream import ChangeReportWriter
+from . import tracing
 
 class SnowflakeState:
     """Manages the desired state of Snowflake objects"""
     
-    def __init__(self, root):
+    def __init__(self, root, cache: Optional[RemoteStateCache] = None,
+                 parsed_cache_dir: Optional[str] = None, parse_workers: Optional[int] = None,
+                 ddl_batch_size: int = 0, tracer: Optional[tracing.Tracer] = None,
+                 report_sink: Optional[ChangeReportWriter] = None, api_policy: Optional[ApiCallPolicy] = None):
         self.root = root
+        self.cache = cache
+        self.parsed_cache_dir = parsed_cache_dir
+        self.parse_workers = parse_workers
+        # Creates are submitted as batched SQL when positive, one SDK call each otherwise
+        self.ddl_batch_size = ddl_batch_size
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Replaced at the start of every apply_configuration run
+        self.metrics = RunMetrics()
+        # Each apply_configuration run becomes one trace when set
+        self.tracer = tracer
+        # Receives each change entry as soon as it is decided, then the summary
+        self.report_sink = report_sink
+        # Rate limit and retries shared by every API call; retries transient errors by default
+        self.api = api_policy if api_policy is not None else ApiCallPolicy()
         self.handlers = {
             'database': DatabaseHandler(root),
             'warehouse': WarehouseHandler(root)
@@ -22,109 +48,504 @@ class SnowflakeState:
             'warehouse': SnowflakeWarehouse
         }
 
+    def iter_config(self, path: str) -> Iterator[Tuple[str, SnowflakeObject]]:
+        """Stream validated ``(obj_type, object)`` pairs from YAML in file order
+
+        ``path`` may also be a directory or glob, in which case every matching
+        YAML file is parsed in parallel and merged in sorted path order.
+        """
+        if is_config_pattern(path):
+            cache = ParsedConfigCache(self.parsed_cache_dir, self.object_types) if self.parsed_cache_dir else None
+            # Worker processes parse and validate together, so both count as load
+            return self.timed_load(iter_config_tree(path, self.object_types, workers=self.parse_workers, cache=cache))
+        return self.timed_validation(iter_config_items(path, self.object_types))
+
+    def timed_load(self, objects: Iterator[Tuple[str, SnowflakeObject]]) -> Iterator[Tuple[str, SnowflakeObject]]:
+        """Pass objects through, adding the time spent producing them to the ``load`` phase"""
+        metrics, clock = self.metrics, time.perf_counter
+        start = clock()
+        for obj_type, obj in objects:
+            loaded = clock()
+            metrics.add_phase('load', loaded - start)
+            tracing.record_span('load', start, loaded, object_type=obj_type, object_name=obj.name)
+            yield obj_type, obj
+            start = clock()
+        metrics.add_phase('load', clock() - start)
+
+    def timed_validation(self, items: Iterator[Tuple[str, Any, Dict[str, Any]]]) -> Iterator[Tuple[str, SnowflakeObject]]:
+        """Validate raw config items, timing YAML parsing (``load``) and validation separately"""
+        metrics, clock = self.metrics, time.perf_counter
+        start = clock()
+        for obj_type, obj_class, item in items:
+            loaded = clock()
+            obj = obj_class(**item)
+            validated = clock()
+            metrics.add_phase('load', loaded - start)
+            metrics.add_phase('validate', validated - loaded)
+            tracing.record_span('load', start, validated, object_type=obj_type, object_name=obj.name,
+                                validate_ms=(validated - loaded) * 1000)
+            yield obj_type, obj
+            start = clock()
+        metrics.add_phase('load', clock() - start)
+
     def load_yaml_config(self, path: str) -> Dict[str, List[SnowflakeObject]]:
         """Load configurations from YAML"""
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        loaded: Dict[str, List[SnowflakeObject]] = {}
+        for obj_type, obj in self.iter_config(path):
+            loaded.setdefault(obj_type, []).append(obj)
         
-        configs = {}
-        for obj_type, obj_class in self.object_types.items():
-            plural_type = f"{obj_type}s"
-            if plural_type in data:
-                configs[obj_type] = [obj_class(**obj) for obj in data[plural_type]]
-        
-        return configs
+        # Keep the registered type order regardless of section order in the file
+        return {obj_type: loaded[obj_type] for obj_type in self.object_types if obj_type in loaded}
+
+    def validate_configuration(self, config_path: str) -> Dict[str, int]:
+        """Parse and validate a configuration without contacting Snowflake
+
+        Returns the number of objects of each type; invalid objects raise the
+        model's validation error, repeated ``(type, name)`` pairs raise
+        ``DuplicateObjectError`` and dependency cycles (e.g. databases cloned
+        from each other) raise ``DependencyCycleError``.
+        """
+        counts: Dict[str, int] = {}
+        seen: Set[Tuple[str, str]] = set()
+        work: List[Tuple[str, Any, SnowflakeObject, Any]] = []
+        for obj_type, obj in self.iter_config(config_path):
+            if obj_type in self.handlers:
+                work.append((obj_type, self.handlers[obj_type], obj, None))
+            key = (obj_type, obj.name.strip().upper())
+            if key in seen:
+                raise DuplicateObjectError(
+                    f"{obj_type.capitalize()} '{obj.name}' is declared more than once in {config_path}"
+                )
+            seen.add(key)
+            counts[obj_type] = counts.get(obj_type, 0) + 1
+        self.check_dependencies(work, self.build_dependency_graph(work))
+        return {obj_type: counts[obj_type] for obj_type in self.object_types if obj_type in counts}
+
+    def api_call(self, obj_type: str, operation: str, fn, *args: Any) -> Any:
+        """Call ``fn(*args)`` through the shared API policy, timed as ``obj_type``/``operation``"""
+        return self.api.call(self.metrics, obj_type, operation, fn, *args)
 
     def find_differences(self, desired: SnowflakeObject, actual: Any, 
-                        handler: SnowflakeObjectHandler) -> List[ObjectDifference]:
-        """Compare desired and actual states"""
-        differences = []
+                        handler: SnowflakeObjectHandler) -> List[DifferenceRecord]:
+        """Compare desired and actual states using the handler's comparator"""
+        return handler.get_comparator().diff(desired, actual)
+
+    def fetch_index(self, obj_type: str, handler: SnowflakeObjectHandler) -> Optional[Dict[str, Any]]:
+        """Fetch (or read from the cache) the name index of one object type"""
+        with self.metrics.phase('fetch'), tracing.span('fetch', object_type=obj_type) as span:
+            index = self._fetch_index(obj_type, handler)
+            span.set_attribute('objects', None if index is None else len(index))
+            return index
+
+    def _fetch_index(self, obj_type: str, handler: SnowflakeObjectHandler) -> Optional[Dict[str, Any]]:
+        cached = self.cache.get_index(obj_type) if self.cache else None
+        if cached is not None:
+            return cached
+        try:
+            index = self.api_call(obj_type, 'list', handler.build_index)
+        except Exception as e:
+            self.logger.error(f"Error listing {obj_type} objects, falling back to per-object lookups: {e}")
+            return None
+        if index is None:
+            return None
+        if self.cache:
+            self.cache.put_index(obj_type, index)
+        self.logger.info(f"Fetched {len(index)} existing {obj_type} object(s)")
+        return index
+
+    def lookup_existing(self, handler: SnowflakeObjectHandler, index: Optional[Dict[str, Any]],
+                        name: str, obj_type: str = 'object') -> Optional[Any]:
+        """Find an existing object in the inventory index, or ask the handler directly"""
+        if index is None:
+            with self.metrics.phase('fetch'), tracing.span('fetch', object_type=obj_type, object_name=name):
+                return self.api_call(obj_type, 'get', handler.get_existing, name)
+        return index.get(handler.normalize_name(name))
+
+    def compare_existing(self, obj_type: str, obj: SnowflakeObject, existing: Any,
+                         handler: Any, change_entry: ChangeRecord) -> None:
+        """Diff an existing object against its desired state and record the result"""
+        with self.metrics.phase('diff'), tracing.span('diff', object_type=obj_type, object_name=obj.name) as span:
+            differences = self.find_differences(obj, existing, handler)
+            span.set_attribute('differences', len(differences))
         
-        for field in handler.get_comparable_fields():
-            desired_value = getattr(desired, field)
-            actual_value = getattr(actual, field, None)
+        if differences:
+            # Object has differences
+            change_entry.status = ChangeStatus.UPDATED
+            change_entry.differences = differences
+            
+            self.logger.warning(
+                f"{obj_type.capitalize()} '{obj.name}' exists but has differences:"
+            )
+            for diff in differences:
+                self.logger.warning(f"  - {diff}")
+            
+            alterable = {diff.field for diff in handler.alterable_differences(differences)}
+            immutable = [diff.field for diff in differences if diff.field not in alterable]
+            if immutable:
+                self.logger.warning(
+                    f"Note: {', '.join(immutable)} cannot be altered in place. "
+                    f"You would need to recreate the {obj_type} to apply these changes."
+                )
 
-            if desired_value is None:
-                continue
+    def submit_ddl(self, ddl: List[Tuple[ChangeRecord, str]]) -> None:
+        """Run queued statements in batches and mark the entries of failed ones as errors"""
+        if not ddl:
+            return
+        executor = DDLBatchExecutor(self.root.connection, self.ddl_batch_size, metrics=self.metrics, api=self.api)
+        with self.metrics.phase('create'), tracing.span('create', statements=len(ddl)):
+            errors = executor.execute([statement for _, statement in ddl])
+        for (entry, _), error in zip(ddl, errors):
+            created = entry.status == ChangeStatus.CREATED
+            if error is None:
+                self.logger.info(f"{'Created' if created else 'Altered'} {entry.type} '{entry.name}'")
+            else:
+                entry.status = ChangeStatus.ERROR
+                entry.error = error
+                self.logger.error(f"Error {'creating' if created else 'altering'} {entry.type} '{entry.name}': {error}")
+
+    def process_object(self, obj_type: str, handler: SnowflakeObjectHandler, obj: SnowflakeObject,
+                       index: Optional[Dict[str, Any]], dry_run: bool = True,
+                       ddl: Optional[List[Tuple[ChangeRecord, str]]] = None) -> ChangeRecord:
+        """Plan (and optionally apply) a single object and return its change entry
+
+        When ``ddl`` is given, creates and alters the handler can express as
+        SQL are queued there for ``submit_ddl`` instead of being run
+        immediately.
+        """
+        with tracing.span('process', object_type=obj_type, object_name=obj.name) as span:
+            return trace_outcome(span, self._process_object(obj_type, handler, obj, index, dry_run, ddl))
 
-            if isinstance(desired_value, str):
-                desired_value = desired_value.strip().upper()
-            if isinstance(actual_value, str):
-                actual_value = actual_value.strip().upper()
+    def _process_object(self, obj_type: str, handler: SnowflakeObjectHandler, obj: SnowflakeObject,
+                        index: Optional[Dict[str, Any]], dry_run: bool,
+                        ddl: Optional[List[Tuple[ChangeRecord, str]]]) -> ChangeRecord:
+        try:
+            # Check if object exists
+            existing = self.lookup_existing(handler, index, obj.name, obj_type)
+            
+            # Prepare change entry
+            change_entry = ChangeRecord(
+                name=obj.name,
+                type=obj_type,
+                status=ChangeStatus.NO_CHANGE
+            )
+            
+            if not existing:
+                # Object does not exist, needs creation
+                change_entry.status = ChangeStatus.CREATED
+                if not dry_run:
+                    statement = handler.get_create_sql(obj) if ddl is not None else None
+                    if statement is not None:
+                        ddl.append((change_entry, statement))
+                    else:
+                        with self.metrics.phase('create'), \
+                                tracing.span('create', object_type=obj_type, object_name=obj.name):
+                            self.api_call(obj_type, 'create', handler.create, obj, dry_run)
+            else:
+                # Object exists, check for differences
+                self.compare_existing(obj_type, obj, existing, handler, change_entry)
+                alterable = handler.alterable_differences(change_entry.differences or ())
+                if alterable and not dry_run:
+                    statement = handler.get_alter_sql(obj, alterable) if ddl is not None else None
+                    if statement is not None:
+                        ddl.append((change_entry, statement))
+                    else:
+                        with self.metrics.phase('alter'), \
+                                tracing.span('alter', object_type=obj_type, object_name=obj.name):
+                            self.api_call(obj_type, 'alter', handler.alter, obj, alterable, dry_run)
+            
+            return change_entry
 
-            if desired_value != actual_value:
-                differences.append(ObjectDifference(
-                    field=field,
-                    expected=desired_value,
-                    actual=actual_value
-                ))
+        except Exception as e:
+            # Handle any errors during processing
+            self.logger.error(f"Error processing {obj_type} '{obj.name}': {e}")
+            return ChangeRecord(
+                name=obj.name,
+                type=obj_type,
+                status=ChangeStatus.ERROR,
+                error=str(e)
+            )
 
-        return differences
+    def report_decided(self, i: int, entry: ChangeRecord) -> ChangeRecord:
+        """Stream a final entry to the report sink, if any, tagged with its work position"""
+        if self.report_sink is not None:
+            self.report_sink.write_entry(entry, i)
+        return entry
 
-    def apply_configuration(self, config_path: str, dry_run: bool = True) -> ChangeReport:
-        """Apply configurations from YAML and generate a comprehensive change report"""
-        # Initialize change report
-        change_report = ChangeReport()
-        
-        # Load configurations
-        configs = self.load_yaml_config(config_path)
-        
+    def report_finished(self, change_report: ChangeReport) -> None:
+        """Close the streamed report with the run's totals"""
+        if self.report_sink is not None:
+            self.report_sink.write_summary(change_report)
+
+    def invalidate_cache(self, change_report: ChangeReport) -> None:
+        """Drop cached inventories of types that were changed by this run"""
+        if not self.cache:
+            return
+        for obj_type, entries in change_report.records.items():
+            if any(entry.status != ChangeStatus.NO_CHANGE for entry in entries):
+                self.cache.invalidate(obj_type)
+
+    def build_work(self, configs: Dict[str, List[SnowflakeObject]], handlers: Dict[str, Any],
+                   inventory: Dict[str, Optional[Dict[str, Any]]]) -> List[Tuple[str, Any, SnowflakeObject, Any]]:
+        """Flatten configs into ``(obj_type, handler, obj, index)`` work items in config order"""
+        work = []
         for obj_type, objects in configs.items():
-            handler = self.handlers.get(obj_type)
+            handler = handlers.get(obj_type)
             if not handler:
                 self.logger.warning(f"No handler found for object type: {obj_type}")
                 continue
-
             for obj in objects:
-                try:
-                    # Check if object exists
-                    existing = handler.get_existing(obj.name)
-                    
-                    # Prepare change entry
-                    change_entry = ObjectChangeEntry(
-                        name=obj.name,
-                        type=obj_type,
-                        status=ChangeStatus.NO_CHANGE
-                    )
-                    
-                    if not existing:
-                        # Object does not exist, needs creation
-                        change_entry.status = ChangeStatus.CREATED
-                        if not dry_run:
-                            handler.create(obj, dry_run)
-                    else:
-                        # Object exists, check for differences
-                        differences = self.find_differences(obj, existing, handler)
-                        
-                        if differences:
-                            # Object has differences
-                            change_entry.status = ChangeStatus.UPDATED
-                            change_entry.differences = differences
-                            
-                            self.logger.warning(
-                                f"{obj_type.capitalize()} '{obj.name}' exists but has differences:"
-                            )
-                            for diff in differences:
-                                self.logger.warning(f"  - {diff}")
-                            
-                            self.logger.warning(
-                                f"Note: {obj_type.capitalize()} properties cannot be updated directly. "
-                                f"You would need to recreate the {obj_type} to apply these changes."
-                            )
-                    
-                    # Add change entry to report
-                    change_report.add_change(obj_type, change_entry)
-
-                except Exception as e:
-                    # Handle any errors during processing
-                    error_entry = ObjectChangeEntry(
-                        name=obj.name,
-                        type=obj_type,
-                        status=ChangeStatus.ERROR,
-                        error=str(e)
-                    )
-                    change_report.add_change(obj_type, error_entry)
-                    self.logger.error(f"Error processing {obj_type} '{obj.name}': {e}")
+                work.append((obj_type, handler, obj, inventory.get(obj_type)))
+        return work
+
+    def build_dependency_graph(self, work: List[Tuple[str, Any, SnowflakeObject, Any]]) -> DependencyGraph:
+        """Build a graph over work item positions from handler-declared dependencies"""
+        graph = DependencyGraph()
+        by_type: Dict[str, List[int]] = {}
+        by_name: Dict[Tuple[str, str], List[int]] = {}
+        for i, item in enumerate(work):
+            obj_type, handler, obj, _ = item
+            graph.add_node(i, item)
+            by_type.setdefault(obj_type, []).append(i)
+            by_name.setdefault((obj_type, handler.normalize_name(obj.name)), []).append(i)
+
+        for i, (obj_type, handler, obj, _) in enumerate(work):
+            for parent_type in handler.depends_on:
+                for parent in by_type.get(parent_type, []):
+                    graph.add_edge(i, parent)
+            for parent_type, parent_name in handler.get_dependencies(obj):
+                key = (parent_type, SnowflakeObjectHandler.normalize_name(parent_name))
+                for parent in by_name.get(key, []):
+                    graph.add_edge(i, parent)
+        return graph
+
+    def check_dependencies(self, work: List[Tuple[str, Any, SnowflakeObject, Any]], graph: DependencyGraph) -> None:
+        """Raise ``DependencyCycleError`` naming the objects of a dependency cycle, if there is one"""
+        try:
+            graph.levels()
+        except DependencyCycleError as e:
+            names = ', '.join(f"{work[i][0]} '{work[i][2].name}'" for i in e.nodes)
+            raise DependencyCycleError(f"Dependency cycle between {names}", e.nodes) from None
+
+    def dependency_failed_entry(self, item: Tuple[str, Any, SnowflakeObject, Any],
+                                parent: Tuple[str, Any, SnowflakeObject, Any]) -> ChangeRecord:
+        """Error entry for an object held back because a dependency failed"""
+        obj_type, _, obj, _ = item
+        parent_type, _, parent_obj, _ = parent
+        message = f"Skipped: depends on {parent_type} '{parent_obj.name}', which failed"
+        self.logger.error(f"{obj_type.capitalize()} '{obj.name}' {message[0].lower()}{message[1:]}")
+        return ChangeRecord(
+            name=obj.name,
+            type=obj_type,
+            status=ChangeStatus.ERROR,
+            error=message
+        )
+
+    def find_unchanged(self, work: List[Tuple[str, Any, SnowflakeObject, Any]]) -> Set[int]:
+        """Positions of objects whose config and remote state are unchanged since they were last in sync.
+
+        An object qualifies only if its config hash matches the recorded one
+        and its current remote fingerprint matches the one recorded with it;
+        new, renamed, edited, missing and drifted objects are always planned.
+        """
+        if not self.cache:
+            self.logger.warning("Changed-only planning needs the remote-state cache; planning every object")
+            return set()
+
+        applied: Dict[str, Dict[str, Tuple[str, Optional[str]]]] = {}
+        unchanged = {i for i, item in enumerate(work) if self.is_unchanged(item, applied)}
+        self.logger.info(f"Changed-only planning: skipping {len(unchanged)} of {len(work)} unchanged object(s)")
+        return unchanged
+
+    def is_unchanged(self, item: Tuple[str, Any, SnowflakeObject, Any],
+                     applied: Dict[str, Dict[str, Tuple[str, Optional[str]]]]) -> bool:
+        """Whether one object can be skipped; ``applied`` memoizes records per type"""
+        obj_type, handler, obj, index = item
+        if obj_type not in applied:
+            applied[obj_type] = self.cache.get_applied(obj_type)
+        name = handler.normalize_name(obj.name)
+        record = applied[obj_type].get(name)
+        existing = index.get(name) if index is not None else None
+        if record is None or existing is None:
+            return False
+        return record == (config_hash(obj_type, obj), self.remote_fingerprint(handler, existing))
+
+    def remote_fingerprint(self, handler: Any, existing: Any) -> str:
+        """Fingerprint of the fields the handler compares
+
+        Other properties, such as a warehouse's ``state`` or ``running``
+        queries, change without any drift from the config and are left out.
+        """
+        return fingerprint({
+            field: value for field in handler.get_comparator().fields
+            if (value := getattr(existing, field, None)) is not None
+        })
+
+    def unchanged_entry(self, item: Tuple[str, Any, SnowflakeObject, Any]) -> ChangeRecord:
+        """No-change entry for an object skipped by changed-only planning"""
+        obj_type, _, obj, _ = item
+        return ChangeRecord(name=obj.name, type=obj_type, status=ChangeStatus.NO_CHANGE)
+
+    def record_in_sync(self, work: List[Tuple[str, Any, SnowflakeObject, Any]],
+                       results: Dict[int, ChangeRecord], dry_run: bool = True) -> None:
+        """Store config hashes and fingerprints of objects that now match their config"""
+        if not self.cache:
+            return
+        by_type: Dict[str, Tuple[List[str], Dict[str, Tuple[str, Optional[str]]]]] = {}
+        for i, (obj_type, handler, obj, index) in enumerate(work):
+            name = handler.normalize_name(obj.name)
+            configured, in_sync = by_type.setdefault(obj_type, ([], {}))
+            configured.append(name)
+            status = results[i].status
+            if status == ChangeStatus.NO_CHANGE:
+                existing = index.get(name) if index is not None else None
+                fp = self.remote_fingerprint(handler, existing) if existing is not None else None
+                in_sync[name] = (config_hash(obj_type, obj), fp)
+            elif status == ChangeStatus.CREATED and not dry_run:
+                # Fingerprint is unknown until the next fetch, so it gets re-planned once
+                in_sync[name] = (config_hash(obj_type, obj), None)
+        for obj_type, (configured, in_sync) in by_type.items():
+            self.cache.record_applied(obj_type, in_sync, configured)
+
+    def apply_configuration(self, config_path: str, dry_run: bool = True,
+                            concurrency: int = 1, changed_only: bool = False) -> ChangeReport:
+        """Apply configurations from YAML and generate a comprehensive change report
+
+        The config is streamed: in a dry run each object is planned as soon as
+        it has been parsed, while later ones are still being read. Otherwise
+        only existing objects are fetched while streaming, and nothing is
+        created or altered until the whole config has loaded and validated,
+        so an invalid object leaves the account untouched. A dependency cycle
+        is rejected before anything is changed too. Objects with declared
+        dependencies are held back and applied afterwards in topological
+        waves of the dependency graph; an object whose dependency failed is
+        not attempted. With ``concurrency`` greater than one, work runs on a
+        bounded thread pool. With ``ddl_batch_size`` set, creates and alters
+        of objects without dependencies are compiled to SQL and submitted in
+        batches. Entries are still added to the report in configuration
+        order, so the output matches a serial run.
+
+        With ``changed_only``, objects whose config and remote state are
+        unchanged since the last run that found them in sync are reported as
+        ``NO_CHANGE`` without being planned.
+
+        With a ``report_sink``, each entry is also streamed to it as soon as
+        it is final (batched creates once their batch has run), followed by a
+        summary record.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if changed_only and not self.cache:
+            self.logger.warning("Changed-only planning needs the remote-state cache; planning every object")
+            changed_only = False
+
+        with tracing.start_trace(self.tracer, 'apply', config_path=config_path, dry_run=dry_run,
+                                 concurrency=concurrency) as span:
+            return trace_summary(span, self._apply_configuration(config_path, dry_run, concurrency, changed_only))
+
+    def _apply_configuration(self, config_path: str, dry_run: bool, concurrency: int,
+                             changed_only: bool) -> ChangeReport:
+        # Initialize change report
+        change_report = ChangeReport()
+        self.metrics = RunMetrics()
+        self.api.start_run(self.metrics)
+        
+        work: List[Tuple[str, Any, SnowflakeObject, Any]] = []
+        results: Dict[int, ChangeRecord] = {}
+        inventory: Dict[str, Optional[Dict[str, Any]]] = {}
+        applied: Dict[str, Dict[str, Tuple[str, Optional[str]]]] = {}
+        missing_handlers: Set[str] = set()
+        pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="snowflake-plan") if concurrency > 1 else None
+        ddl = [] if self.ddl_batch_size > 0 and not dry_run else None
+        deferred: List[int] = []
+
+        def decided(i: int, entry: ChangeRecord) -> ChangeRecord:
+            # A batched create or alter is only final once its batch has run
+            if ddl is not None and entry.status in (ChangeStatus.CREATED, ChangeStatus.UPDATED):
+                deferred.append(i)
+                return entry
+            return self.report_decided(i, entry)
+
+        def start(i: int) -> None:
+            item = work[i]
+            if pool is not None:
+                # Run in a copy of the current context so spans keep their parent
+                pending[i] = pool.submit(copy_context().run, self.process_object, *item, dry_run=dry_run, ddl=ddl)
+                if self.report_sink is not None:
+                    pending[i].add_done_callback(lambda future, i=i: decided(i, future.result()))
+            else:
+                results[i] = decided(i, self.process_object(*item, dry_run=dry_run, ddl=ddl))
+
+        try:
+            pending = {}
+            ready: List[int] = []
+            for obj_type, obj in self.iter_config(config_path):
+                handler = self.handlers.get(obj_type)
+                if not handler:
+                    if obj_type not in missing_handlers:
+                        missing_handlers.add(obj_type)
+                        self.logger.warning(f"No handler found for object type: {obj_type}")
+                    continue
+
+                # Fetch existing objects once per type instead of once per object
+                if obj_type not in inventory:
+                    inventory[obj_type] = self.fetch_index(obj_type, handler)
+
+                i = len(work)
+                item = (obj_type, handler, obj, inventory[obj_type])
+                work.append(item)
+
+                if changed_only and self.is_unchanged(item, applied):
+                    results[i] = self.report_decided(i, self.unchanged_entry(item))
+                elif handler.depends_on or handler.get_dependencies(obj):
+                    continue  # Scheduled with the dependency graph once everything is loaded
+                elif dry_run:
+                    start(i)
+                else:
+                    # Nothing is changed until the whole config has parsed and validated
+                    ready.append(i)
+
+            # A dependency cycle is an error in the config, so it is rejected before anything changes
+            graph = self.build_dependency_graph(work)
+            self.check_dependencies(work, graph)
+            for i in ready:
+                start(i)
+            for i, future in pending.items():
+                results[i] = future.result()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        # Creates and alters queued during planning go out in batches before any dependent runs
+        if ddl:
+            self.submit_ddl(ddl)
+        for i in sorted(deferred):
+            self.report_decided(i, results[i])
+
+        if changed_only:
+            skipped = sum(1 for entry in results.values() if entry.status == ChangeStatus.NO_CHANGE)
+            self.logger.info(f"Changed-only planning: skipped {skipped} of {len(work)} unchanged object(s)")
+
+        # Apply held-back objects in dependency waves; anything already planned is reused
+        results = WaveScheduler(concurrency).run(
+            graph,
+            task=lambda i, item: results[i] if i in results else self.report_decided(
+                i, self.process_object(*item, dry_run=dry_run)
+            ),
+            failed=lambda entry: entry.status == ChangeStatus.ERROR,
+            skip=lambda i, item, parent: self.report_decided(i, self.dependency_failed_entry(item, work[parent]))
+        )
+
+        with self.metrics.phase('report'), tracing.span('report'):
+            # Report in configuration order to keep the output deterministic
+            type_order = {obj_type: rank for rank, obj_type in enumerate(self.object_types)}
+            for i in sorted(range(len(work)), key=lambda i: (type_order.get(work[i][0], len(type_order)), i)):
+                change_report.add_change(work[i][0], results[i])
+
+            self.record_in_sync(work, results, dry_run)
+            if not dry_run:
+                self.invalidate_cache(change_report)
+        change_report.metrics = self.metrics.to_dict()
+        self.report_finished(change_report)
         
         # Log summary
         self.logger.info("Change Report Summary:")
@@ -132,6 +553,21 @@ class SnowflakeState:
         
         return change_report
 
+def trace_outcome(span: Any, entry: ChangeRecord) -> ChangeRecord:
+    """Record an object's change status on its span, marking errors"""
+    span.set_attribute('change', entry.status.value)
+    if entry.status == ChangeStatus.ERROR:
+        span.set_status(tracing.STATUS_ERROR, entry.error)
+    return entry
+
+def trace_summary(span: Any, change_report: ChangeReport) -> ChangeReport:
+    """Record a run's totals on its root span"""
+    span.set_attribute('objects', change_report.total_objects)
+    span.set_attribute('errors', change_report.objects_with_errors)
+    if change_report.objects_with_errors:
+        span.set_status(tracing.STATUS_ERROR, f"{change_report.objects_with_errors} object(s) failed")
+    return change_report
+
 # Import handlers at the end to avoid circular imports
 from ..handlers.database import DatabaseHandler
 from ..handlers.warehouse import WarehouseHandler
@@ -0,0 +1,195 @@
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+import math
+import os
+import tempfile
+import threading
+import time
+
+# Upper bounds (seconds) of the API latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+def percentile(ordered, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+class RunMetrics:
+    """Per-run wall time by phase and API call latencies by handler and operation.
+
+    Phase time is summed over every timed section, so with concurrent
+    workers a phase can exceed the run's wall time. Latency samples are
+    kept as 8-byte floats to report exact percentiles. Gauges keep every
+    value set during the run with its offset from the start of the run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._phases: Dict[str, list] = {}
+        self._calls: Dict[Tuple[str, str], Tuple[array, list]] = {}
+        self._gauges: Dict[str, list] = {}
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            totals = self._phases.setdefault(phase, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time a section of work and add it to ``phase``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - start)
+
+    def record_call(self, handler: str, operation: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            samples, counts = self._calls.setdefault((handler, operation), (array('d'), [0, 0]))
+            samples.append(seconds)
+            if error:
+                counts[0] += 1
+
+    def record_retry(self, handler: str, operation: str) -> None:
+        """Count a failed call that is about to be repeated"""
+        with self._lock:
+            self._calls.setdefault((handler, operation), (array('d'), [0, 0]))[1][1] += 1
+
+    @contextmanager
+    def timed(self, handler: str, operation: str) -> Iterator[None]:
+        """Time one API call; an exception counts as an error and is re-raised"""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record_call(handler, operation, time.perf_counter() - start, error=True)
+            raise
+        self.record_call(handler, operation, time.perf_counter() - start)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a gauge such as ``concurrency_limit``"""
+        with self._lock:
+            self._gauges.setdefault(name, []).append((time.perf_counter() - self._started, value))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the run for the ``metrics`` section of a change report"""
+        with self._lock:
+            phases = {name: {'seconds': seconds, 'count': count} for name, (seconds, count) in self._phases.items()}
+            calls = {key: (sorted(samples), *counts) for key, (samples, counts) in self._calls.items()}
+            gauges = {name: list(samples) for name, samples in self._gauges.items()}
+
+        api_calls: Dict[str, Dict[str, Any]] = {}
+        for (handler, operation), (ordered, errors, retries) in sorted(calls.items()):
+            total = sum(ordered)
+            api_calls.setdefault(handler, {})[operation] = {
+                'count': len(ordered),
+                'errors': errors,
+                'retries': retries,
+                'sum': total,
+                'mean': total / len(ordered) if ordered else 0.0,
+                'p50': percentile(ordered, 0.50),
+                'p95': percentile(ordered, 0.95),
+                'p99': percentile(ordered, 0.99),
+                'max': ordered[-1] if ordered else 0.0,
+                # Cumulative counts, as in an OpenMetrics histogram
+                'buckets': {str(bound): bisect_right(ordered, bound) for bound in LATENCY_BUCKETS},
+            }
+        return {
+            'wall_seconds': time.perf_counter() - self._started,
+            'phases': phases,
+            'api_calls': api_calls,
+            'gauges': {
+                name: {
+                    'value': samples[-1][1],
+                    'min': min(value for _, value in samples),
+                    'max': max(value for _, value in samples),
+                    # [seconds since the run started, value] for every change
+                    'samples': [[seconds, value] for seconds, value in samples],
+                }
+                for name, samples in sorted(gauges.items())
+            },
+        }
+
+def _label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_openmetrics(metrics: Dict[str, Any], prefix: str = 'snowmaker') -> str:
+    """Render a report's ``metrics`` section in the OpenMetrics text format"""
+    lines = [
+        f"# TYPE {prefix}_run_seconds gauge",
+        f"# UNIT {prefix}_run_seconds seconds",
+        f"# HELP {prefix}_run_seconds Wall time of the last run.",
+        f"{prefix}_run_seconds {metrics.get('wall_seconds', 0.0)}",
+        f"# TYPE {prefix}_phase_seconds gauge",
+        f"# UNIT {prefix}_phase_seconds seconds",
+        f"# HELP {prefix}_phase_seconds Time spent in each phase of the last run.",
+    ]
+    for phase, totals in metrics.get('phases', {}).items():
+        lines.append(f'{prefix}_phase_seconds{{phase="{_label(phase)}"}} {totals["seconds"]}')
+
+    histogram = f"{prefix}_api_call_seconds"
+    lines += [
+        f"# TYPE {histogram} histogram",
+        f"# UNIT {histogram} seconds",
+        f"# HELP {histogram} Latency of Snowflake API calls in the last run.",
+    ]
+    for handler, operations in metrics.get('api_calls', {}).items():
+        for operation, stats in operations.items():
+            labels = f'handler="{_label(handler)}",operation="{_label(operation)}"'
+            for bound, count in stats['buckets'].items():
+                lines.append(f'{histogram}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{histogram}_bucket{{{labels},le="+Inf"}} {stats["count"]}')
+            lines.append(f'{histogram}_count{{{labels}}} {stats["count"]}')
+            lines.append(f'{histogram}_sum{{{labels}}} {stats["sum"]}')
+
+    # Each run overwrites the file, so per-run error counts are gauges
+    errors = f"{prefix}_api_call_errors"
+    lines += [
+        f"# TYPE {errors} gauge",
+        f"# HELP {errors} Failed Snowflake API calls in the last run.",
+    ]
+    for handler, operations in metrics.get('api_calls', {}).items():
+        for operation, stats in operations.items():
+            labels = f'handler="{_label(handler)}",operation="{_label(operation)}"'
+            lines.append(f'{errors}{{{labels}}} {stats["errors"]}')
+
+    retries = f"{prefix}_api_call_retries"
+    lines += [
+        f"# TYPE {retries} gauge",
+        f"# HELP {retries} Snowflake API calls retried after a transient failure in the last run.",
+    ]
+    for handler, operations in metrics.get('api_calls', {}).items():
+        for operation, stats in operations.items():
+            labels = f'handler="{_label(handler)}",operation="{_label(operation)}"'
+            lines.append(f'{retries}{{{labels}}} {stats.get("retries", 0)}')
+
+    for name, stats in metrics.get('gauges', {}).items():
+        gauge = f"{prefix}_{name}"
+        lines += [
+            f"# TYPE {gauge} gauge",
+            f"# HELP {gauge} Final, lowest and highest {name} of the last run.",
+        ]
+        for stat, key in (('last', 'value'), ('min', 'min'), ('max', 'max')):
+            lines.append(f'{gauge}{{stat="{stat}"}} {stats[key]}')
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+def write_openmetrics(metrics: Dict[str, Any], path: str, prefix: str = 'snowmaker') -> None:
+    """Atomically write metrics to ``path`` so a textfile collector never reads a partial file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(format_openmetrics(metrics, prefix))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Optional
+
+from . import tracing
+from .concurrency import AdaptiveConcurrency
+
+# HTTP statuses Snowflake returns for throttled or briefly unavailable requests
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed call may succeed if repeated unchanged.
+
+    Throttling (429), gateway and availability errors (502/503/504) and
+    network-level failures are retryable; anything else, including plain
+    500s, is treated as a real failure.
+    """
+    status = getattr(error, 'status', None)
+    if status is None:
+        status = getattr(error, 'status_code', None)
+    if status is not None:
+        try:
+            return int(status) in RETRYABLE_STATUSES
+        except (TypeError, ValueError):
+            return False
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the service asked us to wait, from a ``Retry-After`` header if the error carries one"""
+    headers = getattr(error, 'headers', None)
+    if not headers:
+        return None
+    try:
+        value = headers.get('Retry-After') or headers.get('retry-after')
+        return float(value) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out call slots at ``rate`` per second.
+
+    ``reserve`` takes a token immediately and returns how long the caller
+    must wait before using it, so waiting callers are served in arrival
+    order and sync and async callers can share one bucket.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before it may be used"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+class RetryBudget:
+    """Caps retries at ``minimum`` plus ``ratio`` times the calls made so far.
+
+    Shared by all calls of a run, so a broad outage stops being retried
+    after a bounded number of extra requests instead of multiplying load.
+    """
+
+    def __init__(self, ratio: float = 0.1, minimum: int = 10):
+        if ratio < 0 or minimum < 0:
+            raise ValueError(f"ratio and minimum must not be negative, got {ratio} and {minimum}")
+        self.ratio = ratio
+        self.minimum = minimum
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.retries = 0
+            self.exhausted = 0
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, or return ``False`` if none is left"""
+        with self._lock:
+            if self.retries < self.minimum + self.ratio * self.calls:
+                self.retries += 1
+                return True
+            self.exhausted += 1
+            return False
+
+class ApiCallPolicy:
+    """Rate limiting and retries shared by every Snowflake API call of a run.
+
+    Each attempt first takes a slot from the token bucket (when
+    ``rate_limit`` is set), then runs timed as one API call. Retryable
+    failures are repeated up to ``max_attempts`` times with full-jitter
+    exponential backoff, honouring ``Retry-After``, while the run's
+    ``RetryBudget`` lasts. Only idempotent calls should go through it.
+    Time spent waiting is added to the ``throttle`` and ``backoff`` phases.
+
+    With ``concurrency``, each attempt also holds a slot of that adaptive
+    in-flight limit, which learns from the attempt's latency and outcome;
+    the limit's value over the run is the ``concurrency_limit`` gauge.
+    """
+
+    def __init__(self, rate_limit: Optional[float] = None, burst: float = 1.0, max_attempts: int = 5,
+                 base_delay: float = 0.1, max_delay: float = 10.0, budget: Optional[RetryBudget] = None,
+                 seed: Optional[int] = None, concurrency: Optional[AdaptiveConcurrency] = None):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+        self.concurrency = concurrency
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def start_run(self, metrics: Any = None) -> None:
+        """Refill the retry budget at the start of a run and record the starting concurrency limit"""
+        self.budget.reset()
+        if self.concurrency is not None and metrics is not None:
+            metrics.set_gauge('concurrency_limit', self.concurrency.current)
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """Delay before retry number ``attempt`` (from 1): uniform in ``[0, base * 2**(attempt-1)]``, capped"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        with self._random_lock:
+            delay = self._random.uniform(0, ceiling)
+        requested = retry_after(error) if error is not None else None
+        if requested is not None:
+            delay = max(delay, min(requested, self.max_delay))
+        return delay
+
+    def call(self, metrics: Any, handler: str, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` under the rate limit, retrying retryable failures"""
+        self.budget.record_call()
+        attempt = 1
+        while True:
+            if self.bucket is not None:
+                self._wait(metrics, 'throttle', self.bucket.reserve())
+            try:
+                return self._attempt(metrics, handler, operation, fn, args)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, metrics, handler, operation)
+                if delay is None:
+                    raise
+            with tracing.span('backoff', handler=handler, operation=operation, attempt=attempt):
+                self._wait(metrics, 'backoff', delay)
+            attempt += 1
+
+    async def call_async(self, metrics: Any, handler: str, operation: str,
+                         fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Async counterpart of ``call``; waits without blocking the event loop"""
+        self.budget.record_call()
+        attempt = 1
+        while True:
+            if self.bucket is not None:
+                await self._wait_async(metrics, 'throttle', self.bucket.reserve())
+            try:
+                return await self._attempt_async(metrics, handler, operation, fn, args)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, metrics, handler, operation)
+                if delay is None:
+                    raise
+            with tracing.span('backoff', handler=handler, operation=operation, attempt=attempt):
+                await self._wait_async(metrics, 'backoff', delay)
+            attempt += 1
+
+    def _attempt(self, metrics: Any, handler: str, operation: str, fn: Callable[..., Any], args: tuple) -> Any:
+        limiter = self.concurrency
+        if limiter is None:
+            with _timed(metrics, handler, operation):
+                return fn(*args)
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            with _timed(metrics, handler, operation):
+                result = fn(*args)
+        except BaseException as e:
+            self._release(metrics, handler, operation, None, is_retryable(e))
+            raise
+        self._release(metrics, handler, operation, time.perf_counter() - start, False)
+        return result
+
+    async def _attempt_async(self, metrics: Any, handler: str, operation: str,
+                             fn: Callable[..., Awaitable[Any]], args: tuple) -> Any:
+        limiter = self.concurrency
+        if limiter is None:
+            with _timed(metrics, handler, operation):
+                return await fn(*args)
+        await limiter.acquire_async()
+        start = time.perf_counter()
+        try:
+            with _timed(metrics, handler, operation):
+                result = await fn(*args)
+        except BaseException as e:
+            self._release(metrics, handler, operation, None, is_retryable(e))
+            raise
+        self._release(metrics, handler, operation, time.perf_counter() - start, False)
+        return result
+
+    def _release(self, metrics: Any, handler: str, operation: str, latency: Optional[float],
+                 throttled: bool) -> None:
+        limit = self.concurrency.release((handler, operation), latency, throttled)
+        if limit is not None and metrics is not None:
+            metrics.set_gauge('concurrency_limit', limit)
+
+    def _retry_delay(self, error: Exception, attempt: int, metrics: Any,
+                     handler: str, operation: str) -> Optional[float]:
+        """Backoff before the next attempt, or ``None`` if the error should be raised"""
+        if attempt >= self.max_attempts or not is_retryable(error):
+            return None
+        if not self.budget.try_spend():
+            self.logger.warning(f"Retry budget exhausted; not retrying {handler} {operation}: {error}")
+            return None
+        if metrics is not None:
+            metrics.record_retry(handler, operation)
+        delay = self.backoff(attempt, error)
+        self.logger.warning(
+            f"{handler} {operation} failed ({error}); retry {attempt} of {self.max_attempts - 1} in {delay:.2f}s"
+        )
+        return delay
+
+    @staticmethod
+    def _wait(metrics: Any, phase: str, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+            if metrics is not None:
+                metrics.add_phase(phase, seconds)
+
+    @staticmethod
+    async def _wait_async(metrics: Any, phase: str, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+            if metrics is not None:
+                metrics.add_phase(phase, seconds)
+
+def _timed(metrics: Any, handler: str, operation: str):
+    return metrics.timed(handler, operation) if metrics is not None else nullcontext()
@@ -0,0 +1,104 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, IO, List, Optional, Tuple, Union
+from ..models.change_report import ChangeRecord, ChangeReport, ObjectChangeEntry
+from ..models.differences import DifferenceRecord
+
+logger = logging.getLogger(__name__)
+
+class ChangeReportWriter:
+    """Stream change entries to a JSON Lines file as soon as they are decided.
+
+    Each ``change`` record is one entry plus its ``index`` in the work
+    list; entries arrive in completion order, which under concurrency
+    differs from configuration order. A final ``summary`` record carries
+    the report totals, type order and metrics. Lines are flushed as they
+    are written, so the file can be tailed and survives a crash up to the
+    last decided object.
+    """
+
+    def __init__(self, output: Union[str, IO]):
+        self._owns_file = isinstance(output, str)
+        # Line buffering flushes every record
+        self._file: IO = open(output, 'w', buffering=1) if self._owns_file else output
+        self._lock = threading.Lock()
+        self.entries_written = 0
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str, separators=(',', ':')) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def write_entry(self, entry: Union[ChangeRecord, ObjectChangeEntry], index: Optional[int] = None) -> None:
+        """Append one decided entry; safe to call from worker threads"""
+        self._write({'record': 'change', 'index': index, **entry.model_dump()})
+        with self._lock:
+            self.entries_written += 1
+
+    def write_summary(self, report: ChangeReport) -> None:
+        """Append the closing record with the run totals"""
+        summary = report.to_dict()
+        del summary['changes']
+        summary['record'] = 'summary'
+        summary['types'] = list(report.records)
+        self._write(summary)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
+
+    def __enter__(self) -> 'ChangeReportWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+def load_change_report(path: str) -> ChangeReport:
+    """Rebuild a ``ChangeReport`` from a stream written by ``ChangeReportWriter``.
+
+    Entries are put back in configuration order. A stream cut short by a
+    crash loads with whatever entries were written (a partial last line is
+    ignored) and without metrics.
+    """
+    entries: List[Tuple[int, int, str, ChangeRecord]] = []
+    summary: Optional[Dict[str, Any]] = None
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if not line.endswith("\n"):
+                    logger.warning(f"Ignoring truncated last line of {path}")
+                    break
+                raise ValueError(f"Invalid change record on line {number} of {path}")
+            kind = record.pop('record', 'change')
+            if kind == 'summary':
+                summary = record
+                continue
+            index = record.pop('index', None)
+            differences = record.get('differences')
+            if differences is not None:
+                differences = [DifferenceRecord.from_model(difference) for difference in differences]
+            entry = ChangeRecord(record['name'], record['type'], record['status'], differences, record.get('error'))
+            entries.append((number if index is None else index, number, entry.type, entry))
+
+    if summary is None:
+        logger.warning(f"{path} has no summary record; the run did not finish")
+    type_order = {obj_type: rank for rank, obj_type in enumerate(summary['types'] if summary else [])}
+    first_seen: Dict[str, int] = {}
+    for _, _, obj_type, _ in entries:
+        first_seen.setdefault(obj_type, len(first_seen))
+
+    report = ChangeReport()
+    entries.sort(key=lambda e: (type_order.get(e[2], len(type_order) + first_seen[e[2]]), e[0], e[1]))
+    for _, _, obj_type, entry in entries:
+        report.add_change(obj_type, entry)
+    if summary is not None:
+        report.metrics = summary.get('metrics')
+    return report
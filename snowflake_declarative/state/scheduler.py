@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DependencyCycleError(ValueError):
+    """Raised when object dependencies form a cycle"""
+
+    def __init__(self, message: str, nodes: Optional[List[Hashable]] = None):
+        super().__init__(message)
+        # Nodes on the cycle (or cycles), in insertion order
+        self.nodes = list(nodes or ())
+
+class DependencyGraph:
+    """Directed acyclic graph of objects keyed by ``(object_type, name)``"""
+
+    def __init__(self):
+        self.nodes: Dict[Hashable, Any] = {}
+        self.parents: Dict[Hashable, Set[Hashable]] = {}
+        self._order: Optional[Dict[Hashable, int]] = None
+        self._levels: Optional[List[List[Hashable]]] = None
+
+    def add_node(self, key: Hashable, payload: Any = None) -> None:
+        self._order = self._levels = None
+        self.nodes[key] = payload
+        self.parents.setdefault(key, set())
+
+    def add_edge(self, child: Hashable, parent: Hashable) -> None:
+        """Record that ``child`` may only run once ``parent`` has succeeded"""
+        if parent == child:
+            return
+        self._levels = None
+        self.parents.setdefault(child, set()).add(parent)
+
+    def failed_parent(self, key: Hashable, failures: Set[Hashable]) -> Optional[Hashable]:
+        """Return the first parent of ``key`` (in insertion order) that is in ``failures``"""
+        failed = self.parents.get(key, set()) & failures
+        if not failed:
+            return None
+        if self._order is None:
+            self._order = {node: i for i, node in enumerate(self.nodes)}
+        return min(failed, key=lambda node: self._order.get(node, -1))
+
+    def levels(self) -> List[List[Hashable]]:
+        """Group nodes into topological waves, preserving insertion order.
+
+        Parents that are not nodes of the graph (e.g. objects that already
+        exist and are not managed by this config) are ignored. The waves are
+        computed once, so callers can check for cycles before running anything.
+        """
+        if self._levels is not None:
+            return self._levels
+        remaining = {
+            key: {p for p in self.parents.get(key, ()) if p in self.nodes}
+            for key in self.nodes
+        }
+        waves = []
+        done: Set[Hashable] = set()
+        while remaining:
+            wave = [key for key, parents in remaining.items() if parents <= done]
+            if not wave:
+                cycle = self._cycle_nodes(remaining)
+                raise DependencyCycleError(f"Dependency cycle between: {[str(key) for key in cycle]}", cycle)
+            for key in wave:
+                del remaining[key]
+            done.update(wave)
+            waves.append(wave)
+        self._levels = waves
+        return waves
+
+    def _cycle_nodes(self, remaining: Dict[Hashable, Set[Hashable]]) -> List[Hashable]:
+        """Drop nodes that merely depend on a cycle, leaving those on one"""
+        remaining = {key: set(parents) for key, parents in remaining.items()}
+        while True:
+            needed = set().union(*remaining.values())
+            leaves = [key for key in remaining if key not in needed]
+            if not leaves:
+                return [key for key in self.nodes if key in remaining]
+            for key in leaves:
+                del remaining[key]
+
+class WaveScheduler:
+    """Run graph nodes wave by wave, holding back dependents of failed nodes"""
+
+    def __init__(self, concurrency: int = 1):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.concurrency = concurrency
+
+    def run(self, graph: DependencyGraph, task: Callable[[Hashable, Any], Any],
+            failed: Callable[[Any], bool],
+            skip: Callable[[Hashable, Any, Hashable], Any]) -> Dict[Hashable, Any]:
+        """Run ``task(key, payload)`` for every node and return results by key.
+
+        Nodes with a parent for which ``failed(result)`` is true are not run;
+        ``skip(key, payload, parent)`` provides their result instead.
+        """
+        results: Dict[Hashable, Any] = {}
+        failures: Set[Hashable] = set()
+        pool: Optional[ThreadPoolExecutor] = None
+        if self.concurrency > 1:
+            pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="snowflake-apply")
+        try:
+            for wave in graph.levels():
+                runnable = []
+                for key in wave:
+                    blocked_by = graph.failed_parent(key, failures)
+                    if blocked_by is not None:
+                        results[key] = skip(key, graph.nodes[key], blocked_by)
+                        failures.add(key)
+                    else:
+                        runnable.append(key)
+
+                if pool is None:
+                    wave_results = [task(key, graph.nodes[key]) for key in runnable]
+                else:
+                    # Each task runs in a copy of the caller's context (e.g. its tracing span)
+                    futures = [pool.submit(copy_context().run, task, key, graph.nodes[key]) for key in runnable]
+                    wave_results = [future.result() for future in futures]
+
+                for key, result in zip(runnable, wave_results):
+                    results[key] = result
+                    if failed(result):
+                        failures.add(key)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return results
@@ -0,0 +1,281 @@
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+
+STATUS_OK = 'OK'
+STATUS_ERROR = 'ERROR'
+
+TRACE_FORMATS = ('jsonl', 'chrome')
+
+# The innermost open span of the running thread or asyncio task
+_current_span: ContextVar[Optional['Span']] = ContextVar('snowflake_declarative_span', default=None)
+
+def _lane() -> Tuple[int, Optional[int]]:
+    """Thread and asyncio task a span runs on; spans sharing a lane nest strictly"""
+    task = None
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is not None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            pass
+    return threading.get_ident(), id(task) if task is not None else None
+
+class Span:
+    """One timed operation in a trace. Entering it makes it the parent of spans started inside"""
+
+    __slots__ = ('tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'start_ns', 'end_ns',
+                 'attributes', 'status', 'status_message', 'thread_name', 'lane', '_token')
+
+    def __init__(self, tracer: 'Tracer', name: str, parent: Optional['Span'] = None,
+                 attributes: Optional[Dict[str, Any]] = None, start_ns: Optional[int] = None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_ns = time.perf_counter_ns() if start_ns is None else start_ns
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.status = STATUS_OK
+        self.status_message: Optional[str] = None
+        self.thread_name = threading.current_thread().name
+        self.lane = _lane()
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: str, message: Optional[str] = None) -> None:
+        self.status = status
+        self.status_message = message
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """Close the span and hand it to the tracer's exporters; later calls are ignored"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.perf_counter_ns() if end_ns is None else end_ns
+        self.tracer.export(self)
+
+    def __enter__(self) -> 'Span':
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.set_status(STATUS_ERROR, str(exc))
+            self.attributes['error.type'] = exc_type.__name__
+        self.end()
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready record with wall-clock start and end times"""
+        offset = self.tracer.epoch_offset_ns
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_time_unix_nano': self.start_ns + offset,
+            'end_time_unix_nano': self.end_ns + offset,
+            'duration_ms': (self.end_ns - self.start_ns) / 1e6,
+            'thread': self.thread_name,
+            'attributes': self.attributes,
+            'status': {'code': self.status, 'message': self.status_message},
+        }
+
+class _NoopSpan:
+    """Stands in for a span when nothing is being traced"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_status(self, status: str, message: Optional[str] = None) -> None:
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+NOOP_SPAN = _NoopSpan()
+
+class SpanExporter(ABC):
+    """Receives every finished span; ``export`` may be called from any thread"""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class JsonlSpanExporter(SpanExporter):
+    """Append each finished span to a file as one JSON object per line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: IO = open(path, 'w')
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str, separators=(',', ':')) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+class ChromeTraceExporter(SpanExporter):
+    """Write spans as Chrome trace events, for ``chrome://tracing`` or Perfetto.
+
+    Each thread, and each asyncio task, gets its own track so concurrent
+    spans never overlap on one. Events are streamed as a JSON array; the
+    closing bracket is written by ``close``, though viewers accept the
+    file without it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: IO = open(path, 'w')
+        self._file.write("[\n")
+        self._pid = os.getpid()
+        self._tids: Dict[Tuple[int, Optional[int]], int] = {}
+        self._first = True
+
+    def _write(self, event: Dict[str, Any]) -> None:
+        self._file.write(("" if self._first else ",\n") + json.dumps(event, default=str, separators=(',', ':')))
+        self._first = False
+
+    def export(self, span: Span) -> None:
+        args = dict(span.attributes, span_id=span.span_id, parent_id=span.parent_id)
+        if span.status != STATUS_OK:
+            args.update(status=span.status, status_message=span.status_message)
+        start_us = (span.start_ns + span.tracer.epoch_offset_ns) / 1000
+        with self._lock:
+            tid = self._tids.get(span.lane)
+            if tid is None:
+                tid = self._tids[span.lane] = len(self._tids) + 1
+                track = span.thread_name if span.lane[1] is None else f"{span.thread_name} task {tid}"
+                self._write({'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': track}})
+            self._write({
+                'name': span.name,
+                'cat': span.status.lower(),
+                'ph': 'X',
+                'ts': start_us,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': self._pid,
+                'tid': tid,
+                'args': args,
+            })
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.write("\n]\n")
+            self._file.close()
+
+def open_exporter(path: str, trace_format: Optional[str] = None) -> SpanExporter:
+    """Exporter for ``path``; the format defaults to Chrome for ``.json`` files and JSONL otherwise"""
+    if trace_format is None:
+        trace_format = 'chrome' if path.endswith('.json') else 'jsonl'
+    if trace_format == 'chrome':
+        return ChromeTraceExporter(path)
+    if trace_format == 'jsonl':
+        return JsonlSpanExporter(path)
+    raise ValueError(f"Unknown trace format {trace_format!r}; expected one of {', '.join(TRACE_FORMATS)}")
+
+class Tracer:
+    """Creates spans and passes finished ones to its exporters"""
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        self.exporters = list(exporters or [])
+        # Spans are timed on the monotonic clock and reported in wall-clock time
+        self.epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    def start_span(self, name: str, **attributes: Any) -> Span:
+        """A span under the current one (or a new trace); use it as a context manager to activate it"""
+        return Span(self, name, _current_span.get(), attributes)
+
+    def export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    def close(self) -> None:
+        for exporter in self.exporters:
+            exporter.close()
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+def start_trace(tracer: Optional[Tracer], name: str, **attributes: Any):
+    """Open a span on ``tracer``, or do nothing when there is no tracer"""
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, **attributes)
+
+def span(name: str, **attributes: Any):
+    """Child span of the current span; a no-op outside a trace, so hooks cost almost nothing untraced"""
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.tracer, name, parent, attributes)
+
+def record_span(name: str, start: float, end: float, **attributes: Any) -> None:
+    """Add an already finished child span from ``time.perf_counter()`` readings"""
+    parent = _current_span.get()
+    if parent is not None:
+        Span(parent.tracer, name, parent, attributes, start_ns=int(start * 1e9)).end(int(end * 1e9))
+
+def _object_name(args: tuple) -> Optional[str]:
+    if not args:
+        return None
+    target = args[0]
+    return target if isinstance(target, str) else getattr(target, 'name', None)
+
+def traced(operation: str) -> Callable[[Callable], Callable]:
+    """Wrap a handler method (sync or async) in a ``<Handler>.<operation>`` span"""
+    def decorate(func: Callable) -> Callable:
+        if getattr(func, '__traced__', False):
+            return func
+
+        def open_span(handler, args) -> Any:
+            parent = _current_span.get()
+            if parent is None:
+                return NOOP_SPAN
+            attributes = {'handler': type(handler).__name__, 'operation': operation}
+            name = _object_name(args)
+            if name is not None:
+                attributes['object_name'] = name
+            return Span(parent.tracer, f"{type(handler).__name__}.{operation}", parent, attributes)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(self, *args, **kwargs):
+                with open_span(self, args):
+                    return await func(self, *args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                with open_span(self, args):
+                    return func(self, *args, **kwargs)
+        wrapper.__traced__ = True
+        return wrapper
+    return decorate
+
+def trace_methods(cls: type) -> None:
+    """Wrap the ``traced_methods`` that ``cls`` itself defines in spans"""
+    for operation in cls.traced_methods:
+        func = cls.__dict__.get(operation)
+        if callable(func):
+            setattr(cls, operation, traced(operation)(func))
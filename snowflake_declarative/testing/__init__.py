@@ -0,0 +1,8 @@
+from .fake_root import (
+    FakeConnection, FakeCursor, FakeResource, FakeRoot, FakeSession, FakeSnowflakeError, parse_properties
+)
+
+__all__ = [
+    'FakeConnection', 'FakeCursor', 'FakeResource', 'FakeRoot', 'FakeSession', 'FakeSnowflakeError',
+    'parse_properties',
+]
@@ -0,0 +1,461 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import collections
+import random
+import re
+import threading
+import time
+
+class FakeSnowflakeError(Exception):
+    """Error raised by the fake for injected failures and invalid requests"""
+
+    def __init__(self, message: str, status: int = 500):
+        super().__init__(message)
+        self.status = status
+
+class FakeResource(SimpleNamespace):
+    """An object returned by a fake collection, shaped like an SDK model"""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={getattr(self, 'name', None)!r})"
+
+def _mode_value(mode: Any) -> str:
+    """Accept ``CreateMode`` members or their string values"""
+    return str(getattr(mode, 'value', mode) or 'errorIfExists')
+
+def _like_regex(pattern: str) -> 're.Pattern':
+    """Translate a case-insensitive SQL LIKE pattern (``%``, ``_``, ``\\`` escapes) to a regex"""
+    parts, escaped = [], False
+    for char in pattern:
+        if escaped:
+            parts.append(re.escape(char))
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts), re.IGNORECASE | re.DOTALL)
+
+class FakeCollection:
+    """In-memory stand-in for ``root.databases`` / ``root.warehouses``.
+
+    Objects are stored by upper-cased name in insertion order. Every call
+    goes through the owning ``FakeRoot``, which applies the configured
+    latency, jitter and error injection and counts the call.
+    """
+
+    def __init__(self, root: 'FakeRoot', kind: str, aliases: Optional[Dict[str, str]] = None):
+        self._root = root
+        self.kind = kind
+        # SQL parameter name -> attribute name, e.g. WAREHOUSE_SIZE -> size
+        self.aliases = aliases or {}
+        self._objects: Dict[str, FakeResource] = {}
+        self._by_length: Dict[int, Set[str]] = collections.defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, name: str) -> bool:
+        return name.strip().upper() in self._objects
+
+    def __getitem__(self, name: str) -> 'FakeResourceRef':
+        return FakeResourceRef(self, name)
+
+    def names(self) -> List[str]:
+        """Names of all stored objects, without simulating an API call"""
+        return [obj.name for obj in self._objects.values()]
+
+    def add(self, name: str, **properties: Any) -> FakeResource:
+        """Seed an object directly, without simulating an API call"""
+        key = name.strip().upper()
+        obj = FakeResource(name=key, **{k: v for k, v in properties.items() if v is not None})
+        with self._root._lock:
+            if key not in self._objects:
+                self._by_length[len(key)].add(key)
+            self._objects[key] = obj
+        return obj
+
+    def get(self, name: str) -> Optional[FakeResource]:
+        """The stored object (not a copy) with the given name, without simulating an API call"""
+        return self._objects.get(name.strip().upper())
+
+    # SDK-compatible API
+
+    def iter(self, like: Optional[str] = None, **kwargs: Any) -> Iterator[FakeResource]:
+        self._root._call(f"{self.kind}.iter")
+        with self._root._lock:
+            if like is None:
+                matches = list(self._objects.values())
+            elif '%' not in like and '\\' not in like:
+                # Without % every match has the pattern's length
+                regex = _like_regex(like)
+                matches = [self._objects[key] for key in self._by_length.get(len(like), ())
+                           if regex.fullmatch(key)]
+            else:
+                regex = _like_regex(like)
+                matches = [obj for key, obj in self._objects.items() if regex.fullmatch(key)]
+            return iter([FakeResource(**vars(obj)) for obj in matches])
+
+    def create(self, obj: Any, mode: Any = None, clone: Any = None, **kwargs: Any) -> 'FakeResourceRef':
+        self._root._call(f"{self.kind}.create", obj.name)
+        # ``clone`` is a source name or an SDK ``Clone``; Time Travel is not simulated
+        source = getattr(clone, 'source', clone)
+        self._create(self._properties(obj), _mode_value(mode), source)
+        return self[obj.name]
+
+    def iter_async(self, like: Optional[str] = None, **kwargs: Any) -> Future:
+        return self._root._submit(lambda: list(self.iter(like=like)))
+
+    def create_async(self, obj: Any, mode: Any = None, clone: Any = None, **kwargs: Any) -> Future:
+        return self._root._submit(self.create, obj, mode, clone)
+
+    # Shared by the SDK API and the SQL cursor
+
+    def _properties(self, obj: Any) -> Dict[str, Any]:
+        properties = {k: v for k, v in vars(obj).items() if not k.startswith('_') and v is not None}
+        return {self.aliases.get(k, k): v for k, v in properties.items()}
+
+    def _create(self, properties: Dict[str, Any], mode: str, clone: Optional[str] = None) -> None:
+        key = properties['name'].strip().upper()
+        with self._root._lock:
+            if key in self._objects:
+                if mode == 'ifNotExists':
+                    return
+                if mode != 'orReplace':
+                    raise FakeSnowflakeError(f"Object '{key}' already exists", status=409)
+            if clone is not None:
+                source = self._objects.get(clone.strip().upper())
+                if source is None:
+                    raise FakeSnowflakeError(f"{self.kind} '{clone}' does not exist", status=404)
+                # A clone starts with its source's properties, overridden by any given explicitly
+                properties = {**vars(source), **properties}
+            self.add(**properties)
+
+    def _alter(self, name: str, properties: Dict[str, Any]) -> None:
+        with self._root._lock:
+            obj = self._objects.get(name.strip().upper())
+            if obj is None:
+                raise FakeSnowflakeError(f"{self.kind} '{name}' does not exist", status=404)
+            for field, value in properties.items():
+                setattr(obj, self.aliases.get(field, field), value)
+
+    def _drop(self, name: str, if_exists: bool = False) -> None:
+        key = name.strip().upper()
+        with self._root._lock:
+            if key not in self._objects:
+                if if_exists:
+                    return
+                raise FakeSnowflakeError(f"{self.kind} '{name}' does not exist", status=404)
+            del self._objects[key]
+            self._by_length[len(key)].discard(key)
+
+class FakeResourceRef:
+    """Stand-in for ``root.databases[name]``"""
+
+    def __init__(self, collection: FakeCollection, name: str):
+        self.collection = collection
+        self.name = name
+
+    def fetch(self) -> FakeResource:
+        self.collection._root._call(f"{self.collection.kind}.fetch", self.name)
+        obj = self.collection.get(self.name)
+        if obj is None:
+            raise FakeSnowflakeError(f"{self.collection.kind} '{self.name}' does not exist", status=404)
+        return FakeResource(**vars(obj))
+
+    def create_or_alter(self, obj: Any) -> None:
+        self.collection._root._call(f"{self.collection.kind}.create_or_alter", self.name)
+        properties = self.collection._properties(obj)
+        if self.name in self.collection:
+            properties.pop('name', None)
+            self.collection._alter(self.name, properties)
+        else:
+            self.collection._create(properties, 'errorIfExists')
+
+    def drop(self, if_exists: bool = False) -> None:
+        self.collection._root._call(f"{self.collection.kind}.drop", self.name)
+        self.collection._drop(self.name, if_exists)
+
+    def fetch_async(self) -> Future:
+        return self.collection._root._submit(self.fetch)
+
+    def create_or_alter_async(self, obj: Any) -> Future:
+        return self.collection._root._submit(self.create_or_alter, obj)
+
+    def drop_async(self, if_exists: bool = False) -> Future:
+        return self.collection._root._submit(self.drop, if_exists)
+
+# CREATE [TRANSIENT|TEMPORARY] DATABASE|WAREHOUSE [IF NOT EXISTS] NAME props
+_CREATE = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:(TRANSIENT|TEMPORARY|PERMANENT)\s+)?(DATABASE|WAREHOUSE)\s+"
+    r"(IF\s+NOT\s+EXISTS\s+)?(\S+)\s*(.*)",
+    re.IGNORECASE | re.DOTALL
+)
+_CLONE = re.compile(r"CLONE\s+(\S+)(?:\s+(?:AT|BEFORE)\s*\((?:'(?:\\.|[^'\\])*'|[^)'])*\))?\s*(.*)",
+                    re.IGNORECASE | re.DOTALL)
+_ALTER = re.compile(r"ALTER\s+(DATABASE|WAREHOUSE)\s+(?:IF\s+EXISTS\s+)?(\S+)\s+SET\s+(.*)", re.IGNORECASE | re.DOTALL)
+_DROP = re.compile(r"DROP\s+(DATABASE|WAREHOUSE)\s+(IF\s+EXISTS\s+)?(\S+)", re.IGNORECASE)
+_SHOW = re.compile(r"SHOW\s+(DATABASES|WAREHOUSES)(?:\s+LIKE\s+'(.*)')?\s*$", re.IGNORECASE | re.DOTALL)
+_PROPERTY = re.compile(r"(\w+)\s*=\s*('(?:\\.|[^'\\])*'|\S+)")
+
+def parse_properties(text: str) -> Dict[str, Any]:
+    """Parse ``NAME = value`` pairs as rendered by ``handlers.sql.format_properties``"""
+    properties = {}
+    for name, raw in _PROPERTY.findall(text):
+        if raw.startswith("'"):
+            value: Any = re.sub(r"\\(.)", r"\1", raw[1:-1])
+        elif raw.upper() in ('TRUE', 'FALSE'):
+            value = raw.upper() == 'TRUE'
+        else:
+            try:
+                value = int(raw)
+            except ValueError:
+                try:
+                    value = float(raw)
+                except ValueError:
+                    value = raw
+        properties[name.lower()] = value
+    return properties
+
+class FakeCursor:
+    """DB-API style cursor that runs a small DDL dialect against the fake collections"""
+
+    def __init__(self, connection: 'FakeConnection'):
+        self.connection = connection
+        self.arraysize = 1
+        self._results: List[List[Tuple]] = []
+        self._rows: Deque[Tuple] = collections.deque()
+        # DB-API column descriptions; columns are named like those of a VALUES clause
+        self.description: Optional[List[Tuple]] = None
+
+    def _load(self, rows: List[Tuple]) -> None:
+        self._rows = collections.deque(rows)
+        self.description = [
+            (f"COLUMN{i}", None, None, None, None, None, True) for i in range(1, len(rows[0]) + 1)
+        ] if rows else None
+
+    def execute(self, sql: str, num_statements: Optional[int] = None, **kwargs: Any) -> 'FakeCursor':
+        root = self.connection.root
+        statements = [s.strip() for s in sql.split(';') if s.strip()]
+        if num_statements not in (None, 0) and len(statements) != num_statements:
+            raise FakeSnowflakeError(
+                f"Actual statement count {len(statements)} did not match the desired statement count {num_statements}",
+                status=400
+            )
+        root._call('sql.execute')
+        # Like Snowflake, a failing statement stops the rest of the request
+        self._results = [root.run_statement(statement) for statement in statements]
+        self._load(self._results.pop(0) if self._results else [])
+        return self
+
+    def nextset(self) -> Optional[bool]:
+        if not self._results:
+            return None
+        self._load(self._results.pop(0))
+        return True
+
+    def fetchall(self) -> List[Tuple]:
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def fetchone(self) -> Optional[Tuple]:
+        return self._rows.popleft() if self._rows else None
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Tuple]:
+        size = self.arraysize if size is None else size
+        return [self._rows.popleft() for _ in range(min(size, len(self._rows)))]
+
+    def close(self) -> None:
+        self._results = []
+        self._rows.clear()
+
+class FakeConnection:
+    """Stand-in for ``root.connection`` / ``session.connection``"""
+
+    def __init__(self, root: 'FakeRoot'):
+        self.root = root
+        self._closed = False
+
+    def cursor(self) -> FakeCursor:
+        if self._closed:
+            raise FakeSnowflakeError("Connection is closed", status=400)
+        return FakeCursor(self)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        self._closed = True
+
+class FakeSession:
+    """Stand-in for a Snowpark ``Session`` bound to a ``FakeRoot``"""
+
+    def __init__(self, root: 'FakeRoot'):
+        self.root = root
+        self.connection = FakeConnection(root)
+
+    def close(self) -> None:
+        self.connection.close()
+
+class FakeRoot:
+    """In-memory stand-in for ``snowflake.core.Root``.
+
+    Implements the parts of the SDK the handlers, ``SnowflakeState`` and
+    ``SnowflakeConnector`` use: ``databases``/``warehouses`` collections with
+    ``iter(like=...)``, ``create(mode=...)``, ``create_or_alter`` and their
+    ``*_async`` variants, plus a ``connection`` whose cursor understands
+    ``CREATE``, ``ALTER ... SET``, ``DROP``, ``SHOW`` and simple ``SELECT``
+    statements. Clones copy their source's current properties; Time Travel
+    points are accepted but not simulated.
+
+    Each simulated round-trip sleeps for ``latency`` plus a uniform
+    ``jitter`` and fails with probability ``error_rate``; names in
+    ``fail_names`` always fail. With ``rate_limit``, calls beyond that many
+    in any one-second window are rejected with a 429, like a throttled
+    account, and counted in ``throttled``; so are calls made while
+    ``max_concurrent`` others are in flight. Beyond ``capacity`` concurrent
+    calls, latency grows in proportion to the calls in flight, as if they
+    queued for ``capacity`` servers. Results are reproducible for a given
+    ``seed`` when calls are made from a single thread.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 fail_names: Iterable[str] = (), seed: Optional[int] = None, max_workers: int = 32,
+                 queries: Optional[Dict[str, List[Tuple]]] = None, rate_limit: Optional[int] = None,
+                 max_concurrent: Optional[int] = None, capacity: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.fail_names = {name.strip().upper() for name in fail_names}
+        self.max_workers = max_workers
+        self.queries = {
+            'SELECT 1': [(1,)],
+            'SELECT CURRENT_VERSION()': [('0.0.0-fake',)],
+            **{sql.strip().upper(): rows for sql, rows in (queries or {}).items()}
+        }
+        self.rate_limit = rate_limit
+        self.max_concurrent = max_concurrent
+        self.capacity = capacity
+        self.calls: collections.Counter = collections.Counter()
+        self.throttled = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._window: collections.deque = collections.deque()
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.databases = FakeCollection(self, 'databases')
+        self.warehouses = FakeCollection(self, 'warehouses', aliases={'warehouse_size': 'size'})
+        self.connection = FakeConnection(self)
+
+    def session(self) -> FakeSession:
+        """A new session sharing this account's objects, e.g. as a ``SessionPool`` factory"""
+        return FakeSession(self)
+
+    def close(self) -> None:
+        """Shut down the worker threads used by ``*_async`` calls"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _call(self, operation: str, name: Optional[str] = None) -> None:
+        """Simulate one round-trip: count it, wait, and maybe fail"""
+        with self._lock:
+            self.calls[operation] += 1
+            if (self.rate_limit is not None and self._throttle()) or \
+                    (self.max_concurrent is not None and self._in_flight >= self.max_concurrent):
+                self.throttled += 1
+                raise FakeSnowflakeError(f"Too many requests: {operation}", status=429)
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            if self.capacity is not None and self._in_flight > self.capacity:
+                delay *= self._in_flight / self.capacity
+        try:
+            if delay > 0:
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        if failed:
+            raise FakeSnowflakeError(f"Injected failure in {operation}", status=503)
+        if name is not None and name.strip().upper() in self.fail_names:
+            raise FakeSnowflakeError(f"Injected failure in {operation} for '{name}'")
+
+    def _throttle(self) -> bool:
+        """Whether a call now would exceed ``rate_limit`` calls in the last second"""
+        now = time.monotonic()
+        window = self._window
+        while window and now - window[0] >= 1.0:
+            window.popleft()
+        if len(window) >= self.rate_limit:
+            return True
+        window.append(now)
+        return False
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='fake-snowflake')
+            return self._executor.submit(fn, *args)
+
+    def _collection(self, kind: str) -> FakeCollection:
+        return self.databases if kind.upper().startswith('DATABASE') else self.warehouses
+
+    def run_statement(self, statement: str) -> List[Tuple]:
+        """Apply one SQL statement and return its result rows"""
+        query = self.queries.get(' '.join(statement.split()).upper())
+        if query is not None:
+            return list(query)
+
+        match = _CREATE.match(statement)
+        if match:
+            kind, obj_type, if_not_exists, name, rest = match.groups()
+            self._check_name(name)
+            clone = _CLONE.match(rest)
+            source, rest = clone.groups() if clone else (None, rest)
+            properties = {'name': name, **parse_properties(rest)}
+            collection = self._collection(obj_type)
+            if kind and collection is self.databases:
+                properties['kind'] = kind.upper()
+            replace = statement.upper().startswith('CREATE OR REPLACE')
+            mode = 'orReplace' if replace else 'ifNotExists' if if_not_exists else 'errorIfExists'
+            collection._create({collection.aliases.get(k, k): v for k, v in properties.items()}, mode, source)
+            return [(f"{obj_type.upper()} {name.upper()} successfully created.",)]
+
+        match = _ALTER.match(statement)
+        if match:
+            obj_type, name, rest = match.groups()
+            self._check_name(name)
+            self._collection(obj_type)._alter(name, parse_properties(rest))
+            return [('Statement executed successfully.',)]
+
+        match = _DROP.match(statement)
+        if match:
+            obj_type, if_exists, name = match.groups()
+            self._check_name(name)
+            self._collection(obj_type)._drop(name, bool(if_exists))
+            return [(f"{name.upper()} successfully dropped.",)]
+
+        match = _SHOW.match(statement)
+        if match:
+            kind, like = match.groups()
+            collection = self._collection(kind)
+            regex = _like_regex(like) if like is not None else None
+            return [(obj.name,) for obj in list(collection._objects.values())
+                    if regex is None or regex.fullmatch(obj.name)]
+
+        raise FakeSnowflakeError(f"SQL compilation error: unsupported statement: {statement[:80]}", status=400)
+
+    def _check_name(self, name: str) -> None:
+        if name.strip().upper() in self.fail_names:
+            raise FakeSnowflakeError(f"Injected failure for '{name}'")
@@ -0,0 +1,214 @@
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import json
+import os
+import random
+import sys
+from .fake_root import FakeRoot
+
+# Property -> [value, weight] pairs; None leaves the property unset
+Distribution = List[Tuple[Any, float]]
+
+DEFAULT_DISTRIBUTIONS: Dict[str, Dict[str, Distribution]] = {
+    'database': {
+        'kind': [('PERMANENT', 9), ('TRANSIENT', 1)],
+        'data_retention_time_in_days': [(1, 6), (7, 3), (30, 1)],
+        'max_data_extension_time_in_days': [(None, 8), (14, 2)],
+        'default_ddl_collation': [(None, 7), ('UTF8', 3)],
+        'log_level': [(None, 5), ('INFO', 3), ('WARN', 2)],
+        'trace_level': [(None, 8), ('OFF', 2)],
+    },
+    'warehouse': {
+        'size': [('X-SMALL', 4), ('SMALL', 3), ('MEDIUM', 2), ('LARGE', 1)],
+        'auto_suspend': [(60, 3), (300, 5), (600, 2)],
+        'auto_resume': [(True, 9), (False, 1)],
+    },
+}
+
+# Alternatives used to drift a property whose distribution has a single value
+_DRIFT_FALLBACKS = {
+    'kind': 'TRANSIENT', 'default_ddl_collation': 'UTF8_CI', 'log_level': 'DEBUG', 'trace_level': 'BASIC',
+    'size': 'X-LARGE', 'auto_resume': False, 'comment': 'Drifted comment',
+}
+
+_NAME_PREFIXES = {'database': 'SYN_DB', 'warehouse': 'SYN_WH'}
+
+def load_distributions(path: Optional[str]) -> Dict[str, Dict[str, Distribution]]:
+    """Default distributions, overridden per property by a JSON file of ``[value, weight]`` pairs"""
+    distributions = {obj_type: dict(properties) for obj_type, properties in DEFAULT_DISTRIBUTIONS.items()}
+    if path:
+        with open(path) as f:
+            overrides = json.load(f)
+        for obj_type, properties in overrides.items():
+            if obj_type not in distributions:
+                raise ValueError(f"Unknown object type in distributions: {obj_type}")
+            for name, pairs in properties.items():
+                distributions[obj_type][name] = [(value, weight) for value, weight in pairs]
+    return distributions
+
+class _Sampler:
+    """Weighted sampling over one distribution with precomputed cumulative weights"""
+
+    def __init__(self, pairs: Distribution):
+        if not pairs:
+            raise ValueError("A distribution needs at least one value")
+        self.values = [value for value, _ in pairs]
+        self.cumulative = []
+        total = 0.0
+        for _, weight in pairs:
+            total += weight
+            self.cumulative.append(total)
+
+    def sample(self, rng: random.Random) -> Any:
+        return rng.choices(self.values, cum_weights=self.cumulative)[0]
+
+def _drift(field: str, value: Any, sampler: _Sampler, rng: random.Random) -> Any:
+    """A remote value for ``field`` that differs from the desired ``value``"""
+    others = [other for other in sampler.values if other is not None and other != value]
+    if others:
+        return rng.choice(others)
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, int):
+        return value + 1
+    return _DRIFT_FALLBACKS.get(field, 'DRIFTED')
+
+def _remote_form(obj_type: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Render properties the way the SDK reports them (mixed-case sizes, string booleans)"""
+    remote = dict(properties)
+    if obj_type == 'database':
+        remote.setdefault('kind', 'PERMANENT')
+    elif obj_type == 'warehouse':
+        if 'size' in remote:
+            remote['size'] = str(remote['size']).title()
+        if 'auto_resume' in remote:
+            remote['auto_resume'] = 'true' if remote['auto_resume'] else 'false'
+    return remote
+
+def generate_objects(counts: Dict[str, int], seed: int = 0, drift_rate: float = 0.1,
+                     missing_rate: float = 0.05, error_rate: float = 0.0,
+                     distributions: Optional[Dict[str, Dict[str, Distribution]]] = None
+                     ) -> Iterator[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]], bool]]:
+    """Yield ``(obj_type, desired, actual, fails)`` for each synthetic object, one at a time.
+
+    ``desired`` is a config entry valid for the object's model. ``actual`` is
+    the remote state (``None`` for a missing object), drifted in one
+    property with probability ``drift_rate``; ``fails`` marks objects whose
+    API calls should fail. The sequence depends only on the arguments.
+    """
+    distributions = distributions or DEFAULT_DISTRIBUTIONS
+    rng = random.Random(seed)
+    for obj_type, count in counts.items():
+        samplers = {field: _Sampler(pairs) for field, pairs in distributions.get(obj_type, {}).items()}
+        width = len(str(max(count - 1, 0)))
+        for i in range(count):
+            desired: Dict[str, Any] = {'name': f"{_NAME_PREFIXES[obj_type]}_{i:0{width}d}"}
+            for field, sampler in samplers.items():
+                value = sampler.sample(rng)
+                if value is not None:
+                    desired[field] = value
+            # Temporary and transient databases only support 0-1 days of retention
+            if desired.get('kind') in ('TRANSIENT', 'TEMPORARY'):
+                desired.pop('data_retention_time_in_days', None)
+                desired.pop('max_data_extension_time_in_days', None)
+            desired['comment'] = f"Synthetic {obj_type} {i}"
+
+            fails = rng.random() < error_rate
+            if rng.random() < missing_rate:
+                yield obj_type, desired, None, fails
+                continue
+            actual = _remote_form(obj_type, desired)
+            if rng.random() < drift_rate:
+                field = rng.choice(sorted(set(samplers) & set(desired) - {'kind'}) or ['comment'])
+                sampler = samplers.get(field) or _Sampler([(desired[field], 1)])
+                actual.update(_remote_form(obj_type, {field: _drift(field, desired[field], sampler, rng)}))
+            yield obj_type, desired, actual, fails
+
+def _yaml_scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    # JSON strings are valid double-quoted YAML scalars
+    return json.dumps(str(value))
+
+def write_fixtures(objects: Iterable[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]], bool]],
+                   config: IO, actual: Optional[IO] = None) -> Dict[str, int]:
+    """Stream generated objects to a YAML config and a JSON Lines remote-state file.
+
+    Objects must arrive grouped by type, as ``generate_objects`` yields
+    them. Each remote-state line is ``{"type", "properties", "fail"}``;
+    missing objects get no line unless they are marked to fail, in which
+    case the line has no properties.
+    """
+    stats = {'objects': 0, 'missing': 0, 'drifted': 0, 'failing': 0}
+    section = None
+    for obj_type, desired, remote, fails in objects:
+        if obj_type != section:
+            config.write(f"{obj_type}s:\n")
+            section = obj_type
+        lines = [f"{field}: {_yaml_scalar(value)}" for field, value in desired.items()]
+        config.write("  - " + "\n    ".join(lines) + "\n")
+
+        stats['objects'] += 1
+        stats['missing'] += remote is None
+        stats['failing'] += fails
+        stats['drifted'] += remote is not None and remote != _remote_form(obj_type, desired)
+        if actual is not None and (remote is not None or fails):
+            record = {'type': obj_type, 'name': desired['name'], 'properties': remote, 'fail': fails}
+            actual.write(json.dumps(record, separators=(',', ':')) + "\n")
+    return stats
+
+def load_actual_state(path: str, root: Optional[FakeRoot] = None) -> FakeRoot:
+    """Seed a ``FakeRoot`` (a new one by default) from a remote-state JSON Lines file"""
+    root = root if root is not None else FakeRoot()
+    collections = {'database': root.databases, 'warehouse': root.warehouses}
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record['properties'] is not None:
+                collections[record['type']].add(**record['properties'])
+            if record.get('fail'):
+                root.fail_names.add(record['name'].upper())
+    return root
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic Snowflake config and a drifted remote state')
+    parser.add_argument('-n', '--objects', type=int, default=1000, help='Objects per type (default: 1000)')
+    parser.add_argument('--databases', type=int, help='Databases to generate (default: --objects)')
+    parser.add_argument('--warehouses', type=int, help='Warehouses to generate (default: --objects)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--drift-rate', type=float, default=0.1,
+                        help='Fraction of existing objects with one drifted property (default: 0.1)')
+    parser.add_argument('--missing-rate', type=float, default=0.05,
+                        help='Fraction of objects absent from the remote state (default: 0.05)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of objects whose API calls fail (default: 0)')
+    parser.add_argument('--distributions', help='JSON file overriding property distributions')
+    parser.add_argument('-c', '--config', default='-', help='Output YAML config path (default: stdout)')
+    parser.add_argument('-a', '--actual', help='Output remote-state JSON Lines path (default: not written)')
+    args = parser.parse_args(argv)
+
+    counts = {
+        'database': args.objects if args.databases is None else args.databases,
+        'warehouse': args.objects if args.warehouses is None else args.warehouses,
+    }
+    objects = generate_objects(counts, args.seed, args.drift_rate, args.missing_rate, args.error_rate,
+                               load_distributions(args.distributions))
+
+    config = sys.stdout if args.config == '-' else open(args.config, 'w')
+    actual = open(args.actual, 'w') if args.actual else None
+    try:
+        stats = write_fixtures(objects, config, actual)
+    finally:
+        if config is not sys.stdout:
+            config.close()
+        if actual is not None:
+            actual.close()
+    print(f"Generated {stats['objects']} object(s): {stats['missing']} missing, {stats['drifted']} drifted, "
+          f"{stats['failing']} failing", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import os
 import sys
 import argparse
+from contextlib import nullcontext
 from src.snowflake_connector.connection import SnowflakeConnector
+from src.snowflake_connector.results import DEFAULT_BATCH_SIZE, write_csv, write_parquet
 from src.snowflake_connector.utils.config_loader import load_env_config
 
 def parse_arguments():
@@ -20,8 +23,49 @@ def parse_arguments():
     parser.add_argument('-q', '--query', 
                         type=str, 
                         help='Execute a specific SQL query')
+    parser.add_argument('-o', '--output', 
+                        type=str, 
+                        help='Write query results to this file instead of stdout')
+    parser.add_argument('--format', 
+                        choices=['rows', 'csv', 'parquet'], 
+                        help='Query result format (default: from the --output extension, else rows)')
+    parser.add_argument('--batch-size', 
+                        type=int, 
+                        default=DEFAULT_BATCH_SIZE, 
+                        help=f'Rows fetched per round-trip (default: {DEFAULT_BATCH_SIZE})')
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.format is None:
+        extension = os.path.splitext(args.output or '')[1].lower()
+        args.format = {'.csv': 'csv', '.parquet': 'parquet'}.get(extension, 'rows')
+    if args.format == 'parquet' and not args.output:
+        parser.error('--format parquet needs --output')
+    return args
+
+def write_query_results(connector: SnowflakeConnector, args) -> None:
+    """
+    Stream query results to stdout or a file, holding one batch in memory at a time.
+    
+    :param connector: Connector with an established session
+    :param args: Parsed arguments
+    """
+    with connector.stream_query(args.query, args.batch_size) as stream:
+        if args.format == 'parquet':
+            count = write_parquet(stream, args.output)
+        else:
+            output = open(args.output, 'w', newline='', encoding='utf-8') if args.output else nullcontext(sys.stdout)
+            with output as f:
+                if args.format == 'csv':
+                    count = write_csv(stream, f)
+                else:
+                    if not args.output:
+                        print("\nQuery Results:")
+                    count = 0
+                    for row in stream:
+                        print(row, file=f)
+                        count += 1
+    if args.output:
+        print(f"Wrote {count} row(s) to {args.output}")
 
 def main():
     """
@@ -49,10 +93,7 @@ def main():
         
         # Optional: Execute custom query
         if args.query:
-            results = connector.execute_query(args.query)
-            print("\nQuery Results:")
-            for row in results:
-                print(row)
+            write_query_results(connector, args)
         
     except Exception as e:
         print(f"Error: {e}")
@@ -39,6 +39,9 @@ setup(
             'pytest',
             'mock',
         ],
+        'arrow': [
+            'snowflake-connector-python[pandas]',
+        ],
     },
     keywords='snowflake database connector',
 )
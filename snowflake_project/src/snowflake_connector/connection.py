@@ -1,27 +1,68 @@
 import os
-from typing import Dict, List, Any
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 import snowflake.connector
 from snowflake.core import Root
-from snowflake.core.session import Session
+from snowflake.snowpark import Session
+
+from .pool import SessionPool
+from .results import DEFAULT_BATCH_SIZE, QueryStream
 
 class SnowflakeConnector:
     """
     A comprehensive Snowflake connection management class.
     """
-    def __init__(self, config: Dict[str, str]):
+    def __init__(self, config: Dict[str, str], pool: Optional[SessionPool] = None,
+                 min_pool_size: int = 1, max_pool_size: int = 4, max_idle_seconds: float = 300,
+                 root_factory: Callable[[Session], Root] = Root):
         """
         Initialize the Snowflake connector with configuration.
         
         :param config: Dictionary of Snowflake connection parameters
+        :param pool: Existing session pool to draw from instead of creating one
+        :param min_pool_size: Sessions kept open while the connector is in use
+        :param max_pool_size: Maximum number of concurrently open sessions
+        :param max_idle_seconds: Idle time after which surplus sessions are closed
+        :param root_factory: Callable building the root resource for a session
         """
         self._config = config
+        self._pool = pool
+        self._owns_pool = pool is None
+        self._pool_options = {
+            'min_size': min_pool_size,
+            'max_size': max_pool_size,
+            'max_idle_seconds': max_idle_seconds,
+        }
+        self._root_factory = root_factory
         self._session = None
-        self._root = None
+        # Whether a call of this connector is using the pinned session
+        self._session_busy = False
+        self._session_lock = threading.Lock()
+        self._roots = weakref.WeakKeyDictionary()
+    
+    def _new_session(self) -> Session:
+        return Session.builder.configs(self._config).create()
+    
+    @property
+    def pool(self) -> SessionPool:
+        """
+        The session pool backing this connector.
+        """
+        if self._pool is None:
+            raise RuntimeError("Session not established. Call create_session() first.")
+        return self._pool
     
     def create_session(self) -> Session:
         """
         Create a Snowflake session using the provided configuration.
         
+        The session is borrowed from the connector's pool and stays checked
+        out until ``close_session`` is called. The connector's own queries
+        run on it too, so a single-threaded client logs in only once.
+        
         :return: Snowflake Session object
         """
         try:
@@ -31,65 +72,161 @@ class SnowflakeConnector:
                 if param not in self._config:
                     raise ValueError(f"Missing required parameter: {param}")
             
-            # Create session
-            self._session = Session.builder.configs(self._config).create()
+            # Create the pool and open its minimum number of sessions
+            if self._pool is None:
+                self._pool = SessionPool(self._new_session, **self._pool_options)
+                self._owns_pool = True
+            self._pool.warm()
             
-            # Create root resource
-            self._root = Root(self._session)
+            if self._session is None:
+                self._session = self._pool.acquire()
             
-            print("Successfully created Snowflake session")
+            print("Successfully created Snowflake session", file=sys.stderr)
             return self._session
         
         except Exception as e:
-            print(f"Error creating Snowflake session: {e}")
+            print(f"Error creating Snowflake session: {e}", file=sys.stderr)
             raise
     
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """
+        Use a session for the duration of a ``with`` block.
+        
+        This is the session from ``create_session`` unless another call is
+        already using it, in which case one is borrowed from the pool.
+        
+        :return: Context manager yielding a Snowflake Session object
+        """
+        with self._session_lock:
+            pinned = None if self._session_busy else self._session
+            self._session_busy = self._session_busy or pinned is not None
+        if pinned is None:
+            with self.pool.session() as session:
+                yield session
+            return
+        try:
+            yield pinned
+        finally:
+            with self._session_lock:
+                self._session_busy = False
+    
+    def get_root(self, session: Session) -> Root:
+        """
+        Return the root resource for a pooled session, creating it once per session.
+        
+        :param session: Snowflake Session object
+        :return: Snowflake Root resource
+        """
+        root = self._roots.get(session)
+        if root is None:
+            root = self._roots[session] = self._root_factory(session)
+        return root
+    
     def list_databases(self) -> List[str]:
         """
         List available databases in the Snowflake account.
         
         :return: List of database names
         """
-        if not self._root:
-            raise RuntimeError("Session not established. Call create_session() first.")
-        
         try:
-            databases = self._root.databases.list()
-            return [db.name for db in databases]
+            with self.session() as session:
+                databases = self.get_root(session).databases.iter()
+                return [db.name for db in databases]
         except Exception as e:
-            print(f"Error listing databases: {e}")
+            print(f"Error listing databases: {e}", file=sys.stderr)
             raise
     
     def execute_query(self, query: str) -> List[Any]:
         """
         Execute a SQL query and return results.
         
+        All rows are held in memory; use ``iter_query`` or ``stream_query``
+        for large results.
+        
         :param query: SQL query to execute
         :return: List of query results
         """
-        if not self._session:
-            raise RuntimeError("Session not established. Call create_session() first.")
-        
         try:
-            cursor = self._session.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            with self.session() as session:
+                cursor = session.connection.cursor()
+                try:
+                    cursor.execute(query)
+                    return cursor.fetchall()
+                finally:
+                    cursor.close()
         except Exception as e:
-            print(f"Error executing query: {e}")
+            print(f"Error executing query: {e}", file=sys.stderr)
             raise
     
+    @contextmanager
+    def stream_query(self, query: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[QueryStream]:
+        """
+        Execute a SQL query and fetch its results incrementally inside a ``with`` block.
+        
+        The pooled session and cursor stay open until the block exits.
+        
+        :param query: SQL query to execute
+        :param batch_size: Rows fetched per round-trip
+        :return: Context manager yielding a QueryStream
+        """
+        with self.session() as session:
+            cursor = session.connection.cursor()
+            try:
+                try:
+                    cursor.execute(query)
+                except Exception as e:
+                    print(f"Error executing query: {e}", file=sys.stderr)
+                    raise
+                yield QueryStream(cursor, batch_size)
+            finally:
+                cursor.close()
+    
+    def iter_query(self, query: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Tuple]:
+        """
+        Execute a SQL query and yield its rows, fetching ``batch_size`` at a time.
+        
+        :param query: SQL query to execute
+        :param batch_size: Rows fetched per round-trip
+        :return: Iterator over result rows
+        """
+        with self.stream_query(query, batch_size) as stream:
+            yield from stream
+    
+    def iter_arrow_batches(self, query: str) -> Iterator['pyarrow.Table']:
+        """
+        Execute a SQL query and yield its results as ``pyarrow`` tables.
+        
+        :param query: SQL query to execute
+        :return: Iterator over Arrow tables, one per result chunk
+        """
+        with self.stream_query(query) as stream:
+            yield from stream.arrow_batches()
+    
+    def iter_pandas_batches(self, query: str) -> Iterator['pandas.DataFrame']:
+        """
+        Execute a SQL query and yield its results as pandas DataFrames.
+        
+        :param query: SQL query to execute
+        :return: Iterator over DataFrames, one per result chunk
+        """
+        with self.stream_query(query) as stream:
+            yield from stream.pandas_batches()
+    
     def close_session(self):
         """
-        Close the current Snowflake session.
+        Return the current session to the pool and close the pool if the
+        connector created it.
         """
-        if self._session:
+        if self._session is not None:
+            self._pool.release(self._session)
+            self._session = None
+        if self._pool is not None and self._owns_pool:
             try:
-                self._session.close()
-                print("Snowflake session closed")
+                self._pool.close()
+                print("Snowflake session closed", file=sys.stderr)
             except Exception as e:
-                print(f"Error closing session: {e}")
+                print(f"Error closing session: {e}", file=sys.stderr)
             finally:
-                self._session = None
-                self._root = None
+                self._pool = None
+                self._roots = weakref.WeakKeyDictionary()
@@ -0,0 +1,240 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def default_health_check(session: Any) -> bool:
+    """
+    Check that a Snowpark session's connection is open and answers a trivial query.
+
+    :param session: Session to check
+    :return: True if the session is usable
+    """
+    connection = session.connection
+    if connection.is_closed():
+        return False
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        return cursor.fetchone() is not None
+    finally:
+        cursor.close()
+
+class PoolTimeoutError(TimeoutError):
+    """
+    Raised when no session becomes available within the acquire timeout.
+    """
+    pass
+
+class SessionPool:
+    """
+    A thread-safe pool of authenticated Snowflake sessions.
+
+    Sessions are created on demand up to ``max_size`` and handed out most
+    recently used first, so workers get warm sessions. Sessions idle for
+    longer than ``max_idle_seconds`` are closed down to ``min_size``, and a
+    session idle for longer than ``health_check_interval`` is checked before
+    being handed out again.
+    """
+    def __init__(self,
+                 factory: Callable[[], Any],
+                 min_size: int = 1,
+                 max_size: int = 4,
+                 max_idle_seconds: float = 300,
+                 health_check: Optional[Callable[[Any], bool]] = default_health_check,
+                 health_check_interval: float = 30,
+                 acquire_timeout: Optional[float] = None):
+        """
+        Initialize the pool. No session is created until the pool is used.
+
+        :param factory: Callable that creates a new authenticated session
+        :param min_size: Sessions kept open even when idle
+        :param max_size: Maximum number of open sessions
+        :param max_idle_seconds: Idle time after which surplus sessions are closed
+        :param health_check: Callable returning False for unusable sessions, or None to disable
+        :param health_check_interval: Idle time after which a session is checked before reuse
+        :param acquire_timeout: Default seconds to wait for a free session (None waits forever)
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self._health_check = health_check
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of open sessions, idle or borrowed.
+        """
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """
+        Number of sessions waiting in the pool.
+        """
+        return len(self._idle)
+
+    def warm(self) -> None:
+        """
+        Open sessions until the pool holds at least ``min_size``.
+        """
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            session = self._create()
+            self.release(session)
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Borrow a session, creating one if the pool is below ``max_size``.
+
+        :param timeout: Seconds to wait for a free session (defaults to ``acquire_timeout``)
+        :return: A session that must be handed back with ``release``
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.evict_idle()
+            with self._condition:
+                while not self._idle and self._size >= self.max_size and not self._closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise PoolTimeoutError(f"No Snowflake session available after {timeout}s")
+                    self._condition.wait(remaining)
+                if self._closed:
+                    raise RuntimeError("Session pool is closed")
+                if self._idle:
+                    session, last_used = self._idle.pop()
+                else:
+                    self._size += 1
+                    session, last_used = None, None
+
+            if session is None:
+                return self._create()
+            if self._is_healthy(session, last_used):
+                return session
+            self._discard(session)
+
+    def release(self, session: Any, discard: bool = False) -> None:
+        """
+        Return a borrowed session to the pool.
+
+        :param session: Session previously returned by ``acquire``
+        :param discard: Close the session instead of reusing it
+        """
+        with self._condition:
+            if not discard and not self._closed:
+                self._idle.append((session, time.monotonic()))
+                self._condition.notify()
+                return
+        self._discard(session)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow a session for the duration of a ``with`` block.
+
+        The session is discarded instead of reused if the block raises and
+        the session fails its health check.
+
+        :param timeout: Seconds to wait for a free session
+        """
+        session = self.acquire(timeout)
+        try:
+            yield session
+        except Exception:
+            self.release(session, discard=not self._is_healthy(session, None))
+            raise
+        except BaseException:
+            # E.g. GeneratorExit from a result iterator closed before its end
+            self.release(session)
+            raise
+        else:
+            self.release(session)
+
+    def evict_idle(self) -> int:
+        """
+        Close sessions idle for longer than ``max_idle_seconds``, keeping ``min_size``.
+
+        :return: Number of sessions closed
+        """
+        with self._condition:
+            expired = self._take_expired_locked()
+        # Closing can block on the network, so it happens outside the lock
+        for session in expired:
+            self._close_quietly(session)
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        Close every idle session; borrowed sessions are closed when released.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._condition.notify_all()
+        for session, _ in idle:
+            self._discard(session)
+
+    def _create(self) -> Any:
+        try:
+            session = self._factory()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        logger.info(f"Opened pooled Snowflake session ({self._size}/{self.max_size})")
+        return session
+
+    def _is_healthy(self, session: Any, last_used: Optional[float]) -> bool:
+        if self._health_check is None:
+            return True
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            return bool(self._health_check(session))
+        except Exception as e:
+            logger.warning(f"Pooled Snowflake session failed its health check: {e}")
+            return False
+
+    def _take_expired_locked(self) -> List[Any]:
+        # Oldest sessions sit at the left of the deque
+        now = time.monotonic()
+        expired = []
+        while (self._idle and self._size - len(expired) > self.min_size
+               and now - self._idle[0][1] > self.max_idle_seconds):
+            expired.append(self._idle.popleft()[0])
+        if expired:
+            self._size -= len(expired)
+            self._condition.notify(len(expired))
+        return expired
+
+    def _discard(self, session: Any) -> None:
+        self._close_quietly(session)
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(session: Any) -> None:
+        try:
+            session.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled Snowflake session: {e}")
@@ -0,0 +1,215 @@
+import csv
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from snowflake.connector.constants import FIELD_ID_TO_NAME
+from snowflake.connector.errors import NotSupportedError
+
+DEFAULT_BATCH_SIZE = 10000
+
+# pyarrow type factories for Snowflake column types other than NUMBER (FIXED)
+_ARROW_TYPES = {
+    'REAL': 'float64',
+    'TEXT': 'string',
+    'BOOLEAN': 'bool_',
+    'DATE': 'date32',
+    'BINARY': 'binary',
+}
+
+class QueryStream:
+    """
+    The result of one executed query, fetched from its open cursor in batches.
+
+    Only valid inside the ``SnowflakeConnector.stream_query`` block that
+    produced it, and consumable once: as rows, as row batches, as Arrow
+    tables or as pandas DataFrames. At most one batch plus the connector's
+    prefetched result chunks is held in memory at a time.
+    """
+    def __init__(self, cursor: Any, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Wrap a cursor that has executed a query.
+
+        :param cursor: DB-API cursor with a pending result
+        :param batch_size: Rows fetched per round of ``fetchmany``
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self._cursor = cursor
+        self.batch_size = batch_size
+        cursor.arraysize = batch_size
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Column names of the result, in order.
+        """
+        return [column[0] for column in self._cursor.description or ()]
+
+    def __iter__(self) -> Iterator[Tuple]:
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self) -> Iterator[List[Tuple]]:
+        """
+        Yield the remaining rows as lists of at most ``batch_size`` tuples.
+        """
+        while True:
+            rows = self._cursor.fetchmany(self.batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def arrow_batches(self) -> Iterator['pyarrow.Table']:
+        """
+        Yield the result as ``pyarrow`` tables.
+
+        Arrow results are passed through chunk by chunk as Snowflake sends
+        them. Results Snowflake only returns as JSON (e.g. of ``SHOW``) are
+        converted one row batch at a time.
+        """
+        # Without pyarrow the connector fails with a ProgrammingError instead of an install hint
+        import_pyarrow()
+        fetch = getattr(self._cursor, 'fetch_arrow_batches', None)
+        if fetch is not None:
+            try:
+                return iter(fetch())
+            except NotSupportedError:
+                pass
+        return self._rows_to_arrow()
+
+    def declared_arrow_types(self) -> Dict[str, 'pyarrow.DataType']:
+        """
+        Arrow types of the columns whose declared Snowflake type has a fixed Arrow form.
+
+        :return: Arrow type by column name; other columns are left out
+        """
+        pa = import_pyarrow()
+        types = {}
+        for column in self._cursor.description or ():
+            name, type_code, _, _, precision, scale = column[:6]
+            kind = FIELD_ID_TO_NAME.get(type_code) if type_code is not None else None
+            if kind == 'FIXED':
+                types[name] = pa.int64() if not scale else pa.decimal128(precision, scale)
+            elif kind in _ARROW_TYPES:
+                types[name] = getattr(pa, _ARROW_TYPES[kind])()
+        return types
+
+    def pandas_batches(self) -> Iterator['pandas.DataFrame']:
+        """
+        Yield the result as pandas DataFrames, one per Arrow batch.
+        """
+        for table in self.arrow_batches():
+            yield table.to_pandas()
+
+    def _rows_to_arrow(self) -> Iterator['pyarrow.Table']:
+        pa = import_pyarrow()
+        columns = self.columns
+        for batch in self.batches():
+            yield pa.Table.from_arrays([pa.array(values) for values in zip(*batch)], names=columns)
+
+def import_pyarrow():
+    """
+    Import ``pyarrow``, explaining how to install it if missing.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet results need pyarrow; install it with "
+            "'pip install \"snowflake-connector-python[pandas]\"'"
+        ) from e
+    return pyarrow
+
+def write_csv(stream: QueryStream, file: TextIO, header: bool = True) -> int:
+    """
+    Write a query result to a CSV file one batch at a time.
+
+    :param stream: Result to write
+    :param file: Open text file, e.g. ``sys.stdout``
+    :param header: Whether to write the column names first
+    :return: Number of rows written
+    """
+    writer = csv.writer(file)
+    if header:
+        writer.writerow(stream.columns)
+    count = 0
+    for batch in stream.batches():
+        writer.writerows(batch)
+        count += len(batch)
+    return count
+
+def _widen(pa, data_type: 'pyarrow.DataType') -> 'pyarrow.DataType':
+    # Snowflake sends the narrowest type that holds each chunk, e.g. int8 and then int64
+    if pa.types.is_integer(data_type):
+        return pa.int64()
+    if pa.types.is_floating(data_type):
+        return pa.float64()
+    return data_type
+
+def _parquet_schema(pa, tables: List['pyarrow.Table'], declared: Dict[str, 'pyarrow.DataType'],
+                    final: bool = False) -> Optional['pyarrow.Schema']:
+    # None while a column is all null and has no declared type, unless no more batches follow
+    fields = []
+    for i, name in enumerate(tables[0].column_names):
+        observed = [table.schema.field(i).type for table in tables]
+        known = [data_type for data_type in observed if not pa.types.is_null(data_type)]
+        if known:
+            data_type = _widen(pa, known[0])
+        elif name in declared:
+            data_type = declared[name]
+        elif final:
+            data_type = pa.null()
+        else:
+            return None
+        fields.append(pa.field(name, data_type))
+    return pa.schema(fields)
+
+def write_parquet(stream: QueryStream, path: str) -> int:
+    """
+    Write a query result to a Parquet file one Arrow batch at a time.
+
+    Every batch becomes a row group. Snowflake may send narrower integer
+    types in some chunks than in others, and a chunk's column may be all
+    null, so batches are cast to one schema: integers and floats are
+    widened to 64 bits and all-null columns take the result's declared
+    type. Batches are only held back while a column with no declared type
+    has been null in every batch so far.
+
+    :param stream: Result to write
+    :param path: Output file path
+    :return: Number of rows written
+    """
+    pa = import_pyarrow()
+    import pyarrow.parquet as pq
+    declared = stream.declared_arrow_types()
+    writer: Optional['pq.ParquetWriter'] = None
+    pending: List['pyarrow.Table'] = []
+    count = 0
+
+    def write(tables: List['pyarrow.Table']) -> int:
+        for table in tables:
+            writer.write_table(table.cast(writer.schema))
+        return sum(table.num_rows for table in tables)
+
+    try:
+        for table in stream.arrow_batches():
+            if writer is not None:
+                count += write([table])
+                continue
+            pending.append(table)
+            schema = _parquet_schema(pa, pending, declared)
+            if schema is not None:
+                writer = pq.ParquetWriter(path, schema)
+                count += write(pending)
+                pending = []
+        if writer is None and pending:
+            writer = pq.ParquetWriter(path, _parquet_schema(pa, pending, declared, final=True))
+            count += write(pending)
+        elif writer is None:
+            # An empty result still gets a file with its columns
+            pq.write_table(pa.table({
+                name: pa.array([], declared.get(name, pa.null())) for name in stream.columns
+            }), path)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+from src.snowflake_connector.pool import PoolTimeoutError, SessionPool
+
+class DummySession:
+    """
+    Stand-in session that records whether it was closed.
+    """
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+class TestSessionPool:
+    @pytest.fixture
+    def created(self):
+        return []
+
+    @pytest.fixture
+    def factory(self, created):
+        def create():
+            session = DummySession()
+            created.append(session)
+            return session
+        return create
+
+    def test_reuses_released_sessions(self, factory, created):
+        """
+        Test that a released session is handed out again instead of opening a new one.
+        """
+        pool = SessionPool(factory, min_size=0, max_size=2, health_check=None)
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            assert second is first
+        assert len(created) == 1
+
+    def test_warm_opens_min_size(self, factory, created):
+        """
+        Test that warming the pool opens its minimum number of sessions.
+        """
+        pool = SessionPool(factory, min_size=2, max_size=4, health_check=None)
+        pool.warm()
+        assert pool.size == 2
+        assert pool.idle == 2
+
+    def test_acquire_times_out_when_exhausted(self, factory):
+        """
+        Test that borrowing from a full pool waits and then times out.
+        """
+        pool = SessionPool(factory, min_size=0, max_size=1, health_check=None)
+        pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire(timeout=0.05)
+
+    def test_release_wakes_waiting_borrower(self, factory):
+        """
+        Test that a borrower blocked on a full pool receives a released session.
+        """
+        pool = SessionPool(factory, min_size=0, max_size=1, health_check=None)
+        session = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(session,))
+        timer.start()
+        assert pool.acquire(timeout=5) is session
+        timer.join()
+
+    def test_unhealthy_sessions_are_replaced(self, factory, created):
+        """
+        Test that a session failing its health check is closed and replaced.
+        """
+        pool = SessionPool(factory, min_size=0, max_size=1,
+                           health_check=lambda s: not s.closed, health_check_interval=0)
+        session = pool.acquire()
+        pool.release(session)
+        session.closed = True
+        replacement = pool.acquire()
+        assert replacement is not session
+        assert len(created) == 2
+
+    def test_idle_sessions_are_evicted_above_min_size(self, factory, created):
+        """
+        Test that idle eviction closes surplus sessions but keeps the minimum.
+        """
+        pool = SessionPool(factory, min_size=1, max_size=3, max_idle_seconds=0.01, health_check=None)
+        sessions = [pool.acquire() for _ in range(3)]
+        for session in sessions:
+            pool.release(session)
+        time.sleep(0.02)
+        assert pool.evict_idle() == 2
+        assert pool.size == 1
+        assert sum(session.closed for session in created) == 2
+
+    def test_evicted_sessions_close_outside_the_lock(self, factory):
+        """
+        Test that other threads can borrow while an evicted session is being closed.
+        """
+        pool = SessionPool(factory, min_size=0, max_size=2, max_idle_seconds=0.01, health_check=None)
+        session = pool.acquire()
+        blocked = []
+
+        def close():
+            borrower = threading.Thread(target=lambda: pool.release(pool.acquire()))
+            borrower.start()
+            borrower.join(timeout=1)
+            blocked.append(borrower.is_alive())
+
+        session.close = close
+        pool.release(session)
+        time.sleep(0.02)
+        assert pool.evict_idle() == 1
+        assert blocked == [False]
+
+    def test_close_closes_idle_and_returned_sessions(self, factory, created):
+        """
+        Test that closing the pool closes idle sessions now and borrowed ones on release.
+        """
+        pool = SessionPool(factory, min_size=0, max_size=2, health_check=None)
+        borrowed = pool.acquire()
+        pool.release(pool.acquire())
+        pool.close()
+        assert not borrowed.closed
+        pool.release(borrowed)
+        assert all(session.closed for session in created)
+        assert pool.size == 0
+        with pytest.raises(RuntimeError):
+            pool.acquire()
@@ -0,0 +1,98 @@
+import io
+import sys
+
+import pytest
+from src.snowflake_connector.results import QueryStream, write_csv, write_parquet
+
+class DummyCursor:
+    """
+    Stand-in cursor over a fixed result that records each fetch size.
+    """
+    def __init__(self, columns, rows):
+        self.description = [(name, None, None, None, None, None, True) for name in columns]
+        self.arraysize = 1
+        self.fetches = []
+        self._rows = list(rows)
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        self.fetches.append(size)
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+class TestQueryStream:
+    @pytest.fixture
+    def cursor(self):
+        return DummyCursor(['ID', 'NAME'], [(i, f"name {i}") for i in range(25)])
+
+    def test_fetches_in_batches(self, cursor):
+        """
+        Test that rows are fetched batch_size at a time and yielded in order.
+        """
+        stream = QueryStream(cursor, batch_size=10)
+        assert [len(batch) for batch in stream.batches()] == [10, 10, 5]
+        assert cursor.fetches == [10, 10, 10, 10]
+        assert cursor.arraysize == 10
+
+    def test_iterates_rows(self, cursor):
+        """
+        Test that iterating a stream yields every row once.
+        """
+        assert list(QueryStream(cursor, batch_size=7)) == [(i, f"name {i}") for i in range(25)]
+
+    def test_rejects_empty_batches(self, cursor):
+        """
+        Test that a batch size below one is rejected.
+        """
+        with pytest.raises(ValueError):
+            QueryStream(cursor, batch_size=0)
+
+    def test_write_csv(self, cursor):
+        """
+        Test that CSV output has a header row followed by every result row.
+        """
+        out = io.StringIO()
+        assert write_csv(QueryStream(cursor, batch_size=10), out) == 25
+        lines = out.getvalue().splitlines()
+        assert lines[:2] == ['ID,NAME', '0,name 0'] and len(lines) == 26
+
+    def test_write_parquet_from_rows(self, cursor, tmp_path):
+        """
+        Test that a cursor without Arrow results is converted batch by batch into one Parquet file.
+        """
+        pq = pytest.importorskip('pyarrow.parquet')
+        path = str(tmp_path / 'result.parquet')
+        assert write_parquet(QueryStream(cursor, batch_size=10), path) == 25
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.read().column('NAME').to_pylist()[-1] == 'name 24'
+
+    def test_arrow_without_pyarrow_explains_install(self, cursor, monkeypatch):
+        """
+        Test that a missing pyarrow raises an ImportError with an install hint before anything is fetched.
+        """
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+        cursor.fetch_arrow_batches = lambda: pytest.fail("fetched Arrow batches without pyarrow")
+        with pytest.raises(ImportError, match='pip install'):
+            QueryStream(cursor).arrow_batches()
+        assert cursor.fetches == []
+
+    @pytest.mark.parametrize('type_codes', [(None, None), (0, 1)])
+    def test_write_parquet_unifies_chunk_types(self, tmp_path, type_codes):
+        """
+        Test that Arrow chunks with narrower integers or all-null columns are written under one widened schema.
+        """
+        pa = pytest.importorskip('pyarrow')
+        pq = pytest.importorskip('pyarrow.parquet')
+        chunks = [
+            pa.table({'ID': pa.array([1, 2], pa.int8()), 'PRICE': pa.array([None, None], pa.null())}),
+            pa.table({'ID': pa.array([300000000000], pa.int64()), 'PRICE': pa.array([1.5], pa.float32())}),
+        ]
+        cursor = DummyCursor(['ID', 'PRICE'], [])
+        cursor.description = [(name, code, None, None, 38, 0, True) for name, code in zip(['ID', 'PRICE'], type_codes)]
+        cursor.fetch_arrow_batches = lambda: iter(chunks)
+        path = str(tmp_path / 'result.parquet')
+        assert write_parquet(QueryStream(cursor), path) == 3
+        table = pq.read_table(path)
+        assert table.schema.types == [pa.int64(), pa.float64()]
+        assert table.to_pydict() == {'ID': [1, 2, 300000000000], 'PRICE': [None, None, 1.5]}
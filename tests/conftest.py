@@ -0,0 +1,31 @@
+import pytest
+
+from snowflake_declarative.testing import FakeRoot
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Write YAML text to a config file under the test's directory and return its path"""
+    def write(text, name='config.yaml'):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return str(path)
+    return write
+
+@pytest.fixture
+def fake_root():
+    """Build a ``FakeRoot`` already holding the given objects, keyed by name; every root is closed after the test"""
+    roots = []
+
+    def build(databases=None, warehouses=None, **kwargs):
+        root = FakeRoot(**kwargs)
+        for name, properties in (databases or {}).items():
+            root.databases.add(name, **properties)
+        for name, properties in (warehouses or {}).items():
+            root.warehouses.add(name, **properties)
+        roots.append(root)
+        return root
+
+    yield build
+    for root in roots:
+        root.close()
@@ -0,0 +1,93 @@
+import pytest
+
+from snowflake_declarative.handlers.database import DatabaseHandler
+from snowflake_declarative.handlers.warehouse import WarehouseHandler
+from snowflake_declarative.models.change_report import ChangeStatus
+from snowflake_declarative.models.database import SnowflakeDatabase
+from snowflake_declarative.models.warehouse import SnowflakeWarehouse
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.manager import SnowflakeState
+
+CONFIG = """\
+databases:
+  - name: ANALYTICS
+    kind: TRANSIENT
+    comment: Analytics
+    data_retention_time_in_days: 1
+warehouses:
+  - name: REPORTING
+    size: LARGE
+    auto_suspend: 60
+    comment: Reporting
+"""
+
+# Every configured object exists but has drifted
+DRIFTED = {
+    'databases': {'ANALYTICS': {'kind': 'PERMANENT', 'comment': 'Old', 'data_retention_time_in_days': 7}},
+    'warehouses': {'REPORTING': {'size': 'X-Small', 'auto_suspend': 600, 'auto_resume': 'true', 'comment': 'Reporting'}},
+}
+
+class TestAlter:
+    def test_alter_sql_coalesces_differences(self, fake_root):
+        """
+        Test that all alterable differences become one ALTER ... SET and immutable ones are left out.
+        """
+        root = fake_root(**DRIFTED)
+        handler = DatabaseHandler(root)
+        desired = SnowflakeDatabase(name='analytics', kind='TRANSIENT', comment="Team's data",
+                                    data_retention_time_in_days=1)
+        differences = handler.get_comparator().diff(desired, root.databases.get('ANALYTICS'))
+        assert {diff.field for diff in differences} == {'kind', 'comment', 'data_retention_time_in_days'}
+        assert handler.get_alter_sql(desired, differences) == (
+            "ALTER DATABASE ANALYTICS SET COMMENT = 'Team\\'s data' DATA_RETENTION_TIME_IN_DAYS = 1"
+        )
+
+        warehouse = WarehouseHandler(root)
+        desired = SnowflakeWarehouse(name='REPORTING', size='LARGE', auto_suspend=60, comment='Reporting')
+        differences = warehouse.get_comparator().diff(desired, root.warehouses.get('REPORTING'))
+        assert warehouse.get_alter_sql(desired, differences) == (
+            "ALTER WAREHOUSE REPORTING SET WAREHOUSE_SIZE = 'LARGE' AUTO_SUSPEND = 60"
+        )
+        assert warehouse.get_alter_sql(desired, []) is None
+
+    @pytest.mark.parametrize('engine', [SnowflakeState, AsyncSnowflakeState])
+    def test_apply_alters_in_place(self, engine, config_path, fake_root):
+        """
+        Test that applying alters drifted objects with one statement each and leaves immutable fields alone.
+        """
+        root = fake_root(**DRIFTED)
+        path = config_path(CONFIG)
+        report = engine(root).apply_configuration(path, dry_run=False)
+        assert report.objects_updated == 2 and report.objects_with_errors == 0
+        assert root.calls['sql.execute'] == 2
+        assert report.metrics['api_calls']['warehouse']['alter']['count'] == 1
+
+        database = root.databases.get('ANALYTICS')
+        assert (database.kind, database.comment, database.data_retention_time_in_days) == ('PERMANENT', 'Analytics', 1)
+        warehouse = root.warehouses.get('REPORTING')
+        assert (warehouse.size, warehouse.auto_suspend) == ('LARGE', 60)
+
+        # Only the immutable difference remains
+        report = engine(root).apply_configuration(path)
+        assert [diff.field for diff in report.changes['database'][0].differences] == ['kind']
+        assert report.changes['warehouse'][0].status == ChangeStatus.NO_CHANGE
+
+    def test_dry_run_does_not_alter(self, config_path, fake_root):
+        """
+        Test that a dry run reports differences without running any statement.
+        """
+        root = fake_root(**DRIFTED)
+        report = SnowflakeState(root).apply_configuration(config_path(CONFIG))
+        assert report.objects_updated == 2
+        assert root.calls['sql.execute'] == 0
+        assert root.warehouses.get('REPORTING').size == 'X-Small'
+
+    def test_batched_alter_failure_is_reported(self, config_path, fake_root):
+        """
+        Test that batched alters go out with the DDL batch and a failing one marks only its own object.
+        """
+        root = fake_root(**DRIFTED, fail_names=['REPORTING'])
+        report = SnowflakeState(root, ddl_batch_size=10).apply_configuration(config_path(CONFIG), dry_run=False)
+        statuses = {entry.name: entry.status for entries in report.changes.values() for entry in entries}
+        assert statuses == {'ANALYTICS': ChangeStatus.UPDATED, 'REPORTING': ChangeStatus.ERROR}
+        assert root.databases.get('ANALYTICS').comment == 'Analytics'
@@ -0,0 +1,36 @@
+from benchmarks.suite import BENCHMARKS, compare_results, run_suite
+
+def make_run(calibration, **seconds):
+    return {
+        'calibration_seconds': calibration,
+        'results': {name: {'1000': {'seconds': value}} for name, value in seconds.items()},
+    }
+
+class TestBenchmarkSuite:
+    def test_every_benchmark_runs(self):
+        """
+        Test that each registered benchmark runs at a tiny size.
+        """
+        results = run_suite([5], repeat=1)
+        assert set(results['results']) <= set(BENCHMARKS)
+        assert {'load_yaml_config', 'find_differences', 'change_report', 'apply_dry_run'} <= set(results['results'])
+        assert results['calibration_seconds'] > 0
+
+    def test_regression_beyond_tolerance_is_flagged(self):
+        """
+        Test that only slowdowns beyond the tolerance and the noise floor fail.
+        """
+        baseline = make_run(1.0, slow=1.0, ok=1.0, tiny=0.001)
+        current = make_run(1.0, slow=1.5, ok=1.2, tiny=0.002)
+        rows = {row['name']: row for row in compare_results(current, baseline, tolerance=0.25)}
+        assert rows['slow']['regressed']
+        assert not rows['ok']['regressed']
+        assert not rows['tiny']['regressed']
+
+    def test_baseline_is_scaled_by_calibration(self):
+        """
+        Test that a uniformly slower machine does not count as a regression.
+        """
+        baseline = make_run(1.0, apply=1.0)
+        current = make_run(2.0, apply=2.1)
+        assert not compare_results(current, baseline, tolerance=0.25)[0]['regressed']
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from snowflake_declarative.models.change_report import ChangeStatus
+from snowflake_declarative.state import cache as cache_module
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.cache import RemoteStateCache
+from snowflake_declarative.state.manager import SnowflakeState
+
+CONFIG = """\
+databases:
+  - name: ANALYTICS
+  - name: STAGING
+warehouses:
+  - name: COMPUTE_WH
+    size: X-SMALL
+"""
+
+INDEX = {'ANALYTICS': SimpleNamespace(name='ANALYTICS', comment='Analytics')}
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's clock with one the test moves by hand"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, 'time', SimpleNamespace(time=lambda: now[0]))
+    return now
+
+class TestRemoteStateCache:
+    def test_inventory_expires_after_ttl(self, tmp_path, clock):
+        """
+        Test that a cached inventory is served until it is older than the TTL.
+        """
+        cache = RemoteStateCache(str(tmp_path / 'cache.db'), 'account', ttl=300)
+        cache.put_index('database', INDEX)
+        clock[0] += 300
+        assert cache.get_index('database')['ANALYTICS'].comment == 'Analytics'
+        clock[0] += 1
+        assert cache.get_index('database') is None
+        cache.close()
+
+    def test_refresh_bypasses_reads_but_still_stores(self, tmp_path, clock):
+        """
+        Test that a refreshing cache never serves an inventory but records what it fetched for later runs.
+        """
+        path = str(tmp_path / 'cache.db')
+        refreshing = RemoteStateCache(path, 'account', refresh=True)
+        refreshing.put_index('database', INDEX)
+        assert refreshing.get_index('database') is None
+        refreshing.close()
+
+        cache = RemoteStateCache(path, 'account')
+        assert set(cache.get_index('database')) == {'ANALYTICS'}
+        cache.close()
+
+    def test_entries_are_keyed_by_account_and_role(self, tmp_path, clock):
+        """
+        Test that an inventory cached for one account and role is not seen by another.
+        """
+        path = str(tmp_path / 'cache.db')
+        RemoteStateCache(path, 'account', role='sysadmin').put_index('database', INDEX)
+
+        assert RemoteStateCache(path, 'ACCOUNT', role='SYSADMIN').get_index('database') is not None
+        assert RemoteStateCache(path, 'other', role='sysadmin').get_index('database') is None
+        assert RemoteStateCache(path, 'account', role='public').get_index('database') is None
+        assert RemoteStateCache(path, 'account').get_index('database') is None
+
+    @pytest.mark.parametrize('engine', [SnowflakeState, AsyncSnowflakeState])
+    def test_apply_invalidates_changed_types(self, engine, config_path, fake_root, tmp_path):
+        """
+        Test that a real apply drops the inventory of each type it changed and keeps the unchanged ones.
+        """
+        root = fake_root(databases={'ANALYTICS': {'kind': 'PERMANENT'}},
+                         warehouses={'COMPUTE_WH': {'size': 'X-Small', 'auto_resume': 'true'}})
+        path = config_path(CONFIG)
+        cache = RemoteStateCache(str(tmp_path / 'cache.db'), 'account')
+        engine(root, cache=cache).apply_configuration(path)
+        engine(root, cache=cache).apply_configuration(path)
+        assert (root.calls['databases.iter'], root.calls['warehouses.iter']) == (1, 1)
+
+        report = engine(root, cache=cache).apply_configuration(path, dry_run=False)
+        assert report.objects_created == 1
+
+        report = engine(root, cache=cache).apply_configuration(path)
+        assert report.changes['database'][1].status == ChangeStatus.NO_CHANGE
+        assert (root.calls['databases.iter'], root.calls['warehouses.iter']) == (2, 1)
+        cache.close()
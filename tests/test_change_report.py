@@ -0,0 +1,87 @@
+import copy
+import json
+import pickle
+
+from snowflake_declarative.models.change_report import ChangeRecord, ChangeReport, ChangeStatus, ObjectChangeEntry
+from snowflake_declarative.models.differences import DifferenceRecord, ObjectDifference
+
+def build_mixed_report():
+    report = ChangeReport()
+    report.add_change('database', ObjectChangeEntry(
+        name='ANALYTICS', type='database', status=ChangeStatus.UPDATED,
+        differences=[ObjectDifference(field='comment', expected='a', actual='b')]
+    ))
+    report.add_change('database', ChangeRecord('STAGING', 'database', ChangeStatus.CREATED))
+    report.add_change('warehouse', ChangeRecord('LOADING', 'warehouse', 'ERROR', error='boom'))
+    return report
+
+class TestChangeReport:
+    def test_records_and_models_serialize_alike(self):
+        """
+        Test that records and pydantic entries produce the same to_dict and model_dump shapes.
+        """
+        report = build_mixed_report()
+        expected_changes = {
+            'database': [
+                {'name': 'ANALYTICS', 'type': 'database', 'status': ChangeStatus.UPDATED,
+                 'differences': [{'field': 'comment', 'expected': 'a', 'actual': 'b'}], 'error': None},
+                {'name': 'STAGING', 'type': 'database', 'status': ChangeStatus.CREATED,
+                 'differences': None, 'error': None},
+            ],
+            'warehouse': [
+                {'name': 'LOADING', 'type': 'warehouse', 'status': ChangeStatus.ERROR,
+                 'differences': None, 'error': 'boom'},
+            ],
+        }
+        data = report.to_dict()
+        assert data['changes'] == expected_changes
+        assert report.model_dump()['changes'] == expected_changes
+        assert json.loads(report.model_dump_json())['objects_with_errors'] == 1
+
+    def test_counters_follow_statuses(self):
+        """
+        Test that the summary counters are derived from the statuses of added entries.
+        """
+        report = build_mixed_report()
+        assert (report.total_objects, report.objects_created, report.objects_updated,
+                report.objects_no_change, report.objects_with_errors) == (3, 1, 1, 0, 1)
+        assert 'Objects with Errors: 1' in report.summary()
+
+    def test_changes_materializes_pydantic_entries(self):
+        """
+        Test that changes returns pydantic entries while records keeps the compact form.
+        """
+        report = build_mixed_report()
+        entry = report.changes['database'][0]
+        assert isinstance(entry, ObjectChangeEntry)
+        assert isinstance(entry.differences[0], ObjectDifference)
+        assert str(entry.differences[0]) == "comment: expected 'a', got 'b'"
+        record = report.records['database'][0]
+        assert isinstance(record, ChangeRecord)
+        assert record.differences == [DifferenceRecord('comment', 'a', 'b')]
+        assert record.differences[0] == ObjectDifference(field='comment', expected='a', actual='b')
+
+    def test_round_trips_through_validation(self):
+        """
+        Test that validating to_dict and JSON output rebuilds the entries and counters.
+        """
+        report = build_mixed_report()
+        report.metrics = {'phases': {'load': 0.5}}
+        for restored in (ChangeReport.model_validate(report.to_dict()),
+                         ChangeReport.model_validate_json(report.model_dump_json())):
+            assert restored.to_dict() == report.to_dict()
+            assert restored.objects_with_errors == 1
+            assert isinstance(restored.records['database'][0], ChangeRecord)
+
+    def test_copies_get_their_own_lock(self):
+        """
+        Test that deep copies and pickled reports are independent and can still be added to.
+        """
+        report = build_mixed_report()
+        for copied in (copy.deepcopy(report), report.model_copy(deep=True), pickle.loads(pickle.dumps(report))):
+            assert copied.to_dict() == report.to_dict()
+            copied.add_change('warehouse', ChangeRecord('NEW', 'warehouse', ChangeStatus.CREATED))
+            copied.records['database'][0].status = ChangeStatus.ERROR
+            assert copied.total_objects == 4
+        assert report.total_objects == 3
+        assert report.records['database'][0].status == ChangeStatus.UPDATED
@@ -0,0 +1,15 @@
+import pytest
+
+from snowflake_connection import parse_arguments
+
+class TestParseArguments:
+    def test_async_rejects_ddl_batching(self, capsys):
+        """
+        Test that asking the asyncio engine for DDL batches fails instead of silently dropping the option.
+        """
+        with pytest.raises(SystemExit):
+            parse_arguments(['--async', '--ddl-batch-size', '10'])
+        assert '--ddl-batch-size cannot be combined with --async' in capsys.readouterr().err
+
+        assert parse_arguments(['--async']).use_async
+        assert parse_arguments(['--ddl-batch-size', '10']).ddl_batch_size == 10
@@ -0,0 +1,118 @@
+import pytest
+
+from snowflake_declarative.handlers.database import DatabaseHandler
+from snowflake_declarative.models.change_report import ChangeStatus
+from snowflake_declarative.models.database import SnowflakeDatabase
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.scheduler import DependencyCycleError
+
+CONFIG = """\
+databases:
+  - name: DEV_1
+    clone_from: TEMPLATE
+  - name: DEV_2
+    clone_from:
+      name: TEMPLATE
+      before:
+        offset: -3600
+    comment: Second copy
+  - name: TEMPLATE
+    comment: Template
+    data_retention_time_in_days: 7
+"""
+
+CYCLE = """\
+databases:
+  - name: PLAIN
+  - name: DEV_A
+    clone_from: DEV_B
+  - name: DEV_B
+    clone_from: DEV_A
+  - name: DEV_C
+    clone_from: DEV_B
+"""
+
+class TestClone:
+    def test_create_sql_clones_with_time_travel(self):
+        """
+        Test that a clone source and point in time become the CLONE clause of the CREATE statement.
+        """
+        handler = DatabaseHandler(None)
+        database = SnowflakeDatabase(name='dev', kind='TRANSIENT', comment='Dev',
+                                     clone_from={'name': 'template', 'at': {'statement': '01b2-c3'}})
+        assert handler.get_create_sql(database) == (
+            "CREATE TRANSIENT DATABASE IF NOT EXISTS DEV CLONE TEMPLATE AT (STATEMENT => '01b2-c3') COMMENT = 'Dev'"
+        )
+        assert handler.get_dependencies(database) == [('database', 'TEMPLATE')]
+
+    def test_create_sql_keeps_only_clone_parameters(self):
+        """
+        Test that a clone's CREATE carries only the parameters CLONE accepts and other parameters fall back to the API.
+        """
+        handler = DatabaseHandler(None)
+        database = SnowflakeDatabase(name='dev', clone_from='template', data_retention_time_in_days=3,
+                                     max_data_extension_time_in_days=10, default_ddl_collation='UTF8_CI',
+                                     comment='Dev')
+        assert handler.get_create_sql(database) == (
+            "CREATE DATABASE IF NOT EXISTS DEV CLONE TEMPLATE DATA_RETENTION_TIME_IN_DAYS = 3 "
+            "MAX_DATA_EXTENSION_TIME_IN_DAYS = 10 DEFAULT_DDL_COLLATION = 'UTF8_CI' COMMENT = 'Dev'"
+        )
+        assert handler.get_create_sql(database.model_copy(update={'log_level': 'INFO'})) is None
+
+    def test_invalid_clone_sources(self):
+        """
+        Test that self-clones, two points in time and empty points in time are rejected.
+        """
+        with pytest.raises(ValueError):
+            SnowflakeDatabase(name='dev', clone_from='DEV')
+        with pytest.raises(ValueError):
+            SnowflakeDatabase(name='dev', clone_from={'name': 't', 'at': {'offset': -1}, 'before': {'offset': -1}})
+        with pytest.raises(ValueError):
+            SnowflakeDatabase(name='dev', clone_from={'name': 't', 'at': {}})
+
+    @pytest.mark.parametrize('engine,ddl_batch_size', [
+        (SnowflakeState, 0), (SnowflakeState, 10), (AsyncSnowflakeState, 0)
+    ])
+    def test_apply_clones_after_template(self, engine, ddl_batch_size, config_path, fake_root):
+        """
+        Test that clones are created from the configured template once it exists and inherit its properties.
+        """
+        root = fake_root()
+        kwargs = {'ddl_batch_size': ddl_batch_size} if ddl_batch_size else {}
+        report = engine(root, **kwargs).apply_configuration(config_path(CONFIG), dry_run=False, concurrency=4)
+        assert report.objects_created == 3 and report.objects_with_errors == 0
+        assert root.databases.get('DEV_1').comment == 'Template'
+        assert (root.databases.get('DEV_2').comment, root.databases.get('DEV_2').data_retention_time_in_days) == (
+            'Second copy', 7
+        )
+
+    def test_failed_template_skips_clones(self, config_path, fake_root):
+        """
+        Test that clones are not attempted when their template could not be created.
+        """
+        root = fake_root(fail_names=['TEMPLATE'])
+        report = SnowflakeState(root).apply_configuration(config_path(CONFIG), dry_run=False)
+        statuses = [(entry.name, entry.status) for entry in report.changes['database']]
+        assert statuses == [('DEV_1', ChangeStatus.ERROR), ('DEV_2', ChangeStatus.ERROR), ('TEMPLATE', ChangeStatus.ERROR)]
+        assert 'depends on database' in report.changes['database'][0].error
+        assert root.calls['databases.create'] == 1
+
+    @pytest.mark.parametrize('engine', [SnowflakeState, AsyncSnowflakeState])
+    def test_clone_cycle_changes_nothing(self, engine, config_path, fake_root):
+        """
+        Test that a clone cycle is rejected before objects without dependencies are created.
+        """
+        root = fake_root()
+        with pytest.raises(DependencyCycleError):
+            engine(root).apply_configuration(config_path(CYCLE), dry_run=False, concurrency=4)
+        assert 'PLAIN' not in root.databases
+        assert root.calls['databases.create'] == 0
+
+    def test_validate_names_clone_cycle(self, config_path):
+        """
+        Test that offline validation rejects a clone cycle and names only the databases on it.
+        """
+        with pytest.raises(DependencyCycleError) as error:
+            SnowflakeState(None).validate_configuration(config_path(CYCLE))
+        assert str(error.value) == "Dependency cycle between database 'DEV_A', database 'DEV_B'"
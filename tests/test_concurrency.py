@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.concurrency import AdaptiveConcurrency
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.metrics import format_openmetrics
+from snowflake_declarative.state.ratelimit import ApiCallPolicy
+from snowflake_declarative.testing import FakeRoot
+
+KEY = ('database', 'create')
+
+def run_round(limiter, latency, throttled=False):
+    """Complete one limit's worth of calls with the same outcome, refilling each freed slot like busy workers"""
+    for _ in range(limiter.current):
+        while limiter.in_flight < limiter.current:
+            limiter.acquire()
+        limiter.release(KEY, latency, throttled)
+
+class TestAdaptiveConcurrency:
+    def test_grows_while_latency_is_flat(self):
+        """
+        Test that the limit grows by about one per fully used round-trip at steady latency.
+        """
+        limiter = AdaptiveConcurrency(initial=2, max_limit=6)
+        run_round(limiter, 0.01)
+        assert limiter.limit == pytest.approx(2.9)
+        for _ in range(10):
+            run_round(limiter, 0.01)
+        assert limiter.current == 6
+
+    def test_unused_limit_does_not_grow(self):
+        """
+        Test that calls completing below the limit leave it unchanged.
+        """
+        limiter = AdaptiveConcurrency(initial=4)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(KEY, 0.01)
+        assert limiter.limit == 4
+
+    def test_backs_off_once_per_round_on_throttling(self):
+        """
+        Test that a burst of throttled calls shrinks the limit once, not once per call.
+        """
+        limiter = AdaptiveConcurrency(initial=8)
+        for _ in range(8):
+            limiter.acquire()
+        assert limiter.release(KEY, None, throttled=True) == 6
+        assert [limiter.release(KEY, None, throttled=True) for _ in range(5)] == [None] * 5
+        assert limiter.release(KEY, None, throttled=True) == 4
+
+    def test_backs_off_on_latency_spike(self):
+        """
+        Test that latency well above a key's baseline shrinks the limit.
+        """
+        limiter = AdaptiveConcurrency(initial=4, max_limit=16)
+        run_round(limiter, 0.01)
+        for _ in range(3):
+            run_round(limiter, 0.05)
+        assert limiter.current < 4
+
+    def test_async_waiters_are_woken(self):
+        """
+        Test that asyncio tasks wait for a slot without blocking the loop and never exceed the limit.
+        """
+        limiter = AdaptiveConcurrency(initial=2, max_limit=2)
+        in_flight, peak = [0], [0]
+
+        async def call():
+            await limiter.acquire_async()
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.001)
+            in_flight[0] -= 1
+            limiter.release(KEY, 0.001)
+
+        async def main():
+            await asyncio.gather(*(call() for _ in range(10)))
+
+        asyncio.run(main())
+        assert peak[0] == 2 and limiter.in_flight == 0
+
+    @pytest.mark.parametrize('engine', [SnowflakeState, AsyncSnowflakeState])
+    def test_engine_reports_limit_gauge(self, engine, tmp_path):
+        """
+        Test that an adaptive run stays within a concurrency-throttled account and reports its limit.
+        """
+        config = tmp_path / 'config.yaml'
+        config.write_text('databases:\n' + ''.join(f'  - name: DB_{i}\n' for i in range(40)))
+        root = FakeRoot(latency=0.002, max_concurrent=3)
+        limiter = AdaptiveConcurrency(initial=2, max_limit=8)
+        policy = ApiCallPolicy(base_delay=0.001, concurrency=limiter)
+
+        report = engine(root, api_policy=policy).apply_configuration(str(config), dry_run=False, concurrency=8)
+        assert report.objects_with_errors == 0
+        assert report.objects_created == 40
+        gauge = report.metrics['gauges']['concurrency_limit']
+        assert gauge['samples'][0][1] == 2
+        assert gauge['min'] >= 1 and gauge['max'] <= 8
+        assert 'snowmaker_concurrency_limit{stat="last"}' in format_openmetrics(report.metrics)
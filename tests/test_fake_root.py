@@ -0,0 +1,234 @@
+import asyncio
+
+import pytest
+
+from snowflake_declarative.handlers.database import AsyncDatabaseHandler, DatabaseHandler
+from snowflake_declarative.models.change_report import ChangeStatus
+from snowflake_declarative.state.cache import RemoteStateCache
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.testing import FakeRoot, FakeSnowflakeError
+
+CONFIG = """\
+databases:
+  - name: ANALYTICS
+    comment: Analytics production database
+    data_retention_time_in_days: 1
+  - name: STAGING
+    comment: Staging database
+    data_retention_time_in_days: 1
+
+warehouses:
+  - name: COMPUTE_WH
+    size: X-SMALL
+    auto_suspend: 300
+    comment: Default warehouse
+"""
+
+@pytest.fixture
+def root(fake_root):
+    return fake_root(
+        databases={'ANALYTICS': {'comment': 'Analytics production database', 'kind': 'PERMANENT',
+                                 'data_retention_time_in_days': 7}},
+        warehouses={'COMPUTE_WH': {'size': 'X-Small', 'auto_suspend': 300, 'auto_resume': 'true',
+                                   'comment': 'Default warehouse'}},
+        seed=0
+    )
+
+def statuses(report):
+    return {entry.name: entry.status for entries in report.changes.values() for entry in entries}
+
+class TestFakeRoot:
+    def test_like_is_case_insensitive_with_wildcards(self, root):
+        """
+        Test that ``iter(like=...)`` follows Snowflake LIKE semantics.
+        """
+        root.databases.add('ANALYTICSX')
+        assert [db.name for db in root.databases.iter(like='analytics')] == ['ANALYTICS']
+        assert sorted(db.name for db in root.databases.iter(like='ANALYTIC_')) == ['ANALYTICS']
+        assert sorted(db.name for db in root.databases.iter(like='analytics%')) == ['ANALYTICS', 'ANALYTICSX']
+
+    def test_create_modes(self, root):
+        """
+        Test that creating an existing object honours the create mode.
+        """
+        existing = root.databases.get('ANALYTICS')
+        root.databases.create(existing, mode='ifNotExists')
+        with pytest.raises(FakeSnowflakeError):
+            root.databases.create(existing)
+        assert root.calls['databases.create'] == 2
+
+    def test_sql_create_and_alter(self, root):
+        """
+        Test that the fake cursor applies multi-statement CREATE and ALTER ... SET.
+        """
+        cursor = root.connection.cursor()
+        cursor.execute(
+            "CREATE TRANSIENT DATABASE IF NOT EXISTS RAW COMMENT = 'it\\'s raw';\n"
+            "ALTER WAREHOUSE COMPUTE_WH SET WAREHOUSE_SIZE = 'LARGE' AUTO_SUSPEND = 60",
+            num_statements=2
+        )
+        assert cursor.nextset()
+        assert cursor.nextset() is None
+        raw = root.databases.get('RAW')
+        assert (raw.kind, raw.comment) == ('TRANSIENT', "it's raw")
+        warehouse = root.warehouses.get('COMPUTE_WH')
+        assert (warehouse.size, warehouse.auto_suspend) == ('LARGE', 60)
+
+    def test_lookup_ignores_like_wildcard_matches(self, root):
+        """
+        Test that a name whose ``_`` matches another object's name through LIKE is not treated as existing.
+        """
+        assert DatabaseHandler(root).get_existing('ANALYTIC_') is None
+        assert DatabaseHandler(root).get_existing('analytics').name == 'ANALYTICS'
+        assert asyncio.run(AsyncDatabaseHandler(root).get_existing('ANALYTIC_')) is None
+
+    def test_injected_errors(self):
+        """
+        Test that every call fails at an error rate of one and named objects always fail.
+        """
+        root = FakeRoot(error_rate=1.0)
+        with pytest.raises(FakeSnowflakeError):
+            list(root.databases.iter())
+        root = FakeRoot(fail_names=['BROKEN'])
+        with pytest.raises(FakeSnowflakeError):
+            root.connection.cursor().execute('CREATE DATABASE BROKEN')
+
+class TestSnowflakeStateWithFakeRoot:
+    def test_dry_run_plans_changes(self, root, config_path):
+        """
+        Test a dry run against the fake: drift, a missing object and an unchanged warehouse.
+        """
+        report = SnowflakeState(root).apply_configuration(config_path(CONFIG), dry_run=True)
+        assert statuses(report) == {
+            'ANALYTICS': ChangeStatus.UPDATED,
+            'STAGING': ChangeStatus.CREATED,
+            'COMPUTE_WH': ChangeStatus.NO_CHANGE,
+        }
+        assert 'STAGING' not in root.databases
+
+    @pytest.mark.parametrize('ddl_batch_size', [0, 10])
+    def test_apply_creates_missing_objects(self, root, config_path, ddl_batch_size):
+        """
+        Test that applying creates missing objects through the SDK or batched SQL.
+        """
+        state = SnowflakeState(root, ddl_batch_size=ddl_batch_size)
+        report = state.apply_configuration(config_path(CONFIG), dry_run=False)
+        assert statuses(report)['STAGING'] == ChangeStatus.CREATED
+        assert root.databases.get('STAGING').comment == 'Staging database'
+
+    @pytest.mark.parametrize('concurrency,ddl_batch_size', [(1, 0), (4, 0), (1, 10)])
+    def test_invalid_object_leaves_account_unchanged(self, root, config_path, concurrency, ddl_batch_size):
+        """
+        Test that nothing is created or altered when the last object of the config is invalid.
+        """
+        path = config_path(CONFIG + "  - name: BROKEN_WH\n    auto_suspend: never\n")
+        state = SnowflakeState(root, ddl_batch_size=ddl_batch_size)
+        with pytest.raises(ValueError):
+            state.apply_configuration(path, dry_run=False, concurrency=concurrency)
+        assert 'STAGING' not in root.databases
+        assert root.databases.get('ANALYTICS').data_retention_time_in_days == 7
+        assert root.calls['databases.create'] == 0 and root.calls['sql.execute'] == 0
+
+    def test_changed_only_ignores_volatile_state(self, root, config_path, tmp_path, monkeypatch):
+        """
+        Test that changed-only planning still skips an object whose only change is its running state.
+        """
+        warehouse = root.warehouses.get('COMPUTE_WH')
+        warehouse.state, warehouse.running = 'STARTED', 0
+        path = config_path(CONFIG)
+        cache = RemoteStateCache(str(tmp_path / 'cache.db'), 'account', ttl=0)
+        SnowflakeState(root, cache=cache).apply_configuration(path, changed_only=True)
+
+        state = SnowflakeState(root, cache=cache)
+        compared = []
+        compare_existing = state.compare_existing
+        monkeypatch.setattr(state, 'compare_existing',
+                            lambda obj_type, obj, *args: compared.append(obj.name) or compare_existing(obj_type, obj, *args))
+        warehouse.state, warehouse.running = 'SUSPENDED', 3
+        state.apply_configuration(path, changed_only=True)
+        assert compared == ['ANALYTICS']
+
+        compared.clear()
+        warehouse.auto_suspend = 60
+        state.apply_configuration(path, changed_only=True)
+        assert compared == ['ANALYTICS', 'COMPUTE_WH']
+
+    @pytest.mark.parametrize('engine,concurrency', [(SnowflakeState, 1), (SnowflakeState, 4),
+                                                    (AsyncSnowflakeState, 4)])
+    def test_each_type_is_listed_once(self, engine, concurrency, root, config_path):
+        """
+        Test that every object is looked up in one listing per type rather than with a call per object.
+        """
+        databases = ''.join(f"  - name: DB_{i}\n" for i in range(20))
+        path = config_path(f"databases:\n{databases}warehouses:\n  - name: COMPUTE_WH\n  - name: LOADING_WH\n")
+        report = engine(root).apply_configuration(path, dry_run=True, concurrency=concurrency)
+        assert report.objects_created == 21
+        assert (root.calls['databases.iter'], root.calls['warehouses.iter']) == (1, 1)
+
+    def test_apply_reports_injected_failures(self, root, config_path):
+        """
+        Test that an injected failure is reported as an error for that object only.
+        """
+        root.fail_names.add('STAGING')
+        report = SnowflakeState(root, ddl_batch_size=10).apply_configuration(config_path(CONFIG), dry_run=False)
+        assert statuses(report)['STAGING'] == ChangeStatus.ERROR
+        assert report.objects_with_errors == 1
+
+    def test_async_state(self, root, config_path):
+        """
+        Test that the asyncio engine runs against the fake's ``*_async`` API.
+        """
+        report = AsyncSnowflakeState(root).apply_configuration(config_path(CONFIG), dry_run=True, concurrency=4)
+        assert statuses(report)['STAGING'] == ChangeStatus.CREATED
+        assert root.calls['databases.iter'] == 1
+
+class TestSnowflakeConnectorWithFakeRoot:
+    def test_connector_uses_pooled_fake_sessions(self, root):
+        """
+        Test that the connector lists databases and runs queries on its one session, logging in only once.
+        """
+        from snowflake_connector.connection import SnowflakeConnector
+        from snowflake_connector.pool import SessionPool
+
+        logins = []
+        pool = SessionPool(lambda: logins.append(1) or root.session(), max_size=2)
+        connector = SnowflakeConnector(
+            {'account': 'fake', 'user': 'fake', 'password': 'fake'},
+            pool=pool,
+            root_factory=lambda session: session.root
+        )
+        connector.create_session()
+        try:
+            assert connector.list_databases() == ['ANALYTICS']
+            assert connector.execute_query('SELECT CURRENT_VERSION()') == [('0.0.0-fake',)]
+            assert len(logins) == 1
+            # Only overlapping calls need a second pooled session
+            with connector.session() as first, connector.session() as second:
+                assert first is not second
+            assert len(logins) == 2
+        finally:
+            connector.close_session()
+            pool.close()
+
+    def test_connector_streams_query_results(self, root):
+        """
+        Test that streamed query results arrive in batches and release their session when done.
+        """
+        from snowflake_connector.connection import SnowflakeConnector
+        from snowflake_connector.pool import SessionPool
+
+        root.queries['SELECT * FROM EVENTS'] = [(i, f"event {i}") for i in range(25)]
+        pool = SessionPool(root.session, max_size=1)
+        connector = SnowflakeConnector({'account': 'fake', 'user': 'fake', 'password': 'fake'}, pool=pool)
+        try:
+            with connector.stream_query('SELECT * FROM EVENTS', batch_size=10) as stream:
+                assert stream.columns == ['COLUMN1', 'COLUMN2']
+                assert [len(batch) for batch in stream.batches()] == [10, 10, 5]
+            rows = connector.iter_query('SELECT * FROM EVENTS', batch_size=4)
+            assert next(rows) == (0, 'event 0')
+            rows.close()
+            # Closing the iterator early returned the only session to the pool
+            assert list(connector.iter_query('SELECT * FROM EVENTS')) == root.queries['SELECT * FROM EVENTS']
+        finally:
+            pool.close()
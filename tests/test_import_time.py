@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time allowed for the CLI module, in milliseconds
+IMPORT_BUDGET_MS = float(os.getenv('SNOW_MAKER_IMPORT_BUDGET_MS', '250'))
+
+SDK_MODULES = ('snowflake.core', 'snowflake.snowpark', 'snowflake.connector')
+
+def run_importtime(*args):
+    """
+    Run Python with ``-X importtime`` from the repository root.
+
+    :return: Completed process and a mapping of module name to cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+    return result, modules
+
+def sdk_imports(modules):
+    return sorted(name for name in modules if name.startswith(SDK_MODULES))
+
+class TestImportTime:
+    def test_cli_import_within_budget(self):
+        """
+        Test that importing the CLI module stays within the startup budget.
+        """
+        result, modules = run_importtime('-c', 'import snowflake_connection')
+        assert result.returncode == 0, result.stderr
+        
+        elapsed_ms = modules['snowflake_connection'] / 1000
+        assert elapsed_ms <= IMPORT_BUDGET_MS, (
+            f"Importing snowflake_connection took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+        )
+        assert sdk_imports(modules) == []
+    
+    def test_package_import_is_lazy(self):
+        """
+        Test that importing the declarative package does not load the engine or the SDK.
+        """
+        result, modules = run_importtime('-c', 'import snowflake_declarative')
+        assert result.returncode == 0, result.stderr
+        assert 'snowflake_declarative.state.manager' not in modules
+        assert sdk_imports(modules) == []
+    
+    @pytest.mark.parametrize('config', ['config/base_config.yaml', 'config'])
+    def test_validate_does_not_import_sdk(self, config):
+        """
+        Test that the validate subcommand checks a config without importing the Snowflake SDK.
+        """
+        result, modules = run_importtime('snowflake_connection.py', 'validate', '-c', config)
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert 'is valid' in result.stdout
+        assert sdk_imports(modules) == []
+    
+    def test_validate_rejects_invalid_config(self, tmp_path):
+        """
+        Test that the validate subcommand exits non-zero for an invalid config.
+        """
+        config = tmp_path / 'invalid.yaml'
+        config.write_text('databases:\n  - name: ANALYTICS\n    data_retention_time_in_days: often\n')
+        
+        result, modules = run_importtime('snowflake_connection.py', 'validate', '-c', str(config))
+        assert result.returncode == 1
+        assert 'is invalid' in result.stdout
+        assert sdk_imports(modules) == []
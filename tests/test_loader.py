@@ -0,0 +1,95 @@
+import pytest
+
+from snowflake_declarative.state import loader
+from snowflake_declarative.state.loader import DuplicateObjectError, ParsedConfigCache, iter_config_tree
+from snowflake_declarative.state.manager import SnowflakeState
+
+FILES = {
+    'databases.yaml': "databases:\n  - name: ANALYTICS\n  - name: STAGING\n",
+    'teams/finance.yml': "databases:\n  - name: FINANCE\nwarehouses:\n  - name: FINANCE_WH\n",
+    'warehouses.yaml': "warehouses:\n  - name: COMPUTE_WH\n    size: SMALL\n",
+}
+
+@pytest.fixture
+def config_dir(config_path, tmp_path):
+    for name, text in FILES.items():
+        config_path(text, name=f"conf/{name}")
+    return str(tmp_path / 'conf')
+
+def names(objects):
+    return [(obj_type, obj.name) for obj_type, obj in objects]
+
+class TestYamlSections:
+    def test_anchor_in_skipped_key_is_usable_in_sections(self, config_path):
+        """
+        Test that an anchor defined under a key that is not an object section can be merged into an object.
+        """
+        path = config_path(
+            "defaults: &defaults\n"
+            "  comment: Shared\n"
+            "  data_retention_time_in_days: 3\n"
+            "databases:\n"
+            "  - name: ANALYTICS\n"
+            "    <<: *defaults\n"
+        )
+        configs = SnowflakeState(None).load_yaml_config(path)
+        database = configs['database'][0]
+        assert (database.name, database.comment, database.data_retention_time_in_days) == ('ANALYTICS', 'Shared', 3)
+
+class TestConfigTree:
+    @pytest.mark.parametrize('pattern', ['', '*.yaml'])
+    def test_tree_is_parsed_on_a_process_pool(self, pattern, config_dir, monkeypatch):
+        """
+        Test that a directory or glob is parsed by worker processes and merged in sorted path order.
+        """
+        pools = []
+
+        class RecordingPool(loader.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(loader, 'ProcessPoolExecutor', RecordingPool)
+        path = f"{config_dir}/{pattern}" if pattern else config_dir
+        configs = SnowflakeState(None, parse_workers=2).load_yaml_config(path)
+
+        assert len(pools) == 1
+        expected = {
+            '': {'database': ['ANALYTICS', 'STAGING', 'FINANCE'], 'warehouse': ['FINANCE_WH', 'COMPUTE_WH']},
+            '*.yaml': {'database': ['ANALYTICS', 'STAGING'], 'warehouse': ['COMPUTE_WH']},
+        }[pattern]
+        assert {obj_type: [obj.name for obj in objects] for obj_type, objects in configs.items()} == expected
+
+    def test_object_declared_in_two_files_is_rejected(self, config_dir, config_path):
+        """
+        Test that the same object in two files raises an error naming both files.
+        """
+        config_path("databases:\n  - name: analytics\n", name='conf/zz_dup.yaml')
+        with pytest.raises(DuplicateObjectError) as error:
+            SnowflakeState(None, parse_workers=2).load_yaml_config(config_dir)
+        message = str(error.value)
+        assert message.startswith("Database 'ANALYTICS' is declared in both")
+        assert message.index('databases.yaml') < message.index('zz_dup.yaml')
+
+    def test_parsed_cache_hits_and_misses(self, config_dir, config_path, tmp_path, monkeypatch):
+        """
+        Test that unchanged files are served from the parsed-model cache and an edited file is parsed again.
+        """
+        parsed = []
+        parse_config_file = loader.parse_config_file
+        monkeypatch.setattr(loader, 'parse_config_file',
+                            lambda path, object_types: parsed.append(path) or parse_config_file(path, object_types))
+        object_types = SnowflakeState(None).object_types
+
+        def load():
+            parsed.clear()
+            cache = ParsedConfigCache(str(tmp_path / 'parsed'), object_types)
+            return names(iter_config_tree(config_dir, object_types, workers=1, cache=cache))
+
+        first = load()
+        assert len(parsed) == 3
+        assert load() == first and parsed == []
+
+        config_path("warehouses:\n  - name: REPORTING_WH\n", name='conf/warehouses.yaml')
+        assert load()[-1] == ('warehouse', 'REPORTING_WH')
+        assert [path.rsplit('/', 1)[-1] for path in parsed] == ['warehouses.yaml']
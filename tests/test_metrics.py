@@ -0,0 +1,60 @@
+import pytest
+
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.metrics import RunMetrics, format_openmetrics, write_openmetrics
+
+CONFIG = """\
+databases:
+  - name: ANALYTICS
+    data_retention_time_in_days: 1
+  - name: STAGING
+  - name: BROKEN
+"""
+
+class TestRunMetrics:
+    def test_percentiles_and_errors(self):
+        """
+        Test latency percentiles, cumulative buckets and error counts for one operation.
+        """
+        metrics = RunMetrics()
+        for ms in range(1, 101):
+            metrics.record_call('database', 'create', ms / 1000, error=ms > 98)
+        stats = metrics.to_dict()['api_calls']['database']['create']
+        assert (stats['count'], stats['errors']) == (100, 2)
+        assert (stats['p50'], stats['p95'], stats['p99']) == (0.05, 0.095, 0.099)
+        assert stats['buckets']['0.01'] == 10
+        assert stats['buckets']['0.1'] == 100
+
+    def test_timed_records_failures(self):
+        """
+        Test that a failing call is timed, counted as an error and re-raised.
+        """
+        metrics = RunMetrics()
+        with pytest.raises(RuntimeError):
+            with metrics.timed('warehouse', 'get'):
+                raise RuntimeError('boom')
+        assert metrics.to_dict()['api_calls']['warehouse']['get']['errors'] == 1
+
+    def test_report_carries_phase_and_api_metrics(self, config_path, fake_root, tmp_path):
+        """
+        Test that an apply run embeds phase timings and API latencies and exports them as OpenMetrics.
+        """
+        root = fake_root({'ANALYTICS': {'kind': 'PERMANENT', 'data_retention_time_in_days': 1}}, fail_names=['BROKEN'])
+        report = SnowflakeState(root, ddl_batch_size=10).apply_configuration(config_path(CONFIG), dry_run=False)
+
+        metrics = report.to_dict()['metrics']
+        assert {'load', 'validate', 'fetch', 'diff', 'create', 'report'} <= set(metrics['phases'])
+        assert metrics['phases']['validate']['count'] == 3
+        assert metrics['api_calls']['database']['list']['count'] == 1
+        # One failed batch, then each statement replayed on its own
+        assert metrics['api_calls']['ddl']['execute_batch']['count'] == 3
+        assert metrics['api_calls']['ddl']['execute_batch']['errors'] == 2
+
+        path = tmp_path / 'metrics' / 'snowmaker.prom'
+        write_openmetrics(metrics, str(path))
+        text = path.read_text()
+        assert text == format_openmetrics(metrics)
+        assert text.endswith('# EOF\n')
+        assert 'snowmaker_phase_seconds{phase="diff"}' in text
+        assert 'snowmaker_api_call_seconds_bucket{handler="database",operation="list",le="+Inf"} 1' in text
+        assert 'snowmaker_api_call_errors{handler="ddl",operation="execute_batch"} 2' in text
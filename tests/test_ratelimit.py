@@ -0,0 +1,97 @@
+import pytest
+
+from snowflake_declarative.models.change_report import ChangeStatus
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.metrics import RunMetrics, format_openmetrics
+from snowflake_declarative.state.ratelimit import ApiCallPolicy, RetryBudget, TokenBucket, is_retryable
+from snowflake_declarative.testing import FakeSnowflakeError
+
+CONFIG = """\
+databases:
+  - name: ANALYTICS
+  - name: STAGING
+"""
+
+def flaky(failures, status=503):
+    """A call that fails ``failures`` times with ``status`` and then returns the number of attempts"""
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        if len(attempts) <= failures:
+            raise FakeSnowflakeError('Service unavailable', status=status)
+        return len(attempts)
+    return call
+
+class TestRateLimit:
+    def test_token_bucket_spaces_calls(self):
+        """
+        Test that the bucket serves a burst immediately and then spaces reservations at its rate.
+        """
+        now = [0.0]
+        bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0])
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, pytest.approx(0.1), pytest.approx(0.2)]
+        now[0] = 1.0
+        assert bucket.reserve() == 0.0
+
+    def test_retryable_errors(self):
+        """
+        Test that throttling, availability and network errors are retryable and other failures are not.
+        """
+        assert is_retryable(FakeSnowflakeError('throttled', status=429))
+        assert is_retryable(FakeSnowflakeError('unavailable', status=503))
+        assert is_retryable(ConnectionResetError())
+        assert not is_retryable(FakeSnowflakeError('internal', status=500))
+        assert not is_retryable(ValueError('bad'))
+
+    def test_retries_transient_failures(self):
+        """
+        Test that transient failures are retried and counted, while permanent ones raise at once.
+        """
+        policy = ApiCallPolicy(base_delay=0)
+        metrics = RunMetrics()
+        assert policy.call(metrics, 'database', 'get', flaky(2)) == 3
+        with pytest.raises(FakeSnowflakeError):
+            policy.call(metrics, 'database', 'create', flaky(1, status=500))
+
+        calls = metrics.to_dict()['api_calls']['database']
+        assert (calls['get']['count'], calls['get']['errors'], calls['get']['retries']) == (3, 2, 2)
+        assert (calls['create']['count'], calls['create']['retries']) == (1, 0)
+        assert 'snowmaker_api_call_retries{handler="database",operation="get"} 2' in format_openmetrics(metrics.to_dict())
+
+    def test_budget_limits_retries_per_run(self):
+        """
+        Test that retries stop once the run's budget is spent and resume after a new run starts.
+        """
+        policy = ApiCallPolicy(max_attempts=10, base_delay=0, budget=RetryBudget(ratio=0, minimum=3))
+        with pytest.raises(FakeSnowflakeError):
+            policy.call(None, 'database', 'get', flaky(5))
+        assert (policy.budget.retries, policy.budget.exhausted) == (3, 1)
+        policy.start_run()
+        assert policy.call(None, 'database', 'get', flaky(3)) == 4
+
+    @pytest.mark.parametrize('engine', [SnowflakeState, AsyncSnowflakeState])
+    def test_failed_lookups_are_errors_not_creates(self, engine, config_path, fake_root):
+        """
+        Test that lookups failing after every retry report errors instead of planning creates.
+        """
+        root = fake_root(error_rate=1.0)
+        report = engine(root, api_policy=ApiCallPolicy(max_attempts=2, base_delay=0)).apply_configuration(config_path(CONFIG))
+        assert [entry.status for entry in report.changes['database']] == [ChangeStatus.ERROR] * 2
+        assert root.calls['databases.iter'] == 6
+
+    def test_rate_limit_stays_under_service_limit(self, config_path, fake_root):
+        """
+        Test that the client-side limit keeps a throttled account from rejecting batched creates.
+        """
+        def apply(rate_limit):
+            root = fake_root(rate_limit=2)
+            policy = ApiCallPolicy(rate_limit=rate_limit, max_attempts=1)
+            report = SnowflakeState(root, ddl_batch_size=1, api_policy=policy).apply_configuration(
+                config_path(CONFIG), dry_run=False
+            )
+            return root.throttled, report.objects_created, report.objects_with_errors
+
+        assert apply(None) == (1, 1, 1)
+        assert apply(1.8) == (0, 2, 0)
@@ -0,0 +1,102 @@
+import io
+import json
+
+import pytest
+
+Console = pytest.importorskip('rich.console').Console
+
+from benchmarks.suite import build_report, load_script
+from snowflake_declarative.models.change_report import ChangeStatus, ObjectChangeEntry
+from snowflake_declarative.state.report_stream import ChangeReportWriter
+
+stream = load_script('change_report_stream')
+
+PARTIAL_REPORT = {
+    'total_objects': 2,
+    'objects_created': 1,
+    'objects_updated': 0,
+    'objects_with_errors': 1,
+    'changes': {
+        'database': [
+            {'name': 'ANALYTICS', 'type': 'database', 'status': 'CREATED', 'differences': None, 'error': None},
+            {'name': 'A|B', 'type': 'database', 'status': 'ERROR', 'differences': None, 'error': 'boom <now>'},
+        ],
+        'schema': None,
+    },
+}
+
+def render_all(changes_file, tmp_path):
+    console = Console(file=io.StringIO(), width=120)
+    totals = stream.render_report(changes_file, [
+        stream.MarkdownRenderer(str(tmp_path / 'report.md')),
+        stream.HtmlRenderer(str(tmp_path / 'report.html')),
+        stream.TerminalRenderer(console),
+    ])
+    return totals, (tmp_path / 'report.md').read_text(), (tmp_path / 'report.html').read_text(), console.file.getvalue()
+
+class TestReportRenderers:
+    def test_reader_matches_json_load_across_chunk_boundaries(self, tmp_path, monkeypatch):
+        """
+        Test that the incremental reader yields every entry intact even when values straddle buffer refills.
+        """
+        path = tmp_path / 'changes.json'
+        report = build_report(50).to_dict()
+        path.write_text(json.dumps(report, indent=2))
+        monkeypatch.setattr(stream, 'CHUNK_SIZE', 7)
+
+        events = list(stream.read_report(str(path)))
+        entries = [(obj_type, entry) for kind, obj_type, entry in events if kind == 'change']
+        expected = [(obj_type, entry) for obj_type, section in report['changes'].items() for entry in section]
+        assert entries == expected
+        assert events[-1] == ('summary', None, {k: v for k, v in report.items() if k != 'changes'})
+
+    def test_missing_sections_and_null_differences(self, tmp_path):
+        """
+        Test that reports without a warehouse section, with a null section and null differences render.
+        """
+        path = tmp_path / 'changes.json'
+        path.write_text(json.dumps(PARTIAL_REPORT))
+        totals, markdown, html, terminal = render_all(str(path), tmp_path)
+
+        assert totals['total_objects'] == 2
+        assert '| A\\|B | ERROR | boom <now> |' in markdown
+        assert 'Warehouse' not in markdown
+        assert 'boom &lt;now&gt;' in html
+        assert 'Database Changes' in terminal and 'boom <now>' in terminal
+
+    def test_stream_and_document_render_the_same(self, tmp_path):
+        """
+        Test that a JSON Lines stream renders the same tables as the equivalent report document.
+        """
+        report = build_report(20)
+        document = tmp_path / 'changes.json'
+        document.write_text(json.dumps(report.to_dict()))
+        lines = str(tmp_path / 'changes.jsonl')
+        with ChangeReportWriter(lines) as writer:
+            for i, entry in enumerate(entry for entries in report.changes.values() for entry in entries):
+                writer.write_entry(entry, i)
+            writer.write_summary(report)
+
+        (tmp_path / 'doc').mkdir()
+        (tmp_path / 'lines').mkdir()
+        from_document = render_all(str(document), tmp_path / 'doc')
+        from_lines = render_all(lines, tmp_path / 'lines')
+        assert from_document[0] == from_lines[0]
+        assert from_document[0]['objects_updated'] == report.objects_updated
+        strip_date = lambda text: [line for line in text.splitlines() if 'Date:' not in line]
+        assert strip_date(from_document[1]) == strip_date(from_lines[1])
+        assert from_document[3] == from_lines[3]
+
+    def test_interrupted_stream_renders_decided_entries(self, tmp_path):
+        """
+        Test that a stream cut off mid-line renders the complete records before the cut.
+        """
+        path = tmp_path / 'changes.jsonl'
+        with ChangeReportWriter(str(path)) as writer:
+            for name in ('A', 'B'):
+                writer.write_entry(ObjectChangeEntry(name=name, type='warehouse', status=ChangeStatus.CREATED))
+        path.write_text(path.read_text()[:-10])
+
+        totals, markdown, _, _ = render_all(str(path), tmp_path)
+        assert totals['objects_created'] == 1
+        assert '| A | CREATED |  |' in markdown
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.report_stream import ChangeReportWriter, load_change_report
+
+CONFIG = """\
+warehouses:
+  - name: LOADING
+    size: SMALL
+databases:
+  - name: ANALYTICS
+    data_retention_time_in_days: 1
+  - name: STAGING
+  - name: BROKEN
+  - name: RAW
+"""
+
+EXISTING = {
+    'ANALYTICS': {'kind': 'PERMANENT', 'data_retention_time_in_days': 7},
+    'RAW': {'kind': 'PERMANENT'},
+}
+
+class TestChangeReportStream:
+    @pytest.mark.parametrize('engine,options', [
+        (SnowflakeState, {'concurrency': 1}),
+        (SnowflakeState, {'concurrency': 4}),
+        (AsyncSnowflakeState, {'concurrency': 4}),
+    ])
+    def test_stream_rebuilds_report(self, engine, options, config_path, fake_root, tmp_path):
+        """
+        Test that every entry is streamed once and the loaded stream matches the returned report.
+        """
+        stream_path = str(tmp_path / 'changes.jsonl')
+        root = fake_root(EXISTING, fail_names=['BROKEN'])
+        with ChangeReportWriter(stream_path) as sink:
+            report = engine(root, report_sink=sink).apply_configuration(config_path(CONFIG), dry_run=False, **options)
+
+        with open(stream_path) as f:
+            records = [json.loads(line) for line in f]
+        assert [r['record'] for r in records] == ['change'] * 5 + ['summary']
+        assert load_change_report(stream_path).to_dict() == report.to_dict()
+
+    def test_batched_creates_are_streamed_after_their_batch(self, config_path, fake_root, tmp_path):
+        """
+        Test that a create queued as batched DDL is streamed with its final status.
+        """
+        stream_path = str(tmp_path / 'changes.jsonl')
+        root = fake_root(EXISTING, fail_names=['BROKEN'])
+        with ChangeReportWriter(stream_path) as sink:
+            report = SnowflakeState(root, ddl_batch_size=10, report_sink=sink).apply_configuration(
+                config_path(CONFIG), dry_run=False
+            )
+
+        loaded = load_change_report(stream_path)
+        assert loaded.to_dict() == report.to_dict()
+        statuses = {entry.name: entry.status.value for entry in loaded.changes['database']}
+        assert statuses == {'ANALYTICS': 'UPDATED', 'STAGING': 'CREATED', 'BROKEN': 'ERROR', 'RAW': 'NO_CHANGE'}
+
+    def test_interrupted_stream_loads_partial_report(self, config_path, fake_root, tmp_path):
+        """
+        Test that a stream without a summary and with a cut-off last line still loads.
+        """
+        stream_path = str(tmp_path / 'changes.jsonl')
+        root = fake_root(EXISTING, fail_names=['BROKEN'])
+        with ChangeReportWriter(stream_path) as sink:
+            SnowflakeState(root, report_sink=sink).apply_configuration(config_path(CONFIG))
+        with open(stream_path) as f:
+            lines = f.readlines()
+        with open(stream_path, 'w') as f:
+            f.writelines(lines[:3])
+            f.write(lines[3][:20])
+
+        loaded = load_change_report(stream_path)
+        assert loaded.total_objects == 3
+        assert loaded.metrics is None
+        assert [entry.name for entry in loaded.changes['warehouse']] == ['LOADING']
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from snowflake_declarative.state.async_manager import AsyncSnowflakeState
+from snowflake_declarative.state.manager import SnowflakeState
+from snowflake_declarative.state.tracing import Tracer, open_exporter, span
+
+CONFIG = """\
+databases:
+  - name: ANALYTICS
+    data_retention_time_in_days: 1
+  - name: STAGING
+  - name: BROKEN
+warehouses:
+  - name: LOADING
+    size: SMALL
+"""
+
+EXISTING = {'ANALYTICS': {'kind': 'PERMANENT', 'data_retention_time_in_days': 7}}
+
+def read_spans(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+class TestTracing:
+    def test_spans_are_noops_outside_a_trace(self):
+        """
+        Test that hooks do nothing without an active trace.
+        """
+        with span('diff', object_type='database') as current:
+            current.set_attribute('differences', 1)
+
+    @pytest.mark.parametrize('engine,concurrency', [(SnowflakeState, 1), (SnowflakeState, 4),
+                                                    (AsyncSnowflakeState, 4)])
+    def test_apply_emits_linked_spans(self, engine, concurrency, config_path, fake_root, tmp_path):
+        """
+        Test that a run forms one trace whose spans link to their parents, across worker threads and tasks.
+        """
+        trace_path = str(tmp_path / 'trace.jsonl')
+        tracer = Tracer([open_exporter(trace_path)])
+        root = fake_root(EXISTING, fail_names=['BROKEN'])
+        engine(root, tracer=tracer).apply_configuration(config_path(CONFIG), dry_run=False, concurrency=concurrency)
+        tracer.close()
+
+        spans = read_spans(trace_path)
+        by_id = {s['span_id']: s for s in spans}
+        assert len({s['trace_id'] for s in spans}) == 1
+        assert all(s['parent_id'] in by_id for s in spans if s['name'] != 'apply')
+
+        def parent(s):
+            return by_id[s['parent_id']]['name']
+
+        processed = {s['attributes']['object_name']: s for s in spans if s['name'] == 'process'}
+        assert set(processed) == {'ANALYTICS', 'STAGING', 'BROKEN', 'LOADING'}
+        assert all(parent(s) == 'apply' for s in processed.values())
+        assert processed['ANALYTICS']['attributes']['change'] == 'UPDATED'
+
+        # The failed create marks the handler call, the create step and the object as errors
+        broken = [s for s in spans if s['attributes'].get('object_name') == 'BROKEN']
+        assert {s['name'] for s in broken if s['status']['code'] == 'ERROR'} >= {'process', 'create'}
+        handler_create = next(s for s in broken if s['name'].endswith('Handler.create'))
+        assert parent(handler_create) == 'create'
+        assert handler_create['status']['code'] == 'ERROR'
+
+        diff = next(s for s in spans if s['name'] == 'diff')
+        assert diff['attributes'] == {'object_type': 'database', 'object_name': 'ANALYTICS', 'differences': 1}
+        assert {s['attributes']['object_type'] for s in spans if s['name'] == 'fetch'} == {'database', 'warehouse'}
+        assert sum(s['name'] == 'load' for s in spans) == 4
+
+    def test_chrome_trace_events(self, config_path, fake_root, tmp_path):
+        """
+        Test that the Chrome exporter writes complete events with one named track per thread.
+        """
+        trace_path = str(tmp_path / 'trace.json')
+        tracer = Tracer([open_exporter(trace_path)])
+        root = fake_root(EXISTING, fail_names=['BROKEN'])
+        SnowflakeState(root, tracer=tracer).apply_configuration(config_path(CONFIG), dry_run=True, concurrency=4)
+        tracer.close()
+
+        with open(trace_path) as f:
+            events = json.load(f)
+        complete = [e for e in events if e['ph'] == 'X']
+        tracks = {e['tid'] for e in events if e['ph'] == 'M'}
+        assert {e['tid'] for e in complete} == tracks
+        assert complete[-1]['name'] == 'apply'
+        assert all(e['dur'] >= 0 for e in complete)
+
+    def test_unknown_format(self, tmp_path):
+        """
+        Test that an unsupported trace format is rejected.
+        """
+        with pytest.raises(ValueError):
+            open_exporter(str(tmp_path / 'trace.txt'), 'zipkin')